@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Measure import time of the API and engine modules.
+
+Each module is imported in a fresh interpreter with ``-X importtime``, so
+results reflect a cold process (health-only servers, CLI tools, workers).
+The check fails if an import pulls in a heavy ML/audio library or takes
+longer than the budget, so startup regressions show up before deployment.
+
+Usage:
+    python scripts/benchmark_imports.py
+    python scripts/benchmark_imports.py --budget 1.0 --repeats 5 --top 15
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that must import without loading any model libraries
+DEFAULT_MODULES = [
+    "src.api.main",
+    "src.orchestration.pipeline",
+    "src.asr",
+    "src.nmt",
+    "src.tts",
+    "src.utils",
+]
+
+# Libraries that should only be imported when an engine is constructed
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "faster_whisper",
+    "ctranslate2",
+    "TTS",
+    "librosa",
+    "pydub",
+    "scipy",
+    "soundfile",
+]
+
+
+def measure(module: str) -> tuple[float, list[str], list[tuple[int, str]]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        (wall seconds, heavy libraries loaded, [(cumulative us, module)] from -X importtime)
+    """
+    probe = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        timings.append((int(cumulative), name.strip()))
+
+    heavy = [name for name in result.stdout.strip().split(",") if name]
+    return elapsed, heavy, timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=DEFAULT_MODULES,
+        help="Modules to import (default: API, pipeline and engine packages)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Fresh interpreters per module; the median is reported",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="Fail if a module takes longer than this to import (seconds)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Slowest top-level imports to list per module",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeats)]
+        median = statistics.median(elapsed for elapsed, _, _ in runs)
+        _, heavy, timings = runs[-1]
+
+        print(f"{module}: {median * 1000:.0f} ms (median of {args.repeats})")
+        # Top-level packages only (nested imports are part of their parent's time)
+        top_level = sorted(
+            (timing for timing in timings if "." not in timing[1]),
+            reverse=True,
+        )[: args.top]
+        for cumulative, name in top_level:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+        if heavy:
+            failures.append(f"{module} imports {', '.join(heavy)}")
+        if median > args.budget:
+            failures.append(f"{module} takes {median:.2f}s (budget {args.budget:.2f}s)")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nAll imports within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Build ready-to-serve model bundles with checksummed manifests.
+
+Bundles are written to MODELS_DIR/bundles/<kind>/<model>, where the engines
+look for them before falling back to hub downloads:
+
+- whisper: CTranslate2 model already quantized to the serving precision
+  (no conversion at load time)
+- nllb: safetensors weights in the serving dtype, loaded through mmap
+- xtts: the Coqui checkpoint directory, pinned and checksummed
+
+Usage:
+    python scripts/build_model_bundles.py
+    python scripts/build_model_bundles.py --only whisper --whisper large-v3 small \\
+        --whisper-quantization int8
+    python scripts/build_model_bundles.py --verify
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+from src.nmt.vocab import VOCAB_MAP_FILE, PrunedVocabulary
+from src.utils.artifacts import bundle_path, verify_bundle, write_manifest
+from src.utils.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+KINDS = ["whisper", "nllb", "xtts"]
+
+
+def build_whisper(model_name: str, quantization: str, output: Path) -> None:
+    """Convert a Whisper checkpoint to a quantized CTranslate2 model."""
+    from ctranslate2.converters import TransformersConverter
+
+    source = model_name if "/" in model_name else f"openai/whisper-{model_name}"
+    logger.info(f"Converting {source} to CTranslate2 ({quantization})...")
+
+    converter = TransformersConverter(
+        source,
+        # faster-whisper reads the tokenizer and mel settings from the model directory
+        copy_files=["tokenizer.json", "preprocessor_config.json"],
+        load_as_float16=quantization in ("float16", "int8_float16"),
+    )
+    converter.convert(str(output), quantization=quantization, force=True)
+    write_manifest(output, "whisper", model_name, source, "ctranslate2", quantization)
+
+
+def build_nllb(model_name: str, dtype: str, output: Path) -> None:
+    """Save NLLB as safetensors in the serving dtype."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    logger.info(f"Saving {model_name} as safetensors ({dtype})...")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, torch_dtype=getattr(torch, dtype))
+    model.save_pretrained(output, safe_serialization=True)
+    tokenizer.save_pretrained(output)
+
+    # Pruned models carry their vocabulary mapping
+    if PrunedVocabulary.exists(model_name):
+        shutil.copy(Path(model_name) / VOCAB_MAP_FILE, output / VOCAB_MAP_FILE)
+
+    write_manifest(output, "nllb", model_name, model_name, "safetensors", dtype)
+
+
+def build_xtts(model_name: str, output: Path) -> None:
+    """Copy the downloaded Coqui checkpoint directory."""
+    from TTS.utils.manage import ModelManager
+
+    logger.info(f"Downloading {model_name}...")
+    model_path = Path(ModelManager().download_model(model_name)[0])
+    model_dir = model_path if model_path.is_dir() else model_path.parent
+
+    shutil.copytree(model_dir, output)
+    write_manifest(output, "xtts", model_name, model_name, "checkpoint")
+
+
+def main() -> None:
+    default_quantization = settings.WHISPER_COMPUTE_TYPE
+    if default_quantization in ("auto", "default"):
+        default_quantization = "int8_float16" if settings.WHISPER_DEVICE == "cuda" else "int8"
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        choices=KINDS,
+        default=KINDS,
+        help="Bundle kinds to build",
+    )
+    parser.add_argument(
+        "--whisper",
+        nargs="*",
+        default=[settings.WHISPER_MODEL],
+        help="Whisper sizes or hub IDs",
+    )
+    parser.add_argument(
+        "--whisper-quantization",
+        default=default_quantization,
+        help="CTranslate2 quantization stored in the Whisper bundles",
+    )
+    parser.add_argument(
+        "--nllb",
+        nargs="*",
+        default=[settings.NMT_MODEL],
+        help="NLLB hub IDs or (pruned) model directories",
+    )
+    parser.add_argument(
+        "--nllb-dtype",
+        choices=["float32", "float16", "bfloat16"],
+        default="float16" if settings.NMT_DEVICE == "cuda" else "float32",
+        help="Weight dtype stored in the NLLB bundles",
+    )
+    parser.add_argument(
+        "--xtts",
+        nargs="*",
+        default=[settings.TTS_MODEL],
+        help="Coqui model names",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild bundles that already exist",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Only check existing bundles against their manifests",
+    )
+    args = parser.parse_args()
+
+    models = {"whisper": args.whisper, "nllb": args.nllb, "xtts": args.xtts}
+    failures = 0
+
+    for kind in args.only:
+        for model_name in models[kind]:
+            output = bundle_path(kind, model_name)
+
+            if args.verify:
+                try:
+                    manifest = verify_bundle(output)
+                    logger.info(f"✅ {output} ({manifest.size_bytes / 1e9:.2f} GB)")
+                except (OSError, ValueError) as e:
+                    logger.error(f"❌ {output}: {e}")
+                    failures += 1
+                continue
+
+            if output.exists() and not args.force:
+                logger.info(f"Skipping {output} (exists, use --force to rebuild)")
+                continue
+
+            # Build next to the target and swap in, so a failed build never leaves
+            # a half-written bundle where the engines look
+            staging = output.with_name(output.name + ".partial")
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.parent.mkdir(parents=True, exist_ok=True)
+
+            if kind == "whisper":
+                build_whisper(model_name, args.whisper_quantization, staging)
+            elif kind == "nllb":
+                staging.mkdir()
+                build_nllb(model_name, args.nllb_dtype, staging)
+            else:
+                build_xtts(model_name, staging)
+
+            shutil.rmtree(output, ignore_errors=True)
+            staging.rename(output)
+            logger.info(f"✅ Built {output}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
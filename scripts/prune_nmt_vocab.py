@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Build an NLLB model with a vocabulary pruned to the deployed languages.
+
+Usage:
+    python scripts/prune_nmt_vocab.py --output models/nllb-pruned
+    python scripts/prune_nmt_vocab.py --output models/nllb-pruned \\
+        --languages eng_Latn spa_Latn --corpus eng_Latn=data/en.txt
+
+Point NMT_MODEL at the output directory to serve the pruned model.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+from src.nmt.nllb_engine import LANGUAGE_CODES, NLLBEngine
+from src.nmt.vocab import PrunedVocabulary, prune_model, select_tokens
+from src.utils.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SAMPLE_SENTENCES = [
+    "Hello, how are you today?",
+    "The meeting has been moved to Thursday afternoon.",
+    "Please send me the report before the end of the week.",
+    "I would like to book a table for four people at eight o'clock.",
+    "The new version fixes several bugs and improves performance by 20%.",
+]
+
+
+def parse_corpus(entries: list[str]) -> dict[str, list[str]]:
+    """Parse LANG=PATH corpus arguments into sentences per language."""
+    corpus: dict[str, list[str]] = {}
+    for entry in entries:
+        lang, _, path = entry.partition("=")
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+        corpus.setdefault(lang, []).extend(line for line in lines if line.strip())
+    return corpus
+
+
+def check_parity(
+    reference: NLLBEngine,
+    pruned: NLLBEngine,
+    languages: list[str],
+    corpus: dict[str, list[str]],
+) -> float:
+    """
+    Compare pruned and full model translations on a sample set.
+
+    English samples are translated into every target language; corpus
+    sentences are translated into English.
+
+    Returns:
+        Fraction of identical outputs
+    """
+    pairs = [
+        (text, "eng_Latn", lang)
+        for lang in languages
+        if lang != "eng_Latn"
+        for text in SAMPLE_SENTENCES
+    ]
+    pairs += [
+        (text, lang, "eng_Latn")
+        for lang, texts in corpus.items()
+        if lang != "eng_Latn"
+        for text in texts[:5]
+    ]
+
+    matches = 0
+    for text, source_lang, target_lang in pairs:
+        expected = reference.translate(text, source_lang, target_lang).text
+        actual = pruned.translate(text, source_lang, target_lang).text
+        if expected == actual:
+            matches += 1
+        else:
+            logger.warning(
+                f"Mismatch {source_lang}->{target_lang}: {expected!r} != {actual!r}"
+            )
+
+    return matches / len(pairs) if pairs else 1.0
+
+
+def main():
+    """Prune the NLLB vocabulary and save the reduced model."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=settings.NMT_MODEL, help="Full NLLB model")
+    parser.add_argument("--output", type=Path, required=True, help="Output directory")
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=list(LANGUAGE_CODES.values()),
+        help="NLLB language codes to keep (default: pipeline languages)",
+    )
+    parser.add_argument(
+        "--corpus",
+        nargs="*",
+        default=[],
+        metavar="LANG=PATH",
+        help="Sample text files whose tokens are always kept",
+    )
+    parser.add_argument(
+        "--skip-parity",
+        action="store_true",
+        help="Do not compare translations against the full model",
+    )
+    parser.add_argument(
+        "--min-parity",
+        type=float,
+        default=0.9,
+        help="Fail if fewer outputs than this match the full model",
+    )
+    args = parser.parse_args()
+
+    corpus = parse_corpus(args.corpus)
+
+    logger.info(f"Loading {args.model}...")
+    tokenizer = AutoTokenizer.from_pretrained(args.model)
+    model = AutoModelForSeq2SeqLM.from_pretrained(args.model)
+
+    kept_ids = select_tokens(
+        tokenizer,
+        args.languages,
+        corpus=[text for texts in corpus.values() for text in texts],
+    )
+    vocab = PrunedVocabulary(
+        kept_ids,
+        full_vocab_size=len(tokenizer),
+        unk_token_id=tokenizer.unk_token_id,
+        languages=args.languages,
+    )
+    logger.info(f"Keeping {len(vocab)} of {len(tokenizer)} tokens")
+
+    prune_model(model, vocab)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    model.save_pretrained(args.output)
+    tokenizer.save_pretrained(args.output)
+    vocab.save(args.output)
+    logger.info(f"✅ Pruned model saved to {args.output}")
+
+    if args.skip_parity:
+        return
+
+    logger.info("Checking translation parity...")
+    del model
+    reference = NLLBEngine(model_name=args.model, device="cpu", optimize=False)
+    pruned = NLLBEngine(model_name=str(args.output), device="cpu", optimize=False)
+    parity = check_parity(reference, pruned, args.languages, corpus)
+    logger.info(f"Parity: {parity:.1%} identical outputs")
+
+    if parity < args.min_parity:
+        logger.error(f"❌ Parity below {args.min_parity:.0%}")
+        sys.exit(1)
+
+    logger.info("✅ Parity check passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,7 +31,7 @@ async def test_pipeline():
 
     # Create request
     request = TranslationRequest(
-        audio=audio.tolist(),
+        audio=audio,
         sample_rate=sample_rate,
         source_lang="en",
         target_lang="es",
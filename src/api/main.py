@@ -1,18 +1,22 @@
 """FastAPI server for real-time translation API."""
 
+import asyncio
+import secrets
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Literal
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from ..orchestration.models import ModelInfo, SwapStatus
 from ..orchestration.pipeline import (
     TranslationPipeline,
     TranslationRequest,
     create_pipeline,
 )
+from ..utils.audio import StreamingAudioDecoder
 from ..utils.config import settings
 from ..utils.logging import get_logger
 
@@ -21,6 +25,9 @@ logger = get_logger(__name__)
 # Global pipeline instance
 pipeline: TranslationPipeline | None = None
 
+# Model swaps running in the background
+swap_tasks: set[asyncio.Task] = set()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -40,6 +47,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Cleanup
     logger.info("Shutting down")
+    for task in swap_tasks:
+        task.cancel()
+    if pipeline is not None:
+        await pipeline.close()
 
 
 # Create FastAPI app
@@ -67,6 +78,16 @@ class HealthResponse(BaseModel):
     version: str = Field(description="API version")
 
 
+class ModelSwapRequest(BaseModel):
+    """Admin request to switch a pipeline stage to another model."""
+
+    model: str = Field(description="Model name, e.g. 'large-v3-turbo' (same name reloads it)")
+    keep_previous: bool = Field(
+        default=False,
+        description="Keep the replaced model selectable as a variant",
+    )
+
+
 class LanguageInfo(BaseModel):
     """Language information."""
 
@@ -107,6 +128,76 @@ async def get_languages() -> dict[str, list[str]]:
     }
 
 
+@app.get("/models", response_model=list[ModelInfo])
+async def get_models() -> list[ModelInfo]:
+    """Registered models and whether they are loaded, in use, and how much memory they take."""
+    if pipeline is None:
+        raise HTTPException(status_code=503, detail="Pipeline not initialized")
+
+    return pipeline.models.status()
+
+
+def require_admin(token: str | None) -> None:
+    """Reject admin calls without the configured token."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Admin API disabled")
+    if token is None or not secrets.compare_digest(token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.post("/admin/models/{kind}", response_model=SwapStatus, status_code=202)
+async def swap_model(
+    kind: Literal["asr", "nmt", "tts"],
+    request: ModelSwapRequest,
+    x_admin_token: str | None = Header(default=None),
+) -> SwapStatus:
+    """
+    Switch a stage to another model without a restart.
+    
+    The new model loads and warms up in the background while the current
+    one keeps serving. New requests and sessions then use it, while running
+    ones finish on the old model, which is unloaded when they are done.
+    Progress is reported by GET /admin/models/swaps.
+    
+    Args:
+        kind: Pipeline stage ('asr', 'nmt' or 'tts')
+        request: Model to switch to
+        x_admin_token: Must match settings.ADMIN_TOKEN
+        
+    Returns:
+        Status of the swap just started
+    """
+    global pipeline
+    require_admin(x_admin_token)
+
+    if pipeline is None:
+        pipeline = create_pipeline()
+
+    task = asyncio.create_task(
+        pipeline.swap_model(kind, request.model, keep_previous=request.keep_previous)
+    )
+    swap_tasks.add(task)
+    task.add_done_callback(swap_tasks.discard)
+
+    # Let the swap register (or be refused because one is already running)
+    await asyncio.sleep(0)
+    if task.done() and task.exception() is not None:
+        raise HTTPException(status_code=409, detail=str(task.exception()))
+
+    logger.info("Model swap started", kind=kind, model=request.model)
+    return next(status for status in pipeline.models.swaps() if status.kind == kind)
+
+
+@app.get("/admin/models/swaps", response_model=list[SwapStatus])
+async def get_swaps(x_admin_token: str | None = Header(default=None)) -> list[SwapStatus]:
+    """Latest model swap of each stage."""
+    require_admin(x_admin_token)
+
+    if pipeline is None:
+        return []
+    return pipeline.models.swaps()
+
+
 @app.post("/translate")
 async def translate(request: TranslationRequest) -> dict:
     """
@@ -140,7 +231,8 @@ async def translate(request: TranslationRequest) -> dict:
             latency_ms=response.latency_ms,
         )
 
-        return response.model_dump()
+        # Audio arrays become JSON lists only here, at the API edge
+        return response.model_dump(mode="json")
 
     except Exception as e:
         logger.error("Translation failed", error=str(e), exc_info=True)
@@ -150,6 +242,68 @@ async def translate(request: TranslationRequest) -> dict:
         )
 
 
+@app.post("/translate/stream")
+async def translate_stream(
+    request: Request,
+    source_lang: str = "en",
+    target_lang: str = "es",
+    format: str | None = None,
+    output_audio: bool = True,
+    output_sample_rate: int | None = None,
+    asr_model: str | None = None,
+    nmt_model: str | None = None,
+    tts_model: str | None = None,
+) -> StreamingResponse:
+    """
+    Translate a compressed audio upload while it is still arriving.
+    
+    The request body is the encoded file (mp3, ogg, webm, wav, ...). It is
+    decoded block by block as it is received, so recognition starts before
+    the upload completes and memory does not grow with the file size.
+    
+    Args:
+        request: HTTP request carrying the encoded audio as its body
+        source_lang: Source language code
+        target_lang: Target language code
+        format: ffmpeg demuxer name, or None to probe the stream
+        output_audio: Synthesize translated speech (False = captions only)
+        output_sample_rate: Rate for the synthesized audio (TTS native rate if None)
+        asr_model: Whisper model (default if None)
+        nmt_model: NMT model (default if None)
+        tts_model: TTS model (default if None)
+        
+    Returns:
+        Newline-delimited JSON, one translation response per segment
+    """
+    global pipeline
+
+    if pipeline is None:
+        logger.info("First translation request - initializing pipeline...")
+        pipeline = create_pipeline()
+        logger.info("Pipeline initialized successfully")
+
+    decoder = StreamingAudioDecoder(
+        block_ms=settings.AUDIO_DECODE_BLOCK_MS,
+        input_format=format,
+    )
+
+    async def responses() -> AsyncGenerator[str, None]:
+        async for response in pipeline.translate_streaming(
+            decoder.decode(request.stream()),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            sample_rate=decoder.sample_rate,
+            output_audio=output_audio,
+            output_sample_rate=output_sample_rate,
+            asr_model=asr_model,
+            nmt_model=nmt_model,
+            tts_model=tts_model,
+        ):
+            yield response.model_dump_json() + "\n"
+
+    return StreamingResponse(responses(), media_type="application/x-ndjson")
+
+
 @app.websocket("/ws/translate")
 async def websocket_translate(websocket: WebSocket) -> None:
     """
@@ -182,11 +336,23 @@ async def websocket_translate(websocket: WebSocket) -> None:
         source_lang = config.get("source_lang", "en")
         target_lang = config.get("target_lang", "es")
         sample_rate = config.get("sample_rate", 16000)
+        decoding_profile = config.get("decoding_profile")
+        output_audio = config.get("output_audio", True)
+        output_sample_rate = config.get("output_sample_rate")
+        sample_format = config.get("sample_format", "f32le")  # Raw PCM: 'f32le' or 's16le'
+        # Compressed input (e.g. "webm", "ogg"); raw float32 PCM if unset
+        input_format = config.get("format")
+        # Model variants (server defaults if unset)
+        asr_model = config.get("asr_model")
+        nmt_model = config.get("nmt_model")
+        tts_model = config.get("tts_model")
 
         logger.info(
             "WebSocket config",
             source_lang=source_lang,
             target_lang=target_lang,
+            decoding_profile=decoding_profile,
+            format=input_format,
         )
 
         # Create async generator from WebSocket
@@ -198,14 +364,31 @@ async def websocket_translate(websocket: WebSocket) -> None:
                 except WebSocketDisconnect:
                     break
 
+        audio_chunks = audio_generator()
+        if input_format:
+            # Decode as bytes arrive; ffmpeg emits 16kHz PCM blocks
+            decoder = StreamingAudioDecoder(
+                block_ms=settings.AUDIO_DECODE_BLOCK_MS,
+                input_format=input_format,
+            )
+            audio_chunks = decoder.decode(audio_chunks)
+            sample_rate = decoder.sample_rate
+
         # Stream translations
         async for response in pipeline.translate_streaming(
-            audio_generator(),
+            audio_chunks,
             source_lang=source_lang,
             target_lang=target_lang,
             sample_rate=sample_rate,
+            decoding_profile=decoding_profile,
+            output_audio=output_audio,
+            output_sample_rate=output_sample_rate,
+            sample_format=sample_format,
+            asr_model=asr_model,
+            nmt_model=nmt_model,
+            tts_model=tts_model,
         ):
-            await websocket.send_json(response.model_dump())
+            await websocket.send_json(response.model_dump(mode="json"))
 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected")
@@ -1,5 +1,19 @@
 """ASR (Automatic Speech Recognition) module."""
 
-from .whisper_engine import WhisperEngine, create_asr_engine
+from .features import IncrementalLogMel
+from .language_id import SessionLanguageDetector
+from .longform import LongFormTranscriber
+from .pool import WhisperEnginePool
+from .vad import EnergyVAD
+from .whisper_engine import StreamingASR, WhisperEngine, create_asr_engine
 
-__all__ = ["WhisperEngine", "create_asr_engine"]
+__all__ = [
+    "WhisperEngine",
+    "WhisperEnginePool",
+    "StreamingASR",
+    "LongFormTranscriber",
+    "SessionLanguageDetector",
+    "EnergyVAD",
+    "IncrementalLogMel",
+    "create_asr_engine",
+]
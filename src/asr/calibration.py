@@ -0,0 +1,273 @@
+"""Startup calibration of Whisper device, precision and model size."""
+
+import gc
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..utils.audio import load_audio
+from ..utils.config import settings
+from ..utils.decoding import resolve_decoding
+from ..utils.logging import get_logger
+from .whisper_engine import WhisperEngine
+
+logger = get_logger(__name__)
+
+CALIBRATION_FILE = "asr_calibration.json"
+
+# Candidate precisions per device, roughly fastest first
+COMPUTE_TYPES = {
+    "cpu": ["int8", "int8_float32", "float32"],
+    "cuda": ["int8_float16", "float16", "int8", "float32"],
+}
+
+# Tokens decoded for the synthetic workload (about 30 s of speech)
+REFERENCE_TOKENS = 100
+
+
+class CalibrationResult(BaseModel):
+    """Chosen ASR configuration and the measurements behind it."""
+
+    model_name: str
+    device: str
+    compute_type: str
+    rtf: float  # Processing time / audio duration of the chosen configuration
+    target_rtf: float
+    meets_target: bool
+    hardware: dict[str, Any]
+    constraints: dict[str, Optional[str]]
+    measurements: list[dict[str, Any]] = Field(default_factory=list)
+    created_at: str
+
+
+def detect_hardware() -> dict[str, Any]:
+    """
+    Describe the host as seen by CTranslate2.
+
+    Returns:
+        Hardware fingerprint (device, GPU count, CPU model and count)
+    """
+    import ctranslate2
+
+    gpu_count = ctranslate2.get_cuda_device_count()
+    return {
+        "device": "cuda" if gpu_count > 0 else "cpu",
+        "gpu_count": gpu_count,
+        "cpu": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def measure_rtf(
+    engine: WhisperEngine,
+    clip: Optional[np.ndarray] = None,
+    repeats: int = 2,
+) -> float:
+    """
+    Measure the real-time factor of an engine.
+
+    With a reference clip the full transcription path is timed. Without one
+    a synthetic workload is used: one 30 s encoder pass plus
+    ``REFERENCE_TOKENS`` forced decoder steps, which matches the cost of a
+    window of speech without needing speech audio.
+
+    Args:
+        engine: Loaded engine to measure
+        clip: Reference speech (16kHz, mono), or None for the synthetic workload
+        repeats: Timed runs after one warm-up; the best is kept
+
+    Returns:
+        Processing time divided by audio duration (lower is faster)
+    """
+    from faster_whisper.tokenizer import Tokenizer
+
+    beam_size = resolve_decoding().beam_size
+
+    if clip is not None:
+        duration = len(clip) / 16000
+
+        def run() -> None:
+            engine._run_transcribe(clip, beam_size=beam_size)
+
+    else:
+        duration = engine.model.feature_extractor.n_samples / 16000
+        window = np.zeros(engine.model.feature_extractor.n_samples, dtype=np.float32)
+        tokenizer = Tokenizer(
+            engine.model.hf_tokenizer,
+            engine.model.model.is_multilingual,
+            task="transcribe",
+            language="en",
+        )
+        prompt = engine.model.get_prompt(tokenizer, [], without_timestamps=True)
+
+        def run() -> None:
+            encoder_output = engine.model.encode(engine._window_features([window]))
+            engine.model.model.generate(
+                encoder_output,
+                [prompt],
+                beam_size=beam_size,
+                max_length=len(prompt) + REFERENCE_TOKENS,
+                suppress_tokens=[tokenizer.eot],  # Decode every step
+            )
+
+    run()  # Warm-up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) / duration
+
+
+def calibrate(
+    model_name: Optional[str] = None,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    target_rtf: float = settings.ASR_CALIBRATION_RTF,
+    clip_path: Optional[Path] = settings.ASR_CALIBRATION_CLIP,
+    cache_path: Path = settings.CACHE_DIR / CALIBRATION_FILE,
+) -> CalibrationResult:
+    """
+    Pick the ASR configuration for this host.
+
+    Models are tried from largest to smallest (settings.ASR_CALIBRATION_MODELS)
+    and the first model with a precision meeting ``target_rtf`` wins, with
+    its fastest such precision. If nothing meets the target, the fastest
+    configuration measured is used. The decision is written to
+    ``cache_path`` and reused while hardware, constraints and target match.
+
+    Args:
+        model_name: Fixed model, or None to search
+        device: Fixed device, or None to detect
+        compute_type: Fixed precision, or None to search
+        target_rtf: Required real-time factor
+        clip_path: Reference speech clip, or None for the synthetic workload
+        cache_path: Where the decision is recorded
+
+    Returns:
+        CalibrationResult
+    """
+    hardware = detect_hardware()
+    constraints = {"model_name": model_name, "device": device, "compute_type": compute_type}
+
+    cached = _load_cached(cache_path, hardware, constraints, target_rtf)
+    if cached is not None:
+        logger.info(
+            "Using recorded ASR calibration",
+            model=cached.model_name,
+            device=cached.device,
+            compute_type=cached.compute_type,
+            rtf=cached.rtf,
+        )
+        return cached
+
+    import ctranslate2
+
+    device = device or hardware["device"]
+    supported = ctranslate2.get_supported_compute_types(device)
+    if compute_type:
+        compute_types = [compute_type]
+    else:
+        compute_types = [
+            candidate for candidate in COMPUTE_TYPES[device] if candidate in supported
+        ]
+    model_names = [model_name] if model_name else settings.ASR_CALIBRATION_MODELS
+    clip = load_audio(clip_path) if clip_path else None
+
+    measurements = []
+    chosen: Optional[dict[str, Any]] = None
+    for candidate_model in model_names:
+        for candidate_type in compute_types:
+            engine = WhisperEngine(
+                model_name=candidate_model,
+                device=device,
+                compute_type=candidate_type,
+                download_root=settings.MODELS_DIR / "whisper",
+                vad_gate=False,
+            )
+            rtf = measure_rtf(engine, clip)
+            del engine
+            gc.collect()
+
+            measurement = {
+                "model_name": candidate_model,
+                "compute_type": candidate_type,
+                "rtf": rtf,
+            }
+            measurements.append(measurement)
+            logger.info("ASR calibration run", **measurement)
+
+        passing = [
+            measurement
+            for measurement in measurements
+            if measurement["model_name"] == candidate_model and measurement["rtf"] <= target_rtf
+        ]
+        if passing:
+            chosen = min(passing, key=lambda measurement: measurement["rtf"])
+            break
+
+    meets_target = chosen is not None
+    if chosen is None:
+        chosen = min(measurements, key=lambda measurement: measurement["rtf"])
+        logger.warning(
+            "No ASR configuration meets the real-time target, using the fastest",
+            target_rtf=target_rtf,
+            **chosen,
+        )
+
+    result = CalibrationResult(
+        model_name=chosen["model_name"],
+        device=device,
+        compute_type=chosen["compute_type"],
+        rtf=chosen["rtf"],
+        target_rtf=target_rtf,
+        meets_target=meets_target,
+        hardware=hardware,
+        constraints=constraints,
+        measurements=measurements,
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+    cache_path.write_text(result.model_dump_json(indent=2))
+    logger.info(
+        "ASR calibration complete",
+        model=result.model_name,
+        device=result.device,
+        compute_type=result.compute_type,
+        rtf=result.rtf,
+        recorded_to=str(cache_path),
+    )
+    return result
+
+
+def _load_cached(
+    cache_path: Path,
+    hardware: dict[str, Any],
+    constraints: dict[str, Optional[str]],
+    target_rtf: float,
+) -> Optional[CalibrationResult]:
+    """Return the recorded decision if it was made under the same conditions."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        cached = CalibrationResult(**json.loads(cache_path.read_text()))
+    except (ValueError, TypeError):
+        logger.warning("Ignoring unreadable ASR calibration", path=str(cache_path))
+        return None
+
+    if (
+        cached.hardware != hardware
+        or cached.constraints != constraints
+        or cached.target_rtf != target_rtf
+    ):
+        return None
+    return cached
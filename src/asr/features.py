@@ -0,0 +1,99 @@
+"""Incremental log-mel feature extraction for streaming ASR."""
+
+from typing import Any
+
+import numpy as np
+
+
+class IncrementalLogMel:
+    """
+    Whisper log-mel front-end that only processes newly arrived samples.
+
+    Mel frames are computed once per hop as audio arrives and kept in a
+    buffer aligned with the caller's audio buffer (frame ``i`` is
+    centred on sample ``i * hop_length``). The window-level clamp and
+    scaling Whisper applies (``max - 8`` dB floor, ``(x + 4) / 4``) are
+    cheap and done in ``features()``, so the result matches a full
+    recomputation except for the zero padding used for the very first frame.
+    """
+
+    def __init__(self, feature_extractor: Any):
+        """
+        Initialize extractor.
+
+        Args:
+            feature_extractor: faster-whisper FeatureExtractor (for STFT/mel parameters)
+        """
+        self.n_fft = feature_extractor.n_fft
+        self.hop_length = feature_extractor.hop_length
+        self.mel_filters = np.asarray(feature_extractor.mel_filters, dtype=np.float32)
+
+        # Periodic Hann window, as in Whisper's STFT
+        self.window = np.hanning(self.n_fft + 1)[:-1].astype(np.float32)
+
+        self.reset()
+
+    @property
+    def num_frames(self) -> int:
+        """Frames currently buffered."""
+        return self._frames.shape[1]
+
+    def append(self, audio: np.ndarray) -> None:
+        """
+        Compute mel frames for new samples.
+
+        Args:
+            audio: New audio contiguous with everything appended so far (16kHz, mono)
+        """
+        signal = np.concatenate([self._tail, audio.astype(np.float32, copy=False)])
+        n_new = (len(signal) - self.n_fft) // self.hop_length + 1
+        if n_new <= 0:
+            self._tail = signal
+            return
+
+        # Strided view of all complete frames, windowed and transformed in one pass
+        frames = np.lib.stride_tricks.sliding_window_view(signal, self.n_fft)[
+            :: self.hop_length
+        ][:n_new]
+        spectrum = np.fft.rfft(frames * self.window, axis=1)
+        power = spectrum.real**2 + spectrum.imag**2
+        log_mel = np.log10(np.maximum(self.mel_filters @ power.T.astype(np.float32), 1e-10))
+
+        self._tail = signal[n_new * self.hop_length :]
+
+        if self._discard:
+            skipped = min(self._discard, log_mel.shape[1])
+            log_mel = log_mel[:, skipped:]
+            self._discard -= skipped
+
+        self._frames = np.concatenate([self._frames, log_mel], axis=1)
+
+    def drop(self, n_frames: int) -> None:
+        """
+        Forget the oldest frames (after the audio buffer was trimmed).
+
+        Args:
+            n_frames: Frames to remove; frames not computed yet are skipped on arrival
+        """
+        available = min(n_frames, self.num_frames)
+        self._frames = self._frames[:, available:]
+        self._discard += n_frames - available
+
+    def features(self) -> np.ndarray:
+        """
+        Normalized features of the buffered frames.
+
+        Returns:
+            Array of shape (n_mels, num_frames), ready for the Whisper encoder
+        """
+        if self.num_frames == 0:
+            return self._frames.copy()
+        log_mel = np.maximum(self._frames, self._frames.max() - 8.0)
+        return (log_mel + 4.0) / 4.0
+
+    def reset(self) -> None:
+        """Start a new buffer; the next sample appended becomes frame 0's centre."""
+        # Stand-in for the centre padding before the first frame
+        self._tail = np.zeros(self.n_fft // 2, dtype=np.float32)
+        self._frames = np.empty((self.mel_filters.shape[0], 0), dtype=np.float32)
+        self._discard = 0
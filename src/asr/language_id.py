@@ -0,0 +1,118 @@
+"""Per-session language identification with caching and drift detection."""
+
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from ..utils.config import settings
+from ..utils.logging import get_logger
+from .whisper_engine import TranscriptionResult, WhisperEngine
+
+if TYPE_CHECKING:
+    from .pool import WhisperEnginePool
+
+logger = get_logger(__name__)
+
+
+class SessionLanguageDetector:
+    """
+    Caches the detected language of a streaming session.
+
+    Detection runs on the fast encoder-only path until a language is seen
+    with enough confidence (or twice in a row), after which it is locked and
+    passed to ASR explicitly, so Whisper does not detect it again on every
+    chunk. The lock is released only on drift: several consecutive
+    transcriptions with low confidence.
+    """
+
+    def __init__(
+        self,
+        engine: "WhisperEngine | WhisperEnginePool",
+        confidence_threshold: float = settings.LANGUAGE_ID_THRESHOLD,
+        drift_confidence: float = settings.LANGUAGE_ID_DRIFT_CONFIDENCE,
+        drift_patience: int = settings.LANGUAGE_ID_DRIFT_PATIENCE,
+        min_audio_s: float = 1.0,
+    ):
+        """
+        Initialize session language detector.
+
+        Args:
+            engine: Whisper engine or replica pool used for detection
+            confidence_threshold: Detection probability that locks the language
+            drift_confidence: ASR confidence below which a decode counts as drift
+            drift_patience: Consecutive drifting decodes before re-detection
+            min_audio_s: Minimum audio required to attempt detection
+        """
+        self.engine = engine
+        self.confidence_threshold = confidence_threshold
+        self.drift_confidence = drift_confidence
+        self.drift_patience = drift_patience
+        self.min_audio_s = min_audio_s
+
+        self.reset()
+
+    @property
+    def locked(self) -> bool:
+        """Whether the session language is settled."""
+        return self._locked
+
+    async def resolve(self, audio: np.ndarray) -> Optional[str]:
+        """
+        Return the session language, detecting it if not yet locked.
+
+        Args:
+            audio: Current audio window (16kHz, mono)
+
+        Returns:
+            Language code, or None if there is not enough audio yet
+        """
+        if self._locked or len(audio) < int(self.min_audio_s * 16000):
+            return self.language
+
+        language, probability = await self.engine.detect_language_async(audio)
+        self.detections += 1
+
+        if probability >= self.confidence_threshold or language == self.language:
+            self._locked = True
+            logger.info(
+                "Session language locked",
+                language=language,
+                probability=probability,
+                detections=self.detections,
+            )
+
+        self.language = language
+        self.confidence = probability
+        return language
+
+    def observe(self, result: TranscriptionResult) -> None:
+        """
+        Track ASR confidence to detect a language change.
+
+        Args:
+            result: Transcription decoded with the session language
+        """
+        if not self._locked or not result.text:
+            return
+
+        if result.confidence < self.drift_confidence:
+            self._low_confidence_run += 1
+        else:
+            self._low_confidence_run = 0
+
+        if self._low_confidence_run >= self.drift_patience:
+            logger.info(
+                "Language drift suspected, re-detecting",
+                language=self.language,
+                confidence=result.confidence,
+            )
+            self._locked = False
+            self._low_confidence_run = 0
+
+    def reset(self) -> None:
+        """Forget the cached language."""
+        self.language: Optional[str] = None
+        self.confidence = 0.0
+        self.detections = 0
+        self._locked = False
+        self._low_confidence_run = 0
@@ -0,0 +1,299 @@
+"""Long-form transcription: silence-aligned chunks decoded in parallel."""
+
+import asyncio
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import numpy as np
+
+from ..utils.audio import AudioFile, silence_ranges
+from ..utils.config import settings
+from ..utils.decoding import DecodingProfile
+from ..utils.logging import get_logger
+from .whisper_engine import TranscriptionResult, WhisperEngine, _normalize_word
+
+if TYPE_CHECKING:
+    from .pool import WhisperEnginePool
+
+logger = get_logger(__name__)
+
+
+class LongFormTranscriber:
+    """
+    Transcribes recordings longer than one Whisper window.
+
+    The audio is cut into chunks of at most ``max_chunk_s`` at the middle of
+    the latest silence that fits, so chunks can be decoded independently and
+    concurrently (spread over the replicas of a pool). Only where no silence
+    is found is a hard cut made; those chunks overlap by ``overlap_s`` and are
+    decoded with word timestamps, and each side keeps the words on its half
+    of the overlap.
+    """
+
+    def __init__(
+        self,
+        engine: "WhisperEngine | WhisperEnginePool",
+        max_chunk_s: float = settings.ASR_LONGFORM_CHUNK_S,
+        overlap_s: float = settings.ASR_LONGFORM_OVERLAP_S,
+        min_silence_ms: int = 300,
+        silence_thresh: float = -40.0,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize long-form transcriber.
+
+        Args:
+            engine: Whisper engine or replica pool
+            max_chunk_s: Maximum chunk length (seconds)
+            overlap_s: Overlap at hard cuts (seconds)
+            min_silence_ms: Minimum silence that can be cut at (ms)
+            silence_thresh: Silence threshold (dB)
+            concurrency: Chunks in flight (defaults to the engine's worker count)
+        """
+        if overlap_s >= max_chunk_s:
+            raise ValueError("overlap_s must be shorter than max_chunk_s")
+
+        self.engine = engine
+        self.max_chunk_s = max_chunk_s
+        self.overlap_s = overlap_s
+        self.min_silence_ms = min_silence_ms
+        self.silence_thresh = silence_thresh
+        self.concurrency = concurrency or engine.num_workers
+
+    def plan_chunks(self, audio: "np.ndarray | AudioFile") -> list[tuple[int, int]]:
+        """
+        Choose chunk boundaries.
+
+        Args:
+            audio: Audio waveform or file (16kHz, mono)
+
+        Returns:
+            [start, end) sample ranges; consecutive ranges overlap only at hard cuts
+        """
+        return [(start, end) for start, end, _ in self._iter_chunks(audio)]
+
+    def _iter_chunks(self, audio: "np.ndarray | AudioFile") -> Iterator[tuple[int, int, bool]]:
+        """
+        Plan chunks one cut at a time.
+
+        Yields:
+            (start, end, hard_cut) of each chunk in order
+        """
+        start = 0
+        while True:
+            end, hard_cut = self._next_cut(audio, start)
+            yield start, end, hard_cut
+            if end == len(audio):
+                return
+            start = end - int(self.overlap_s * 16000) if hard_cut else end
+
+    def _next_cut(self, audio: "np.ndarray | AudioFile", start: int) -> tuple[int, bool]:
+        """
+        End of the chunk starting at ``start``: the middle of the latest silence
+        within ``max_chunk_s``, else a hard cut there.
+
+        Only that stretch of audio is read, so planning a file never loads it whole.
+
+        Returns:
+            (end, hard_cut)
+        """
+        limit = start + int(self.max_chunk_s * 16000)
+        if limit >= len(audio):
+            return len(audio), False
+
+        silences = silence_ranges(
+            audio[start:limit],
+            min_silence_len=self.min_silence_ms,
+            silence_thresh=self.silence_thresh,
+        )
+        # A silence at the very start is the rest of the one the previous chunk was cut in
+        silences = silences[silences[:, 0] > 0]
+        cut_points = start + silences.sum(axis=1) // 2
+        if len(cut_points):
+            return int(cut_points[-1]), False
+        return limit, True
+
+    async def transcribe(
+        self,
+        audio: "np.ndarray | AudioFile",
+        source_language: Optional[str] = None,
+        task: str = "transcribe",
+        decoding: DecodingProfile | str | None = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe long audio.
+
+        Args:
+            audio: Audio waveform or file (16kHz, mono); a file is read chunk
+                by chunk, so memory stays bounded whatever its length
+            source_language: Source language code. Auto-detect per chunk if None
+            task: 'transcribe' or 'translate' (to English)
+            decoding: Decoding profile
+
+        Returns:
+            One TranscriptionResult with stream-time segments
+        """
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(start: int, end: int, word_timestamps: bool) -> TranscriptionResult:
+            async with semaphore:
+                if isinstance(audio, np.ndarray):
+                    chunk = audio[start:end]
+                else:
+                    # Read (and resample) the chunk only when a slot frees up
+                    chunk = await loop.run_in_executor(None, audio.__getitem__, slice(start, end))
+                return await self.engine.transcribe(
+                    chunk,
+                    source_language=source_language,
+                    task=task,
+                    decoding=decoding,
+                    word_timestamps=word_timestamps,
+                )
+
+        # Chunks are dispatched as they are planned, so decoding starts right away
+        chunks: list[tuple[int, int]] = []
+        overlapped: list[bool] = []
+        tasks = []
+        planned = self._iter_chunks(audio)
+        while True:
+            # Each cut reads audio, so it is planned off the event loop
+            chunk = await loop.run_in_executor(None, next, planned, None)
+            if chunk is None:
+                break
+            start, end, hard_cut = chunk
+            follows_cut = bool(overlapped) and overlapped[-1]
+            chunks.append((start, end))
+            overlapped.append(hard_cut)
+            # Words are needed to split the overlap at hard cuts
+            tasks.append(asyncio.create_task(run(start, end, hard_cut or follows_cut)))
+
+        results = await asyncio.gather(*tasks)
+
+        segments = self._stitch(chunks, overlapped, results)
+        spoken = [
+            (result, end - start)
+            for (start, end), result in zip(chunks, results, strict=True)
+            if result.text
+        ]
+
+        language = source_language or ""
+        confidence = 0.0
+        metadata = dict(results[0].metadata)
+        if spoken:
+            languages: Counter = Counter()
+            for result, length in spoken:
+                languages[result.language] += length
+            language = source_language or languages.most_common(1)[0][0]
+            confidence = float(
+                np.average(
+                    [result.confidence for result, _ in spoken],
+                    weights=[length for _, length in spoken],
+                )
+            )
+            metadata = dict(spoken[0][0].metadata)
+        metadata.pop("vad", None)
+        metadata.update(
+            chunks=len(chunks),
+            hard_cuts=sum(overlapped),
+            silent_chunks=len(chunks) - len(spoken),
+        )
+
+        result = TranscriptionResult(
+            text=" ".join(segment["text"].strip() for segment in segments),
+            language=language,
+            confidence=min(confidence, 1.0),
+            segments=segments,
+            processing_time_ms=(time.time() - start_time) * 1000,
+            metadata=metadata,
+        )
+
+        logger.info(
+            "Long-form transcription complete",
+            duration_s=len(audio) / 16000,
+            chunks=len(chunks),
+            hard_cuts=sum(overlapped),
+            processing_time_ms=result.processing_time_ms,
+        )
+        return result
+
+    @staticmethod
+    def _stitch(
+        chunks: list[tuple[int, int]],
+        overlapped: list[bool],
+        results: list[TranscriptionResult],
+    ) -> list[dict]:
+        """
+        Merge chunk segments into stream time, resolving hard-cut overlaps.
+
+        Args:
+            chunks: Sample ranges of the chunks
+            overlapped: Whether each chunk overlaps the next one
+            results: Transcription of each chunk
+
+        Returns:
+            Segment dicts with stream-time start and end
+        """
+        segments: list[dict] = []
+
+        for index, ((start, end), result) in enumerate(zip(chunks, results, strict=True)):
+            offset = start / 16000
+            follows_cut = index > 0 and overlapped[index - 1]
+
+            # Each side of an overlap keeps what lies on its half
+            low = (start + chunks[index - 1][1]) / 32000 if follows_cut else -np.inf
+            high = (chunks[index + 1][0] + end) / 32000 if overlapped[index] else np.inf
+
+            # Last word before the cut, to catch a word kept by both sides
+            previous_word = None
+            if follows_cut and segments and segments[-1].get("words"):
+                previous_word = segments[-1]["words"][-1]
+
+            for segment in result.segments:
+                shifted = {
+                    **segment,
+                    "start": segment["start"] + offset,
+                    "end": segment["end"] + offset,
+                }
+
+                if np.isinf(low) and np.isinf(high):
+                    segments.append(shifted)
+                    continue
+
+                if not segment.get("words"):
+                    center = (shifted["start"] + shifted["end"]) / 2
+                    if low <= center < high:
+                        segments.append(shifted)
+                    continue
+
+                words = []
+                for word in segment["words"]:
+                    word = {
+                        **word,
+                        "start": word["start"] + offset,
+                        "end": word["end"] + offset,
+                    }
+                    if not low <= (word["start"] + word["end"]) / 2 < high:
+                        continue
+                    if (
+                        previous_word is not None
+                        and _normalize_word(word["word"]) == _normalize_word(previous_word["word"])
+                        and word["start"] - previous_word["end"] < 0.5
+                    ):
+                        previous_word = None
+                        continue
+                    previous_word = None
+                    words.append(word)
+
+                if words:
+                    shifted.update(
+                        start=words[0]["start"],
+                        end=words[-1]["end"],
+                        text="".join(word["word"] for word in words),
+                        words=words,
+                    )
+                    segments.append(shifted)
+
+        return segments
@@ -0,0 +1,159 @@
+"""Pool of Whisper replicas with least-loaded dispatch."""
+
+import itertools
+from typing import AsyncIterator, Optional
+
+import numpy as np
+
+from ..utils.config import settings
+from ..utils.decoding import DecodingProfile
+from ..utils.logging import get_logger
+from .whisper_engine import StreamingASR, TranscriptionResult, WhisperEngine
+
+logger = get_logger(__name__)
+
+
+class WhisperEnginePool:
+    """
+    Several WhisperEngine replicas behind the WhisperEngine interface.
+
+    Each call goes to the replica with the fewest in-flight requests, ties
+    broken round-robin. Streaming sessions dispatch per decode, so concurrent
+    streams spread over all replicas. Throughput scales with
+    replicas x workers per replica, each worker using ``cpu_threads`` threads;
+    on GPU the replicas are spread over the visible devices.
+    """
+
+    def __init__(self, engines: list[WhisperEngine]):
+        """
+        Initialize pool.
+
+        Args:
+            engines: Loaded replicas (at least one)
+        """
+        if not engines:
+            raise ValueError("WhisperEnginePool needs at least one engine")
+
+        self.engines = engines
+        self._order = itertools.cycle(range(len(engines)))
+
+    @classmethod
+    def create(cls, size: int, device: str = "cuda", **engine_kwargs) -> "WhisperEnginePool":
+        """
+        Load ``size`` identical replicas.
+
+        Args:
+            size: Number of replicas
+            device: Device to run on (cuda, cpu)
+            **engine_kwargs: Options forwarded to WhisperEngine
+
+        Returns:
+            Initialized WhisperEnginePool
+        """
+        import ctranslate2
+
+        gpu_count = ctranslate2.get_cuda_device_count() if device == "cuda" else 0
+
+        engines = []
+        for i in range(size):
+            engines.append(
+                WhisperEngine(
+                    device=device,
+                    device_index=i % gpu_count if gpu_count else 0,
+                    **engine_kwargs,
+                )
+            )
+
+        logger.info("Whisper pool ready", replicas=size, gpus=gpu_count)
+        return cls(engines)
+
+    @property
+    def model(self):
+        """Model of the first replica (for read-only access to model internals)."""
+        return self.engines[0].model
+
+    @property
+    def model_name(self) -> str:
+        """Model name shared by all replicas."""
+        return self.engines[0].model_name
+
+    @property
+    def num_workers(self) -> int:
+        """Concurrent transcriptions across all replicas."""
+        return sum(engine.num_workers for engine in self.engines)
+
+    @property
+    def pending_requests(self) -> int:
+        """In-flight requests across all replicas."""
+        return sum(engine.pending_requests for engine in self.engines)
+
+    def acquire(self) -> WhisperEngine:
+        """
+        Pick the least-loaded replica.
+
+        Returns:
+            Replica with the fewest in-flight requests
+        """
+        # Rotate the starting point so idle replicas share work evenly
+        start = next(self._order)
+        rotated = self.engines[start:] + self.engines[:start]
+        return min(rotated, key=lambda engine: engine.pending_requests)
+
+    def has_speech(self, audio: np.ndarray) -> bool:
+        """Check the VAD pre-gate (see WhisperEngine.has_speech)."""
+        return self.engines[0].has_speech(audio)
+
+    async def transcribe(self, audio: np.ndarray, **kwargs) -> TranscriptionResult:
+        """Transcribe on the least-loaded replica (see WhisperEngine.transcribe)."""
+        return await self.acquire().transcribe(audio, **kwargs)
+
+    async def transcribe_features(self, features: np.ndarray, **kwargs) -> TranscriptionResult:
+        """Transcribe features on the least-loaded replica (see WhisperEngine)."""
+        return await self.acquire().transcribe_features(features, **kwargs)
+
+    def transcribe_batch(self, audios: list[np.ndarray], **kwargs) -> list[TranscriptionResult]:
+        """Batched transcription on one replica (see WhisperEngine.transcribe_batch)."""
+        return self.acquire().transcribe_batch(audios, **kwargs)
+
+    async def transcribe_batch_async(
+        self,
+        audios: list[np.ndarray],
+        **kwargs,
+    ) -> list[TranscriptionResult]:
+        """Async batched transcription on the least-loaded replica."""
+        return await self.acquire().transcribe_batch_async(audios, **kwargs)
+
+    async def transcribe_streaming(
+        self,
+        audio_stream: AsyncIterator[np.ndarray],
+        source_language: Optional[str] = None,
+        chunk_length_s: float = 1.0,
+        decoding: DecodingProfile | str | None = None,
+    ) -> AsyncIterator[TranscriptionResult]:
+        """Stream transcription, dispatching each decode to the least-loaded replica."""
+        streaming = StreamingASR(self, decoding=decoding, min_chunk_s=chunk_length_s)
+
+        async for audio_chunk in audio_stream:
+            result = await streaming.process_chunk(audio_chunk, source_language)
+            if result is not None and result.text:
+                yield result
+
+        result = await streaming.flush(source_language)
+        if result is not None and result.text:
+            yield result
+
+    def detect_language(
+        self,
+        audio: np.ndarray,
+        excerpt_s: float = settings.LANGUAGE_ID_EXCERPT_S,
+    ) -> tuple[str, float]:
+        """Detect language on one replica (see WhisperEngine.detect_language)."""
+        return self.acquire().detect_language(audio, excerpt_s)
+
+    async def detect_language_async(
+        self,
+        audio: np.ndarray,
+        excerpt_s: float = settings.LANGUAGE_ID_EXCERPT_S,
+    ) -> tuple[str, float]:
+        """Async language detection on the least-loaded replica."""
+        return await self.acquire().detect_language_async(audio, excerpt_s)
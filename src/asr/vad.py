@@ -0,0 +1,145 @@
+"""Lightweight vectorized voice activity detection used to gate ASR calls."""
+
+import numpy as np
+
+from ..utils.config import settings
+
+
+class EnergyVAD:
+    """
+    Frame-energy voice activity detector.
+
+    Audio is viewed as non-overlapping frames (no copy), frame energies are
+    computed in one vectorized pass, and each frame gets a speech probability
+    from its level above an absolute silence floor and above the background
+    noise level. It is cheap enough to run on the event loop before any
+    engine dispatch.
+
+    With ``adaptive=True`` the noise level is tracked across calls, which
+    suits a single streaming session: it falls immediately to a quiet chunk's
+    level and rises towards the level of the last ``noise_window_s`` of audio
+    by at most ``noise_rise_db`` per second, so results don't depend on the
+    chunk size. Samples short of a whole frame are carried into the next
+    call. Otherwise the noise level is estimated per call.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        threshold: float = settings.ASR_VAD_THRESHOLD,
+        energy_db: float = settings.ASR_VAD_ENERGY_DB,
+        snr_db: float = 10.0,
+        adaptive: bool = False,
+        noise_rise_db: float = 0.5,
+        noise_window_s: float = 5.0,
+    ):
+        """
+        Initialize VAD.
+
+        Args:
+            sample_rate: Audio sample rate (Hz)
+            frame_ms: Frame length (ms)
+            threshold: Probability above which a frame counts as speech
+            energy_db: Frame level (dBFS) at which speech probability is 0.5
+            snr_db: Level above background noise at which probability is 0.5
+            adaptive: Track the noise level across calls
+            noise_rise_db: Maximum noise level increase per second of audio (adaptive mode)
+            noise_window_s: Audio the noise level rises towards is taken from (adaptive mode)
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.frame_ms = frame_ms
+        self.threshold = threshold
+        self.energy_db = energy_db
+        self.snr_db = snr_db
+        self.adaptive = adaptive
+        self.noise_rise_db = noise_rise_db
+        self.noise_window = max(1, int(noise_window_s * 1000 / frame_ms))
+
+        self.reset()
+
+    def frame_energies_db(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Per-frame energy in dBFS.
+
+        Args:
+            audio: Audio waveform (float, [-1, 1])
+
+        Returns:
+            Energy of each complete frame (dB)
+        """
+        n_frames = len(audio) // self.frame_length
+        frames = audio[: n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+        power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / self.frame_length
+        return 10.0 * np.log10(power + 1e-12)
+
+    def speech_probabilities(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Per-frame speech probability.
+
+        Args:
+            audio: Audio waveform (float, [-1, 1])
+
+        Returns:
+            Probability for each complete frame of ``frame_ms`` (in adaptive mode
+            including frames completed by samples carried from the previous call)
+        """
+        if self.adaptive:
+            if len(self._remainder):
+                audio = np.concatenate([self._remainder, audio])
+            complete = len(audio) // self.frame_length * self.frame_length
+            self._remainder = audio[complete:].copy()
+
+        energies = self.frame_energies_db(audio)
+        if len(energies) == 0:
+            return energies
+
+        noise_db = float(np.percentile(energies, 10))
+        if self.adaptive:
+            self._history = np.concatenate([self._history, energies])[-self.noise_window :]
+            # Rise towards the recent noise level at a bounded rate per second of audio
+            max_rise = self.noise_rise_db * len(energies) * self.frame_ms / 1000
+            target_db = float(np.percentile(self._history, 10))
+            noise_db = min(noise_db, target_db, self.noise_db + max_rise)
+            self.noise_db = noise_db
+        else:
+            # A chunk that is all speech must not raise the noise estimate
+            noise_db = min(noise_db, self.energy_db)
+
+        # Both above the absolute silence floor and clearly above the noise
+        above_floor = 1.0 / (1.0 + np.exp(-(energies - self.energy_db) / 3.0))
+        above_noise = 1.0 / (1.0 + np.exp(-(energies - noise_db - self.snr_db) / 3.0))
+        return above_floor * above_noise
+
+    def speech_duration_ms(self, audio: np.ndarray) -> float:
+        """
+        Total duration of speech frames.
+
+        Args:
+            audio: Audio waveform (float, [-1, 1])
+
+        Returns:
+            Speech duration (ms)
+        """
+        probabilities = self.speech_probabilities(audio)
+        return float(np.count_nonzero(probabilities >= self.threshold) * self.frame_ms)
+
+    def contains_speech(self, audio: np.ndarray, min_speech_ms: float = 250.0) -> bool:
+        """
+        Whether the audio holds at least ``min_speech_ms`` of speech.
+
+        Args:
+            audio: Audio waveform (float, [-1, 1])
+            min_speech_ms: Minimum speech duration (ms)
+
+        Returns:
+            True if speech is present
+        """
+        return self.speech_duration_ms(audio) >= min_speech_ms
+
+    def reset(self) -> None:
+        """Forget the tracked noise level and any carried partial frame."""
+        self.noise_db = self.energy_db - self.snr_db
+        self._history = np.zeros(0, dtype=np.float64)
+        self._remainder = np.zeros(0, dtype=np.float32)
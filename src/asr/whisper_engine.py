@@ -9,16 +9,23 @@ This module provides state-of-the-art speech recognition with:
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import AsyncIterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 import numpy as np
-import torch
-from faster_whisper import WhisperModel
 from pydantic import BaseModel, Field
 
+from ..utils.artifacts import resolve_bundle
 from ..utils.config import settings
+from ..utils.decoding import DecodingProfile, resolve_decoding
 from ..utils.logging import get_logger
+from .features import IncrementalLogMel
+from .vad import EnergyVAD
+
+if TYPE_CHECKING:
+    from .language_id import SessionLanguageDetector
+    from .pool import WhisperEnginePool
 
 logger = get_logger(__name__)
 
@@ -31,6 +38,7 @@ class TranscriptionResult(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
     segments: list[dict] = Field(default_factory=list)
     processing_time_ms: float
+    metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class WhisperEngine:
@@ -51,6 +59,10 @@ class WhisperEngine:
         device: str = "cuda",
         compute_type: str = "float16",
         download_root: Optional[Path] = None,
+        vad_gate: bool = settings.ASR_VAD_GATE,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        device_index: int = 0,
     ):
         """
         Initialize Whisper engine.
@@ -60,23 +72,46 @@ class WhisperEngine:
             device: Device to run on (cuda, cpu)
             compute_type: Precision (float16, int8, int8_float16)
             download_root: Where to store/load models
+            vad_gate: Skip the model entirely for clips without speech
+            cpu_threads: Intra-op threads per worker (0 = CTranslate2 default)
+            num_workers: Concurrent CTranslate2 workers (parallel transcriptions)
+            device_index: GPU to load the model on
         """
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
+        self.num_workers = num_workers
+        self.pending_requests = 0  # Queue depth seen by adaptive decoding
+        self.vad = EnergyVAD() if vad_gate else None
         
         logger.info(
             f"Loading Whisper model: {model_name}",
-            extra={"device": device, "compute_type": compute_type},
+            extra={
+                "device": device,
+                "device_index": device_index,
+                "compute_type": compute_type,
+                "cpu_threads": cpu_threads,
+                "num_workers": num_workers,
+            },
         )
         
+        from faster_whisper import WhisperModel
+
+        # A pre-quantized bundle loads without conversion; otherwise the hub model
+        bundle = resolve_bundle("whisper", model_name)
         self.model = WhisperModel(
-            model_name,
+            str(bundle) if bundle else model_name,
             device=device,
+            device_index=device_index,
             compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
             download_root=str(download_root) if download_root else None,
         )
         
+        # One thread per CTranslate2 worker, so calls queue here rather than inside the model
+        self.executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="whisper")
+        
         logger.info("Whisper model loaded successfully")
 
     async def transcribe(
@@ -84,9 +119,12 @@ class WhisperEngine:
         audio: np.ndarray,
         source_language: Optional[str] = None,
         task: str = "transcribe",
-        beam_size: int = 5,
-        best_of: int = 5,
+        beam_size: Optional[int] = None,
+        best_of: Optional[int] = None,
         temperature: float = 0.0,
+        decoding: DecodingProfile | str | None = None,
+        initial_prompt: Optional[str] = None,
+        word_timestamps: bool = False,
     ) -> TranscriptionResult:
         """
         Transcribe audio to text.
@@ -95,9 +133,12 @@ class WhisperEngine:
             audio: Audio waveform as numpy array (16kHz, mono)
             source_language: Source language code (e.g., 'en', 'es'). Auto-detect if None
             task: 'transcribe' or 'translate' (to English)
-            beam_size: Beam search size (higher = more accurate but slower)
+            beam_size: Beam search size; overrides the decoding profile if set
             best_of: Number of candidates when sampling (higher = better quality)
             temperature: Sampling temperature (0 = greedy, higher = more random)
+            decoding: Decoding profile (uses settings.DECODING_PROFILE if None)
+            initial_prompt: Preceding text used as decoder context
+            word_timestamps: Add per-word timings to each segment under 'words'
             
         Returns:
             TranscriptionResult with text and metadata
@@ -106,52 +147,153 @@ class WhisperEngine:
         
         start_time = time.time()
         
+        if beam_size is None:
+            decoding_config = resolve_decoding(
+                decoding,
+                queue_depth=self.pending_requests,
+                long_input=len(audio) / 16000 >= settings.ADAPTIVE_LONG_AUDIO_S,
+            )
+            beam_size = decoding_config.beam_size
+            best_of = best_of or decoding_config.best_of
+            decoding_metadata = decoding_config.as_metadata()
+        else:
+            best_of = best_of or beam_size
+            decoding_metadata = {"decoding_profile": "custom", "beam_size": beam_size}
+        
+        # Silence and noise never reach the executor or the model
+        if not self.has_speech(audio):
+            return self._build_result(
+                segments=[],
+                language=source_language or "",
+                avg_logprobs=[],
+                start_time=start_time,
+                metadata={**decoding_metadata, "vad": "no_speech"},
+            )
+        
         # Run transcription in thread pool to avoid blocking event loop
         loop = asyncio.get_event_loop()
-        segments, info = await loop.run_in_executor(
-            None,
-            lambda: self.model.transcribe(
-                audio,
-                language=source_language,
-                task=task,
-                beam_size=beam_size,
-                best_of=best_of,
-                temperature=temperature,
-                vad_filter=True,  # Voice Activity Detection filter
-                vad_parameters=dict(min_silence_duration_ms=500),
-            ),
+        self.pending_requests += 1
+        try:
+            segments_list, info = await loop.run_in_executor(
+                self.executor,
+                lambda: self._run_transcribe(
+                    audio,
+                    language=source_language,
+                    task=task,
+                    beam_size=beam_size,
+                    best_of=best_of,
+                    temperature=temperature,
+                    initial_prompt=initial_prompt,
+                    word_timestamps=word_timestamps,
+                ),
+            )
+        finally:
+            self.pending_requests -= 1
+        
+        return self._build_result(
+            segments=[self._segment_to_dict(seg) for seg in segments_list],
+            language=info.language,
+            avg_logprobs=[seg.avg_logprob for seg in segments_list],
+            start_time=start_time,
+            metadata=decoding_metadata,
         )
+
+    def has_speech(self, audio: np.ndarray) -> bool:
+        """
+        Check the VAD pre-gate.
+        
+        Args:
+            audio: Audio waveform (16kHz, mono)
+            
+        Returns:
+            False only if the gate is enabled and found no speech
+        """
+        if self.vad is None:
+            return True
+        return self.vad.contains_speech(audio, settings.ASR_VAD_MIN_SPEECH_MS)
+
+    def _run_transcribe(self, audio: np.ndarray, **kwargs: Any) -> tuple[list, Any]:
+        """
+        Run faster-whisper transcription synchronously.
         
-        # Convert generator to list
-        segments_list = list(segments)
+        Args:
+            audio: Audio waveform (16kHz, mono)
+            **kwargs: Options forwarded to WhisperModel.transcribe
+            
+        Returns:
+            (segments, info); segments are materialized since decoding is lazy
+        """
+        segments, info = self.model.transcribe(
+            audio,
+            vad_filter=True,  # Voice Activity Detection filter
+            vad_parameters=dict(min_silence_duration_ms=500),
+            **kwargs,
+        )
+        return list(segments), info
+
+    @staticmethod
+    def _segment_to_dict(segment: Any) -> dict:
+        """Convert a faster-whisper Segment to a result segment dict."""
+        result = {
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "confidence": float(np.exp(segment.avg_logprob)),
+        }
+        if segment.words:
+            result["words"] = [
+                {
+                    "start": word.start,
+                    "end": word.end,
+                    "word": word.word,
+                    "probability": word.probability,
+                }
+                for word in segment.words
+            ]
+        return result
+
+    def _build_result(
+        self,
+        segments: list[dict],
+        language: str,
+        avg_logprobs: list[float],
+        start_time: float,
+        metadata: dict[str, Any],
+    ) -> TranscriptionResult:
+        """
+        Assemble a TranscriptionResult from decoded segments.
+        
+        Args:
+            segments: Segment dicts (start, end, text, confidence)
+            language: Detected or forced language code
+            avg_logprobs: Average token log-probabilities used for confidence
+            start_time: time.time() when processing started
+            metadata: Result metadata (decoding profile, ...)
+            
+        Returns:
+            TranscriptionResult
+        """
+        import time
         
         # Combine all segment texts
-        full_text = " ".join(segment.text.strip() for segment in segments_list)
+        full_text = " ".join(segment["text"].strip() for segment in segments)
         
         # Calculate average confidence
-        confidences = [segment.avg_logprob for segment in segments_list]
-        avg_confidence = float(np.exp(np.mean(confidences))) if confidences else 0.0
+        avg_confidence = float(np.exp(np.mean(avg_logprobs))) if avg_logprobs else 0.0
         
         processing_time = (time.time() - start_time) * 1000  # Convert to ms
         
         result = TranscriptionResult(
             text=full_text,
-            language=info.language,
-            confidence=avg_confidence,
-            segments=[
-                {
-                    "start": seg.start,
-                    "end": seg.end,
-                    "text": seg.text,
-                    "confidence": float(np.exp(seg.avg_logprob)),
-                }
-                for seg in segments_list
-            ],
+            language=language,
+            confidence=min(avg_confidence, 1.0),
+            segments=segments,
             processing_time_ms=processing_time,
+            metadata=metadata,
         )
         
         logger.debug(
-            f"Transcribed {len(segments_list)} segments",
+            f"Transcribed {len(segments)} segments",
             extra={
                 "language": result.language,
                 "confidence": result.confidence,
@@ -161,114 +303,646 @@ class WhisperEngine:
         
         return result
 
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        source_language: Optional[str] = None,
+        task: str = "transcribe",
+        beam_size: Optional[int] = None,
+        decoding: DecodingProfile | str | None = None,
+    ) -> list[TranscriptionResult]:
+        """
+        Transcribe several clips in one batched encoder/decoder pass.
+        
+        Clips up to one Whisper window (30 s) are stacked into a single
+        batch: the encoder runs once, language is detected per clip from the
+        shared encoder output, and one generate call decodes every clip with
+        its own language prompt. Longer clips fall back to the regular
+        transcription path.
+        
+        Args:
+            audios: Audio waveforms (16kHz, mono)
+            source_language: Language code for all clips. Auto-detect per clip if None
+            task: 'transcribe' or 'translate' (to English)
+            beam_size: Beam search size; overrides the decoding profile if set
+            decoding: Decoding profile (uses settings.DECODING_PROFILE if None)
+            
+        Returns:
+            One TranscriptionResult per clip, in input order
+        """
+        import time
+        
+        start_time = time.time()
+        
+        if beam_size is None:
+            decoding_config = resolve_decoding(decoding, queue_depth=self.pending_requests)
+            beam_size = decoding_config.beam_size
+            decoding_metadata = decoding_config.as_metadata()
+        else:
+            decoding_metadata = {"decoding_profile": "custom", "beam_size": beam_size}
+        
+        window_samples = self.model.feature_extractor.n_samples
+        results: list[Optional[TranscriptionResult]] = [None] * len(audios)
+        
+        # Clips without speech get an empty result and stay out of the batch
+        for i, audio in enumerate(audios):
+            if not self.has_speech(audio):
+                results[i] = self._build_result(
+                    segments=[],
+                    language=source_language or "",
+                    avg_logprobs=[],
+                    start_time=start_time,
+                    metadata={**decoding_metadata, "vad": "no_speech"},
+                )
+        
+        batch_indices = [
+            i
+            for i, audio in enumerate(audios)
+            if results[i] is None and len(audio) <= window_samples
+        ]
+        
+        if batch_indices:
+            decoded = self._decode_batch(
+                [audios[i] for i in batch_indices],
+                language=source_language,
+                task=task,
+                beam_size=beam_size,
+            )
+            for i, (segments, language, avg_logprob) in zip(batch_indices, decoded, strict=True):
+                results[i] = self._build_result(
+                    segments=segments,
+                    language=language,
+                    avg_logprobs=[avg_logprob] if segments else [],
+                    start_time=start_time,
+                    metadata={**decoding_metadata, "batch_size": len(batch_indices)},
+                )
+        
+        # Long clips need the sequential sliding-window decoder
+        for i, audio in enumerate(audios):
+            if results[i] is not None:
+                continue
+            segments_list, info = self._run_transcribe(
+                audio,
+                language=source_language,
+                task=task,
+                beam_size=beam_size,
+                best_of=beam_size,
+            )
+            results[i] = self._build_result(
+                segments=[self._segment_to_dict(seg) for seg in segments_list],
+                language=info.language,
+                avg_logprobs=[seg.avg_logprob for seg in segments_list],
+                start_time=start_time,
+                metadata=decoding_metadata,
+            )
+        
+        return results
+
+    async def transcribe_batch_async(
+        self,
+        audios: list[np.ndarray],
+        source_language: Optional[str] = None,
+        task: str = "transcribe",
+        beam_size: Optional[int] = None,
+        decoding: DecodingProfile | str | None = None,
+    ) -> list[TranscriptionResult]:
+        """
+        Async batched transcription wrapper.
+        
+        Args:
+            audios: Audio waveforms (16kHz, mono)
+            source_language: Language code for all clips. Auto-detect per clip if None
+            task: 'transcribe' or 'translate' (to English)
+            beam_size: Beam search size; overrides the decoding profile if set
+            decoding: Decoding profile
+            
+        Returns:
+            One TranscriptionResult per clip, in input order
+        """
+        loop = asyncio.get_event_loop()
+        self.pending_requests += 1
+        try:
+            return await loop.run_in_executor(
+                self.executor,
+                lambda: self.transcribe_batch(
+                    audios,
+                    source_language=source_language,
+                    task=task,
+                    beam_size=beam_size,
+                    decoding=decoding,
+                ),
+            )
+        finally:
+            self.pending_requests -= 1
+
+    async def transcribe_features(
+        self,
+        features: np.ndarray,
+        duration: float,
+        source_language: Optional[str] = None,
+        task: str = "transcribe",
+        decoding: DecodingProfile | str | None = None,
+        initial_prompt: Optional[str] = None,
+        word_timestamps: bool = False,
+    ) -> TranscriptionResult:
+        """
+        Transcribe precomputed log-mel features of one window.
+        
+        Skips the raw-audio front-end; streaming sessions pass features kept
+        up to date by IncrementalLogMel. No VAD gate is applied here, callers
+        decide when to decode.
+        
+        Args:
+            features: Normalized log-mel features (n_mels, n_frames), at most 30 s
+            duration: Audio duration the features cover (seconds)
+            source_language: Source language code. Auto-detect if None
+            task: 'transcribe' or 'translate' (to English)
+            decoding: Decoding profile (uses settings.DECODING_PROFILE if None)
+            initial_prompt: Preceding text used as decoder context
+            word_timestamps: Add per-word timings to each segment under 'words'
+            
+        Returns:
+            TranscriptionResult with text and metadata
+        """
+        import time
+        
+        start_time = time.time()
+        decoding_config = resolve_decoding(decoding, queue_depth=self.pending_requests)
+        
+        loop = asyncio.get_event_loop()
+        self.pending_requests += 1
+        try:
+            segments, language, avg_logprob = await loop.run_in_executor(
+                self.executor,
+                lambda: self._decode_window(
+                    features,
+                    duration,
+                    language=source_language,
+                    task=task,
+                    beam_size=decoding_config.beam_size,
+                    initial_prompt=initial_prompt,
+                    word_timestamps=word_timestamps,
+                ),
+            )
+        finally:
+            self.pending_requests -= 1
+        
+        return self._build_result(
+            segments=segments,
+            language=language,
+            avg_logprobs=[avg_logprob] if segments else [],
+            start_time=start_time,
+            metadata=decoding_config.as_metadata(),
+        )
+
+    def _decode_batch(
+        self,
+        audios: list[np.ndarray],
+        language: Optional[str],
+        task: str,
+        beam_size: int,
+    ) -> list[tuple[list[dict], str, float]]:
+        """
+        Encode and decode clips of at most 30 s as one batch.
+        
+        Args:
+            audios: Audio waveforms (16kHz, mono), each within one window
+            language: Language code for all clips, or None to detect per clip
+            task: 'transcribe' or 'translate'
+            beam_size: Beam search size
+            
+        Returns:
+            (segments, language, avg_logprob) per clip
+        """
+        from faster_whisper.tokenizer import Tokenizer
+        
+        encoder_output = self.model.encode(self._window_features(audios))
+        
+        if language is None:
+            detections = self.model.model.detect_language(encoder_output)
+            languages = [detection[0][0][2:-2] for detection in detections]
+        else:
+            languages = [language] * len(audios)
+        
+        tokenizers = [
+            Tokenizer(
+                self.model.hf_tokenizer,
+                self.model.model.is_multilingual,
+                task=task,
+                language=clip_language,
+            )
+            for clip_language in languages
+        ]
+        prompts = [
+            self.model.get_prompt(tokenizer, [], without_timestamps=False)
+            for tokenizer in tokenizers
+        ]
+        
+        outputs = self.model.model.generate(
+            encoder_output,
+            prompts,
+            beam_size=beam_size,
+            max_length=getattr(self.model, "max_length", 448),
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+            max_initial_timestamp_index=50,
+        )
+        
+        decoded = []
+        for audio, tokenizer, clip_language, output in zip(
+            audios, tokenizers, languages, outputs, strict=True
+        ):
+            avg_logprob = output.scores[0]
+            
+            # Same silence rule as faster-whisper's sequential decoder
+            if output.no_speech_prob > 0.6 and avg_logprob < -1.0:
+                decoded.append(([], clip_language, avg_logprob))
+                continue
+            
+            segments = self._split_timestamped_tokens(
+                output.sequences_ids[0],
+                tokenizer,
+                duration=len(audio) / 16000,
+                confidence=float(np.exp(avg_logprob)),
+            )
+            decoded.append((segments, clip_language, avg_logprob))
+        
+        return decoded
+
+    def _decode_window(
+        self,
+        features: np.ndarray,
+        duration: float,
+        language: Optional[str],
+        task: str,
+        beam_size: int,
+        initial_prompt: Optional[str] = None,
+        word_timestamps: bool = False,
+    ) -> tuple[list[dict], str, float]:
+        """
+        Encode and decode one window of precomputed features.
+        
+        Args:
+            features: Normalized log-mel features (n_mels, n_frames)
+            duration: Audio duration the features cover (seconds)
+            language: Language code, or None to detect
+            task: 'transcribe' or 'translate'
+            beam_size: Beam search size
+            initial_prompt: Preceding text used as decoder context
+            word_timestamps: Align words to audio frames
+            
+        Returns:
+            (segments, language, avg_logprob)
+        """
+        from faster_whisper.tokenizer import Tokenizer
+        
+        n_frames = self.model.feature_extractor.nb_max_frames
+        num_frames = min(features.shape[1], n_frames)
+        window = np.zeros((1, features.shape[0], n_frames), dtype=np.float32)
+        window[0, :, :num_frames] = features[:, :num_frames]
+        
+        encoder_output = self.model.encode(window)
+        
+        if language is None:
+            language = self.model.model.detect_language(encoder_output)[0][0][0][2:-2]
+        
+        tokenizer = Tokenizer(
+            self.model.hf_tokenizer,
+            self.model.model.is_multilingual,
+            task=task,
+            language=language,
+        )
+        previous_tokens = tokenizer.encode(" " + initial_prompt.strip()) if initial_prompt else []
+        prompt = self.model.get_prompt(tokenizer, previous_tokens, without_timestamps=False)
+        
+        output = self.model.model.generate(
+            encoder_output,
+            [prompt],
+            beam_size=beam_size,
+            max_length=getattr(self.model, "max_length", 448),
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=True,
+            suppress_tokens=[-1],
+            max_initial_timestamp_index=50,
+        )[0]
+        avg_logprob = output.scores[0]
+        
+        # Same silence rule as faster-whisper's sequential decoder
+        if output.no_speech_prob > 0.6 and avg_logprob < -1.0:
+            return [], language, avg_logprob
+        
+        tokens = output.sequences_ids[0]
+        segments = self._split_timestamped_tokens(
+            tokens,
+            tokenizer,
+            duration=duration,
+            confidence=float(np.exp(avg_logprob)),
+        )
+        if word_timestamps and segments:
+            self._add_word_timestamps(segments, tokens, tokenizer, encoder_output, num_frames)
+        
+        return segments, language, avg_logprob
+
+    def _add_word_timestamps(
+        self,
+        segments: list[dict],
+        tokens: list[int],
+        tokenizer: Any,
+        encoder_output: Any,
+        num_frames: int,
+    ) -> None:
+        """
+        Attach word timings from cross-attention alignment to segments.
+        
+        Args:
+            segments: Segments decoded from ``tokens`` (updated in place)
+            tokens: Generated token IDs
+            tokenizer: faster-whisper Tokenizer used for the prompt
+            encoder_output: Encoder output of the window
+            num_frames: Feature frames holding audio
+        """
+        text_tokens = [token for token in tokens if token < tokenizer.eot]
+        words, word_tokens = tokenizer.split_to_word_tokens(text_tokens + [tokenizer.eot])
+        if len(word_tokens) <= 1:
+            return
+        
+        alignment = self.model.model.align(
+            encoder_output,
+            tokenizer.sot_sequence,
+            [text_tokens],
+            num_frames,
+            median_filter_width=7,
+        )[0]
+        text_indices = np.array([pair[0] for pair in alignment.alignments])
+        time_indices = np.array([pair[1] for pair in alignment.alignments])
+        probabilities = np.asarray(alignment.text_token_probs)
+        
+        # Each token starts where the alignment path first reaches it
+        feature_extractor = self.model.feature_extractor
+        tokens_per_second = feature_extractor.sampling_rate / (feature_extractor.hop_length * 2)
+        jumps = np.pad(np.diff(text_indices), (1, 0), constant_values=1).astype(bool)
+        jump_times = time_indices[jumps] / tokens_per_second
+        boundaries = np.pad(np.cumsum([len(t) for t in word_tokens[:-1]]), (1, 0))
+        if len(jump_times) <= boundaries[-1]:
+            return  # Alignment did not cover every token
+        
+        segment_starts = np.array([segment["start"] for segment in segments])
+        for segment in segments:
+            segment["words"] = []
+        for i, word in enumerate(words[:-1]):
+            first, last = boundaries[i], boundaries[i + 1]
+            start = float(jump_times[first])
+            end = float(jump_times[last])
+            index = int(np.searchsorted(segment_starts, (start + end) / 2, side="right")) - 1
+            segments[max(index, 0)]["words"].append(
+                {
+                    "start": start,
+                    "end": end,
+                    "word": word,
+                    "probability": float(np.mean(probabilities[first:last])),
+                }
+            )
+
+    def _window_features(self, audios: list[np.ndarray]) -> np.ndarray:
+        """
+        Log-mel features padded/trimmed to one 30 s window, stacked into a batch.
+        
+        Args:
+            audios: Audio waveforms (16kHz, mono)
+            
+        Returns:
+            Features of shape (batch, n_mels, n_frames)
+        """
+        feature_extractor = self.model.feature_extractor
+        n_frames = feature_extractor.nb_max_frames
+        
+        features = np.zeros(
+            (len(audios), feature_extractor.mel_filters.shape[0], n_frames),
+            dtype=np.float32,
+        )
+        for i, audio in enumerate(audios):
+            clip_features = feature_extractor(audio)[:, :n_frames]
+            features[i, :, : clip_features.shape[1]] = clip_features
+        return features
+
+    @staticmethod
+    def _split_timestamped_tokens(
+        tokens: list[int],
+        tokenizer: Any,
+        duration: float,
+        confidence: float,
+    ) -> list[dict]:
+        """
+        Split a decoded token sequence into segments at timestamp tokens.
+        
+        Args:
+            tokens: Generated token IDs (text and timestamp tokens)
+            tokenizer: faster-whisper Tokenizer used for the prompt
+            duration: Clip duration in seconds (clamps segment ends)
+            confidence: Confidence assigned to every segment of the clip
+            
+        Returns:
+            Segment dicts (start, end, text, confidence)
+        """
+        time_precision = 0.02
+        segments = []
+        text_tokens: list[int] = []
+        segment_start: Optional[float] = None
+        last_time = 0.0
+        
+        def close_segment(end: float) -> None:
+            text = tokenizer.decode(text_tokens)
+            if text.strip():
+                segments.append(
+                    {
+                        "start": segment_start if segment_start is not None else last_time,
+                        "end": min(end, duration),
+                        "text": text,
+                        "confidence": confidence,
+                    }
+                )
+        
+        for token in tokens:
+            if token >= tokenizer.timestamp_begin:
+                timestamp = (token - tokenizer.timestamp_begin) * time_precision
+                if text_tokens:
+                    close_segment(timestamp)
+                    text_tokens = []
+                    segment_start = None
+                else:
+                    segment_start = timestamp
+                last_time = timestamp
+            elif token < tokenizer.eot:
+                text_tokens.append(token)
+        
+        # Trailing text without a closing timestamp runs to the end of the clip
+        if text_tokens:
+            close_segment(duration)
+        
+        return segments
+
     async def transcribe_streaming(
         self,
         audio_stream: AsyncIterator[np.ndarray],
         source_language: Optional[str] = None,
-        chunk_length_s: float = 5.0,
+        chunk_length_s: float = 1.0,
+        decoding: DecodingProfile | str | None = None,
     ) -> AsyncIterator[TranscriptionResult]:
         """
         Stream transcription for real-time audio.
         
+        Uses StreamingASR, so overlapping audio is re-decoded with the
+        committed text as prompt and only words confirmed by consecutive
+        hypotheses are emitted.
+        
         Args:
             audio_stream: Async iterator of audio chunks
             source_language: Source language code
-            chunk_length_s: Length of each chunk in seconds
+            chunk_length_s: Audio to accumulate between decodes (seconds)
+            decoding: Decoding profile (uses settings.STREAMING_DECODING_PROFILE if None)
             
         Yields:
-            TranscriptionResult for each processed chunk
+            StreamingTranscriptionResult for each decode with newly committed text
         """
-        buffer = np.array([], dtype=np.float32)
-        chunk_size = int(chunk_length_s * 16000)  # 16kHz sample rate
+        streaming = StreamingASR(self, decoding=decoding, min_chunk_s=chunk_length_s)
         
         async for audio_chunk in audio_stream:
-            buffer = np.concatenate([buffer, audio_chunk])
-            
-            # Process when buffer is large enough
-            while len(buffer) >= chunk_size:
-                chunk = buffer[:chunk_size]
-                buffer = buffer[chunk_size:]
-                
-                result = await self.transcribe(
-                    chunk,
-                    source_language=source_language,
-                    beam_size=3,  # Faster for real-time
-                    best_of=3,
-                )
-                
+            result = await streaming.process_chunk(audio_chunk, source_language)
+            if result is not None and result.text:
                 yield result
         
-        # Process remaining audio in buffer
-        if len(buffer) > 0:
-            result = await self.transcribe(
-                buffer,
-                source_language=source_language,
-                beam_size=3,
-                best_of=3,
-            )
+        # Commit whatever is left in the buffer
+        result = await streaming.flush(source_language)
+        if result is not None and result.text:
             yield result
 
-    def detect_language(self, audio: np.ndarray) -> tuple[str, float]:
+    def detect_language(
+        self,
+        audio: np.ndarray,
+        excerpt_s: float = settings.LANGUAGE_ID_EXCERPT_S,
+    ) -> tuple[str, float]:
         """
         Detect the language of the audio.
         
+        Only a short excerpt is featurized, then the encoder runs once and a
+        single language-token step is decoded; no transcription takes place.
+        
         Args:
-            audio: Audio waveform as numpy array
+            audio: Audio waveform as numpy array (16kHz, mono)
+            excerpt_s: Seconds of audio from the start used for detection
             
         Returns:
             (language_code, confidence)
         """
-        # Use first 30 seconds for language detection
-        audio_sample = audio[: 30 * 16000]
+        excerpt = audio[: int(excerpt_s * 16000)]
+        encoder_output = self.model.encode(self._window_features([excerpt]))
+        token, probability = self.model.model.detect_language(encoder_output)[0][0]
         
-        segments, info = self.model.transcribe(
-            audio_sample,
-            language=None,  # Auto-detect
-            task="transcribe",
-        )
+        return token[2:-2], float(probability)
+
+    async def detect_language_async(
+        self,
+        audio: np.ndarray,
+        excerpt_s: float = settings.LANGUAGE_ID_EXCERPT_S,
+    ) -> tuple[str, float]:
+        """
+        Async language detection wrapper.
         
-        return info.language, info.language_probability
+        Args:
+            audio: Audio waveform as numpy array (16kHz, mono)
+            excerpt_s: Seconds of audio from the start used for detection
+            
+        Returns:
+            (language_code, confidence)
+        """
+        loop = asyncio.get_event_loop()
+        self.pending_requests += 1
+        try:
+            return await loop.run_in_executor(
+                self.executor, self.detect_language, audio, excerpt_s
+            )
+        finally:
+            self.pending_requests -= 1
+
+
+class StreamingTranscriptionResult(TranscriptionResult):
+    """Incremental transcription: newly committed text plus unstable tail."""
+
+    unstable_text: str = ""
+    committed_until: float = 0.0  # Stream time (s) up to which text is committed
 
 
 class StreamingASR:
     """
-    Real-time streaming ASR with voice activity detection and buffering.
+    Real-time streaming ASR with local-agreement commits.
     
-    Optimized for low-latency real-time transcription with:
-    - Voice Activity Detection (VAD)
-    - Intelligent buffering
-    - Overlapping windows for context
+    Each decode re-transcribes a short sliding window of uncommitted audio
+    with the committed text as ``initial_prompt``. A word is committed once
+    two consecutive hypotheses agree on it (LocalAgreement-2); committed
+    audio is then trimmed from the buffer, so latency stays around
+    ``min_chunk_s`` plus one decode instead of a full 30 s window.
+    
+    A per-session VAD drops leading silence before it is buffered and skips
+    decodes when no new speech arrived and nothing awaits confirmation.
+    Log-mel frames are computed once per incoming chunk (IncrementalLogMel)
+    and handed to the engine, so overlapping windows never recompute them.
     """
 
     def __init__(
         self,
-        whisper_engine: WhisperEngine,
+        whisper_engine: "WhisperEngine | WhisperEnginePool",
         vad_threshold: float = 0.5,
         min_speech_duration_ms: int = 250,
         max_speech_duration_s: float = 30.0,
+        decoding: DecodingProfile | str | None = None,
+        min_chunk_s: float = 1.0,
+        prompt_chars: int = 200,
+        task: str = "transcribe",
+        language_detector: Optional["SessionLanguageDetector"] = None,
+        incremental_features: bool = True,
     ):
         """
         Initialize streaming ASR.
         
         Args:
-            whisper_engine: Whisper engine instance
-            vad_threshold: Voice activity detection threshold
+            whisper_engine: Whisper engine or replica pool
+            vad_threshold: Frame speech probability for the session VAD
             min_speech_duration_ms: Minimum speech duration to process
-            max_speech_duration_s: Maximum speech duration per chunk
+            max_speech_duration_s: Buffer length at which all words are force-committed
+            decoding: Decoding profile for this session
+                (uses settings.STREAMING_DECODING_PROFILE if None)
+            min_chunk_s: New audio to accumulate before re-decoding (seconds)
+            prompt_chars: Committed text carried over as prompt (characters)
+            task: 'transcribe' or 'translate' (to English)
+            language_detector: Cached language ID used when no source language is given
+            incremental_features: Compute log-mel frames once per chunk instead of per decode
         """
         self.engine = whisper_engine
         self.vad_threshold = vad_threshold
         self.min_speech_duration_ms = min_speech_duration_ms
         self.max_speech_duration_s = max_speech_duration_s
+        self.decoding = decoding or settings.STREAMING_DECODING_PROFILE
+        self.min_chunk_s = min_chunk_s
+        self.prompt_chars = prompt_chars
+        self.task = task
+        self.language_detector = language_detector
+        self.vad = EnergyVAD(threshold=vad_threshold, adaptive=True)
+        self.features = (
+            IncrementalLogMel(whisper_engine.model.feature_extractor)
+            if incremental_features
+            else None
+        )
         
-        self.buffer = np.array([], dtype=np.float32)
-        self.is_speaking = False
+        self.reset()
 
     async def process_chunk(
         self,
         audio_chunk: np.ndarray,
         source_language: Optional[str] = None,
-    ) -> Optional[TranscriptionResult]:
+    ) -> Optional[StreamingTranscriptionResult]:
         """
         Process a single audio chunk.
         
@@ -277,56 +951,319 @@ class StreamingASR:
             source_language: Source language code
             
         Returns:
-            TranscriptionResult if speech detected and processed, None otherwise
+            StreamingTranscriptionResult if the window was re-decoded, None otherwise
         """
+        probabilities = self.vad.speech_probabilities(audio_chunk)
+        speech_ms = float(np.count_nonzero(probabilities >= self.vad.threshold) * self.vad.frame_ms)
+        
+        # Leading silence is skipped without ever being buffered; a chunk too short
+        # to complete a VAD frame hasn't been judged yet, so it is kept
+        if len(self.buffer) == 0 and len(probabilities) > 0 and speech_ms == 0:
+            self.buffer_offset += len(audio_chunk) / 16000
+            return None
+        
         # Add to buffer
         self.buffer = np.concatenate([self.buffer, audio_chunk])
+        self.pending_samples += len(audio_chunk)
+        if self.features is not None:
+            self.features.append(audio_chunk)
+        self.pending_speech_ms += speech_ms
         
-        # Check if buffer exceeds max duration
-        max_samples = int(self.max_speech_duration_s * 16000)
+        if self.pending_samples < int(self.min_chunk_s * 16000):
+            return None
         
-        if len(self.buffer) >= max_samples:
-            # Process accumulated audio
-            result = await self.engine.transcribe(
-                self.buffer,
-                source_language=source_language,
-                beam_size=3,  # Faster for streaming
-            )
-            
-            # Keep last 1 second for context
-            overlap_samples = 16000
-            self.buffer = self.buffer[-overlap_samples:]
-            
-            return result
+        # Nothing left to confirm and no new speech: don't call the engine
+        if not self.hypothesis and self.pending_speech_ms < self.min_speech_duration_ms:
+            if self.pending_speech_ms == 0:
+                self._trim_buffer(self.buffer_offset + len(self.buffer) / 16000)
+            self.pending_samples = 0
+            return None
         
-        return None
+        force = len(self.buffer) >= int(self.max_speech_duration_s * 16000)
+        return await self._decode(source_language, final=force)
+
+    async def flush(
+        self,
+        source_language: Optional[str] = None,
+    ) -> Optional[StreamingTranscriptionResult]:
+        """
+        Decode and commit everything left in the buffer (end of stream).
+        
+        Args:
+            source_language: Source language code
+            
+        Returns:
+            StreamingTranscriptionResult, or None if the buffer is empty
+        """
+        if len(self.buffer) == 0:
+            return None
+        return await self._decode(source_language, final=True)
 
     def reset(self) -> None:
         """Reset the buffer and state."""
         self.buffer = np.array([], dtype=np.float32)
+        self.buffer_offset = 0.0  # Stream time of buffer[0] in seconds
+        self.pending_samples = 0
+        self.pending_speech_ms = 0.0
+        self.committed_words: list[dict] = []
+        self.hypothesis: list[dict] = []  # Unconfirmed words from the last decode
         self.is_speaking = False
+        self.vad.reset()
+        if self.features is not None:
+            self.features.reset()
+
+    @property
+    def committed_text(self) -> str:
+        """All text committed so far in this session."""
+        return "".join(word["word"] for word in self.committed_words).strip()
+
+    async def _decode(
+        self,
+        source_language: Optional[str],
+        final: bool,
+    ) -> StreamingTranscriptionResult:
+        """
+        Re-decode the buffer, commit agreed words and trim committed audio.
+        
+        Args:
+            source_language: Source language code
+            final: Commit the whole hypothesis (end of stream or buffer full)
+            
+        Returns:
+            StreamingTranscriptionResult
+        """
+        self.pending_samples = 0
+        self.pending_speech_ms = 0.0
+        
+        if source_language is None and self.language_detector is not None:
+            source_language = await self.language_detector.resolve(self.buffer)
+        
+        options = dict(
+            source_language=source_language,
+            task=self.task,
+            decoding=self.decoding,
+            initial_prompt=self.committed_text[-self.prompt_chars:] or None,
+            word_timestamps=True,
+        )
+        if self.features is not None:
+            result = await self.engine.transcribe_features(
+                self.features.features(),
+                duration=len(self.buffer) / 16000,
+                **options,
+            )
+        else:
+            result = await self.engine.transcribe(self.buffer, **options)
+        
+        if self.language_detector is not None:
+            self.language_detector.observe(result)
+        
+        words = self._new_words(_words_from_segments(result.segments, self.buffer_offset))
+        
+        if final:
+            committed = words
+        else:
+            committed = self._agreed_prefix(words)
+        
+        self.committed_words.extend(committed)
+        self.hypothesis = words[len(committed):]
+        
+        # Drop committed audio; the prompt carries its text as context
+        if final:
+            self._trim_buffer(self.buffer_offset + len(self.buffer) / 16000)
+        elif committed:
+            self._trim_buffer(committed[-1]["end"])
+        
+        return StreamingTranscriptionResult(
+            text="".join(word["word"] for word in committed).strip(),
+            language=result.language,
+            confidence=result.confidence,
+            segments=[
+                {
+                    "start": word["start"],
+                    "end": word["end"],
+                    "text": word["word"],
+                    "confidence": word["probability"],
+                }
+                for word in committed
+            ],
+            processing_time_ms=result.processing_time_ms,
+            metadata=result.metadata,
+            unstable_text="".join(word["word"] for word in self.hypothesis).strip(),
+            committed_until=self.committed_words[-1]["end"] if self.committed_words else 0.0,
+        )
+
+    def _new_words(self, words: list[dict]) -> list[dict]:
+        """
+        Drop words that repeat already committed ones.
+        
+        The window may still contain the tail of committed audio, and the
+        prompt can make Whisper re-emit the last committed words.
+        
+        Args:
+            words: Hypothesis words with stream times
+            
+        Returns:
+            Words that start after the committed region
+        """
+        if not self.committed_words:
+            return words
+        
+        committed_end = self.committed_words[-1]["end"]
+        words = [word for word in words if word["start"] > committed_end - 0.1]
+        
+        # Remove an n-gram that duplicates the committed tail
+        if words and abs(words[0]["start"] - committed_end) < 1.0:
+            committed_tail = [_normalize_word(w["word"]) for w in self.committed_words[-5:]]
+            for n in range(min(len(committed_tail), len(words)), 0, -1):
+                head = [_normalize_word(w["word"]) for w in words[:n]]
+                if head == committed_tail[-n:]:
+                    return words[n:]
+        
+        return words
+
+    def _agreed_prefix(self, words: list[dict]) -> list[dict]:
+        """
+        Longest prefix on which this and the previous hypothesis agree.
+        
+        Args:
+            words: Current hypothesis words
+            
+        Returns:
+            Words to commit
+        """
+        agreed = 0
+        for word, previous in zip(words, self.hypothesis, strict=False):
+            if _normalize_word(word["word"]) != _normalize_word(previous["word"]):
+                break
+            agreed += 1
+        return words[:agreed]
+
+    def _trim_buffer(self, until: float) -> None:
+        """
+        Remove audio before a stream time from the buffer.
+        
+        Args:
+            until: Stream time in seconds
+        """
+        cut = int(round((until - self.buffer_offset) * 16000))
+        cut = max(0, min(cut, len(self.buffer)))
+        
+        if self.features is not None:
+            if cut == len(self.buffer):
+                self.features.reset()
+            else:
+                # Keep mel frames aligned with the buffer: cut on a hop boundary
+                cut -= cut % self.features.hop_length
+                self.features.drop(cut // self.features.hop_length)
+        
+        self.buffer = self.buffer[cut:]
+        self.buffer_offset += cut / 16000
+
+
+def _normalize_word(word: str) -> str:
+    """Normalize a word for hypothesis comparison."""
+    return "".join(char for char in word.lower() if char.isalnum())
+
+
+def _words_from_segments(segments: list[dict], offset: float = 0.0) -> list[dict]:
+    """
+    Flatten result segments into words with stream times.
+    
+    Segments decoded without word timestamps are split on whitespace and
+    their duration is spread over the words by character length.
+    
+    Args:
+        segments: TranscriptionResult segments
+        offset: Stream time of the start of the decoded audio (seconds)
+        
+    Returns:
+        Word dicts (start, end, word, probability)
+    """
+    words = []
+    for segment in segments:
+        if segment.get("words"):
+            words.extend(
+                {
+                    "start": word["start"] + offset,
+                    "end": word["end"] + offset,
+                    "word": word["word"],
+                    "probability": word["probability"],
+                }
+                for word in segment["words"]
+            )
+            continue
+        
+        tokens = segment["text"].split()
+        total_chars = sum(len(token) for token in tokens) or 1
+        duration = segment["end"] - segment["start"]
+        position = segment["start"]
+        for token in tokens:
+            end = position + duration * len(token) / total_chars
+            words.append(
+                {
+                    "start": position + offset,
+                    "end": end + offset,
+                    "word": " " + token,
+                    "probability": segment.get("confidence", 0.0),
+                }
+            )
+            position = end
+    return words
 
 
 # Factory function for easy initialization
-async def create_asr_engine(
+def create_asr_engine(
     model_name: Optional[str] = None,
     device: Optional[str] = None,
     compute_type: Optional[str] = None,
-) -> WhisperEngine:
+    pool_size: Optional[int] = None,
+) -> "WhisperEngine | WhisperEnginePool":
     """
     Create and initialize ASR engine with default settings from config.
     
+    Any of model name, device and compute type set to "auto" is resolved by
+    startup calibration; the decision is recorded and reused on the same host.
+    
     Args:
         model_name: Override default model name
         device: Override default device
         compute_type: Override default compute type
+        pool_size: Override default number of replicas (settings.ASR_POOL_SIZE)
         
     Returns:
-        Initialized WhisperEngine
+        Initialized WhisperEngine, or a WhisperEnginePool for more than one replica
     """
-    return WhisperEngine(
-        model_name=model_name or settings.WHISPER_MODEL,
-        device=device or settings.WHISPER_DEVICE,
-        compute_type=compute_type or settings.WHISPER_COMPUTE_TYPE,
+    from .pool import WhisperEnginePool
+    
+    model_name = model_name or settings.WHISPER_MODEL
+    device = device or settings.WHISPER_DEVICE
+    compute_type = compute_type or settings.WHISPER_COMPUTE_TYPE
+    
+    # Settings left on "auto" are chosen by benchmarking this host
+    if "auto" in (model_name, device, compute_type):
+        from .calibration import calibrate
+        
+        decision = calibrate(
+            model_name=None if model_name == "auto" else model_name,
+            device=None if device == "auto" else device,
+            compute_type=None if compute_type == "auto" else compute_type,
+        )
+        model_name, device, compute_type = (
+            decision.model_name,
+            decision.device,
+            decision.compute_type,
+        )
+    
+    pool_size = pool_size or settings.ASR_POOL_SIZE
+    engine_kwargs = dict(
+        model_name=model_name,
+        device=device,
+        compute_type=compute_type,
         download_root=settings.MODELS_DIR / "whisper",
+        cpu_threads=settings.ASR_CPU_THREADS,
+        num_workers=settings.ASR_NUM_WORKERS,
     )
+    
+    if pool_size <= 1:
+        return WhisperEngine(**engine_kwargs)
+    return WhisperEnginePool.create(pool_size, **engine_kwargs)
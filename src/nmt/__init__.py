@@ -1,5 +1,11 @@
 """NMT (Neural Machine Translation) module."""
 
 from .nllb_engine import NLLBEngine, create_nmt_engine
+from .streaming import StreamingTranslationResult, StreamingTranslator
 
-__all__ = ["NLLBEngine", "create_nmt_engine"]
+__all__ = [
+    "NLLBEngine",
+    "create_nmt_engine",
+    "StreamingTranslator",
+    "StreamingTranslationResult",
+]
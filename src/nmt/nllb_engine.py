@@ -1,21 +1,43 @@
 """Neural Machine Translation engine using Meta's NLLB-200 model."""
 
 import asyncio
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import torch
 from pydantic import BaseModel, Field
-from transformers import (
-    AutoModelForSeq2SeqLM,
-    AutoTokenizer,
-    NllbTokenizer,
-)
 
+from ..utils.artifacts import resolve_bundle
 from ..utils.config import settings
+from ..utils.decoding import DecodingConfig, DecodingProfile, resolve_decoding
 from ..utils.logging import get_logger
+from .optimization import (
+    benchmark,
+    compile_model,
+    configure_threads,
+    quantize_linear_layers,
+)
+from .vocab import PrunedVocabulary
+
+if TYPE_CHECKING:
+    import torch
 
 logger = get_logger(__name__)
 
+# ISO 639-1 codes served by the pipeline mapped to NLLB codes
+LANGUAGE_CODES: dict[str, str] = {
+    "en": "eng_Latn",
+    "es": "spa_Latn",
+    "fr": "fra_Latn",
+    "de": "deu_Latn",
+    "zh": "zho_Hans",
+    "ja": "jpn_Jpan",
+    "ko": "kor_Hang",
+    "ar": "arb_Arab",
+    "hi": "hin_Deva",
+    "pt": "por_Latn",
+    "ru": "rus_Cyrl",
+    "it": "ita_Latn",
+}
+
 
 class TranslationResult(BaseModel):
     """Translation result with metadata."""
@@ -39,7 +61,10 @@ class NLLBEngine:
     """
     Neural Machine Translation using Meta's NLLB-200 model.
     
-    Supports 200 languages with state-of-the-art quality.
+    Supports 200 languages with state-of-the-art quality. If ``model_name``
+    points to a directory produced by ``scripts/prune_nmt_vocab.py``, the
+    pruned vocabulary mapping is loaded and token IDs are translated between
+    the full tokenizer and the reduced embedding/LM head.
     """
 
     def __init__(
@@ -47,6 +72,10 @@ class NLLBEngine:
         model_name: str = settings.NMT_MODEL,
         device: str = settings.NMT_DEVICE,
         max_length: int = settings.NMT_MAX_LENGTH,
+        optimize: bool = settings.NMT_OPTIMIZE,
+        num_threads: int = settings.NMT_NUM_THREADS,
+        compile: bool = settings.NMT_COMPILE,
+        attn_implementation: str | None = settings.NMT_ATTN_IMPLEMENTATION,
     ):
         """
         Initialize NLLB translation engine.
@@ -55,29 +84,248 @@ class NLLBEngine:
             model_name: HuggingFace model identifier
             device: Device for inference ('cuda' or 'cpu')
             max_length: Maximum translation length
+            optimize: Apply dynamic INT8 quantization on CPU (kept only if faster)
+            num_threads: Torch intra-op thread count (0 keeps the default)
+            compile: Also wrap the optimized model in torch.compile
+            attn_implementation: Attention backend passed to transformers (e.g. 'sdpa')
         """
         self.model_name = model_name
         self.device = device
         self.max_length = max_length
+        self.optimization: dict[str, Any] = {"enabled": False}
+        self.pending_requests = 0  # Queue depth seen by adaptive decoding
+
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, NllbTokenizer
 
         logger.info("Loading NLLB model", model=model_name, device=device)
 
+        configure_threads(num_threads)
+
         # Load tokenizer and model
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model_kwargs = {}
+        if attn_implementation is not None:
+            model_kwargs["attn_implementation"] = attn_implementation
+
+        # Bundled safetensors weights are memory-mapped and kept in their stored dtype
+        source = model_name
+        bundle = resolve_bundle("nllb", model_name)
+        if bundle is not None:
+            source = str(bundle)
+            model_kwargs["torch_dtype"] = "auto"
+
+        self.tokenizer = AutoTokenizer.from_pretrained(source)
+        self.model = AutoModelForSeq2SeqLM.from_pretrained(source, **model_kwargs)
+        # NLLB tokenizers take the source language as tokenizer state
+        self._nllb_tokenizer = isinstance(self.tokenizer, NllbTokenizer)
+
+        self.vocab: PrunedVocabulary | None = None
+        if PrunedVocabulary.exists(source):
+            self.vocab = PrunedVocabulary.load(source)
+            logger.info(
+                "Loaded pruned vocabulary",
+                size=len(self.vocab),
+                languages=self.vocab.languages,
+            )
 
         # Move to device
-        if device == "cuda" and torch.cuda.is_available():
+        if self._on_gpu:
             self.model = self.model.cuda()
             logger.info("Model loaded on GPU", gpu_name=torch.cuda.get_device_name(0))
         else:
-            self.model = self.model.cpu()
+            # Half-precision bundles are built for GPUs; CPU kernels want float32
+            self.model = self.model.cpu().float()
             logger.info("Model loaded on CPU")
 
         # Set to eval mode
         self.model.eval()
 
-        logger.info("NLLB engine ready")
+        if optimize:
+            if self._on_gpu:
+                logger.info("Skipping CPU optimizations, model is on GPU")
+            else:
+                self._optimize_for_cpu(compile=compile)
+
+        logger.info("NLLB engine ready", optimization=self.optimization)
+
+    @property
+    def _on_gpu(self) -> bool:
+        """Whether inference runs on CUDA."""
+        import torch
+
+        return self.device == "cuda" and torch.cuda.is_available()
+
+    def _optimize_for_cpu(self, compile: bool = False) -> None:
+        """
+        Quantize (and optionally compile) the model, keeping it only if faster.
+        
+        A short translation is benchmarked on the baseline and the optimized
+        model; if the speedup is below ``settings.NMT_MIN_SPEEDUP`` the
+        baseline model is restored.
+        
+        Args:
+            compile: Wrap the quantized model in torch.compile
+        """
+        sample = self.tokenizer(
+            "The meeting has been moved to Thursday afternoon.",
+            return_tensors="pt",
+        )
+        target_lang = "spa_Latn"
+
+        baseline = self.model
+        baseline_ms = benchmark(lambda: self._generate(sample, target_lang, self.max_length))
+
+        try:
+            candidate = quantize_linear_layers(baseline)
+            if compile:
+                candidate = compile_model(candidate)
+
+            self.model = candidate
+            optimized_ms = benchmark(
+                lambda: self._generate(sample, target_lang, self.max_length)
+            )
+        except Exception as e:
+            logger.warning("CPU optimization failed, using baseline model", error=str(e))
+            self.model = baseline
+            return
+
+        speedup = baseline_ms / optimized_ms if optimized_ms > 0 else 0.0
+        self.optimization = {
+            "enabled": speedup >= settings.NMT_MIN_SPEEDUP,
+            "quantized": True,
+            "compiled": compile,
+            "baseline_ms": round(baseline_ms, 2),
+            "optimized_ms": round(optimized_ms, 2),
+            "speedup": round(speedup, 2),
+        }
+
+        if self.optimization["enabled"]:
+            logger.info("Using optimized CPU model", **self.optimization)
+        else:
+            logger.warning(
+                "Optimized model not fast enough, falling back to baseline",
+                **self.optimization,
+            )
+            self.model = baseline
+
+    def _generate(
+        self,
+        inputs: dict[str, "torch.Tensor"],
+        target_lang: str,
+        max_length: int,
+        num_beams: int = 5,
+        decoder_prefix: list[int] | None = None,
+    ) -> "torch.Tensor":
+        """
+        Run generation for tokenized inputs.
+        
+        Args:
+            inputs: Tokenizer output (input_ids, attention_mask)
+            target_lang: Target language code (e.g., 'spa_Latn')
+            max_length: Maximum output length
+            num_beams: Beam width (1 = greedy)
+            decoder_prefix: Target token IDs to force before decoding continues
+            
+        Returns:
+            Generated token IDs (in the full tokenizer's ID space)
+        """
+        import torch
+
+        inputs = dict(inputs)
+        forced_bos_token_id = self.tokenizer.lang_code_to_id[target_lang]
+        decoder_prefix = list(decoder_prefix or [])
+
+        # Map into the pruned vocabulary
+        if self.vocab is not None:
+            inputs["input_ids"] = self.vocab.to_pruned(inputs["input_ids"])
+            forced_bos_token_id = self.vocab.to_pruned_id(forced_bos_token_id)
+            decoder_prefix = [self.vocab.to_pruned_id(t) for t in decoder_prefix]
+
+        generate_kwargs: dict[str, Any] = {"forced_bos_token_id": forced_bos_token_id}
+        if decoder_prefix:
+            # The language tag is part of the forced prefix, so no forced BOS is needed
+            start_token_id = self.model.generation_config.decoder_start_token_id
+            prefix = [start_token_id, forced_bos_token_id, *decoder_prefix]
+            batch_size = inputs["input_ids"].shape[0]
+            generate_kwargs = {
+                "decoder_input_ids": torch.tensor([prefix] * batch_size, dtype=torch.long),
+            }
+
+        # Move to device
+        if self._on_gpu:
+            inputs = {k: v.cuda() for k, v in inputs.items()}
+            generate_kwargs = {
+                k: v.cuda() if isinstance(v, torch.Tensor) else v
+                for k, v in generate_kwargs.items()
+            }
+
+        with torch.inference_mode():
+            generated_tokens = self.model.generate(
+                **inputs,
+                **generate_kwargs,
+                max_length=max_length,
+                num_beams=num_beams,
+                early_stopping=num_beams > 1,
+            )
+
+        if self.vocab is not None:
+            generated_tokens = self.vocab.to_original(generated_tokens)
+
+        return generated_tokens
+
+    def continue_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        prefix_ids: list[int],
+        num_beams: int = 1,
+        max_length: int | None = None,
+    ) -> list[int]:
+        """
+        Translate text while forcing an already-committed target prefix.
+        
+        The prefix is fed to the decoder in a single forward pass and only the
+        continuation is searched, which is what makes incremental streaming
+        retranslation cheap.
+        
+        Args:
+            text: Full source text (committed + new words)
+            source_lang: Source language code
+            target_lang: Target language code
+            prefix_ids: Committed target token IDs (without special tokens)
+            num_beams: Beam width for the continuation
+            max_length: Maximum output length
+            
+        Returns:
+            Target token IDs (prefix + continuation, without special tokens)
+        """
+        max_length = max_length or self.max_length
+
+        if self._nllb_tokenizer:
+            self.tokenizer.src_lang = source_lang
+
+        inputs = self.tokenizer(
+            text,
+            return_tensors="pt",
+            truncation=True,
+            max_length=max_length,
+        )
+        generated_tokens = self._generate(
+            inputs,
+            target_lang,
+            max_length,
+            num_beams=num_beams,
+            decoder_prefix=prefix_ids,
+        )
+
+        # Drop decoder start, language tag and trailing EOS/padding
+        special_ids = set(self.tokenizer.all_special_ids)
+        return [
+            int(token_id)
+            for token_id in generated_tokens[0].tolist()
+            if token_id not in special_ids
+        ]
 
     def translate(
         self,
@@ -85,6 +333,7 @@ class NLLBEngine:
         source_lang: str,
         target_lang: str,
         max_length: int | None = None,
+        decoding: DecodingProfile | str | None = None,
     ) -> TranslationResult:
         """
         Translate text from source to target language.
@@ -94,6 +343,7 @@ class NLLBEngine:
             source_lang: Source language code (e.g., 'eng_Latn')
             target_lang: Target language code (e.g., 'spa_Latn')
             max_length: Maximum output length (uses default if None)
+            decoding: Decoding profile (uses settings.DECODING_PROFILE if None)
             
         Returns:
             TranslationResult with translation and metadata
@@ -108,7 +358,7 @@ class NLLBEngine:
         )
 
         # Set source language
-        if isinstance(self.tokenizer, NllbTokenizer):
+        if self._nllb_tokenizer:
             self.tokenizer.src_lang = source_lang
 
         # Tokenize
@@ -120,19 +370,14 @@ class NLLBEngine:
             max_length=max_length,
         )
 
-        # Move to device
-        if self.device == "cuda" and torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
-
         # Generate translation
-        with torch.no_grad():
-            generated_tokens = self.model.generate(
-                **inputs,
-                forced_bos_token_id=self.tokenizer.lang_code_to_id[target_lang],
-                max_length=max_length,
-                num_beams=5,
-                early_stopping=True,
-            )
+        decoding_config = self._resolve_decoding(decoding, inputs["input_ids"])
+        generated_tokens = self._generate(
+            inputs,
+            target_lang,
+            max_length,
+            num_beams=decoding_config.beam_size,
+        )
 
         # Decode
         translated_text = self.tokenizer.batch_decode(
@@ -158,6 +403,7 @@ class NLLBEngine:
             metadata={
                 "input_length": len(text),
                 "output_length": len(translated_text),
+                **decoding_config.as_metadata(),
             },
         )
 
@@ -167,6 +413,7 @@ class NLLBEngine:
         source_lang: str,
         target_lang: str,
         max_length: int | None = None,
+        decoding: DecodingProfile | str | None = None,
     ) -> TranslationResult:
         """
         Async translation wrapper.
@@ -176,19 +423,25 @@ class NLLBEngine:
             source_lang: Source language code
             target_lang: Target language code
             max_length: Maximum output length
+            decoding: Decoding profile
             
         Returns:
             TranslationResult
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.translate,
-            text,
-            source_lang,
-            target_lang,
-            max_length,
-        )
+        self.pending_requests += 1
+        try:
+            return await loop.run_in_executor(
+                None,
+                self.translate,
+                text,
+                source_lang,
+                target_lang,
+                max_length,
+                decoding,
+            )
+        finally:
+            self.pending_requests -= 1
 
     def translate_batch(
         self,
@@ -196,6 +449,7 @@ class NLLBEngine:
         source_lang: str,
         target_lang: str,
         max_length: int | None = None,
+        decoding: DecodingProfile | str | None = None,
     ) -> list[TranslationResult]:
         """
         Translate multiple texts in batch.
@@ -205,6 +459,7 @@ class NLLBEngine:
             source_lang: Source language code
             target_lang: Target language code
             max_length: Maximum output length
+            decoding: Decoding profile (uses settings.DECODING_PROFILE if None)
             
         Returns:
             List of TranslationResults
@@ -219,7 +474,7 @@ class NLLBEngine:
         )
 
         # Set source language
-        if isinstance(self.tokenizer, NllbTokenizer):
+        if self._nllb_tokenizer:
             self.tokenizer.src_lang = source_lang
 
         # Tokenize batch
@@ -231,19 +486,14 @@ class NLLBEngine:
             max_length=max_length,
         )
 
-        # Move to device
-        if self.device == "cuda" and torch.cuda.is_available():
-            inputs = {k: v.cuda() for k, v in inputs.items()}
-
         # Generate translations
-        with torch.no_grad():
-            generated_tokens = self.model.generate(
-                **inputs,
-                forced_bos_token_id=self.tokenizer.lang_code_to_id[target_lang],
-                max_length=max_length,
-                num_beams=5,
-                early_stopping=True,
-            )
+        decoding_config = self._resolve_decoding(decoding, inputs["input_ids"])
+        generated_tokens = self._generate(
+            inputs,
+            target_lang,
+            max_length,
+            num_beams=decoding_config.beam_size,
+        )
 
         # Decode all
         translated_texts = self.tokenizer.batch_decode(
@@ -265,6 +515,7 @@ class NLLBEngine:
                     metadata={
                         "input_length": len(texts[i]),
                         "output_length": len(translated_text),
+                        **decoding_config.as_metadata(),
                     },
                 )
             )
@@ -272,7 +523,28 @@ class NLLBEngine:
         logger.debug("Batch translation complete", count=len(results))
         return results
 
-    def _calculate_confidence(self, tokens: torch.Tensor) -> float:
+    def _resolve_decoding(
+        self,
+        decoding: DecodingProfile | str | None,
+        input_ids: "torch.Tensor",
+    ) -> DecodingConfig:
+        """
+        Resolve a decoding profile against the current load and input size.
+        
+        Args:
+            decoding: Requested profile
+            input_ids: Tokenized source (batch, length)
+            
+        Returns:
+            DecodingConfig
+        """
+        return resolve_decoding(
+            decoding,
+            queue_depth=self.pending_requests,
+            long_input=input_ids.shape[-1] >= settings.ADAPTIVE_LONG_TEXT_TOKENS,
+        )
+
+    def _calculate_confidence(self, tokens: "torch.Tensor") -> float:
         """
         Calculate translation confidence from generated tokens.
         
@@ -293,7 +565,9 @@ class NLLBEngine:
         Returns:
             List of NLLB language codes
         """
-        if isinstance(self.tokenizer, NllbTokenizer):
+        if self.vocab is not None and self.vocab.languages:
+            return list(self.vocab.languages)
+        if self._nllb_tokenizer:
             return list(self.tokenizer.lang_code_to_id.keys())
         return []
 
@@ -0,0 +1,191 @@
+"""Incremental streaming retranslation with committed-prefix reuse."""
+
+import asyncio
+import time
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ..utils.decoding import DecodingProfile, resolve_decoding
+from ..utils.logging import get_logger
+from .nllb_engine import NLLBEngine
+
+logger = get_logger(__name__)
+
+# SentencePiece marks the start of a word with this character
+WORD_BOUNDARY = "▁"
+
+
+class StreamingTranslationResult(BaseModel):
+    """Incremental translation of a growing source hypothesis."""
+
+    text: str = Field(description="Full current translation")
+    stable_text: str = Field(description="Committed part that will not change")
+    unstable_text: str = Field(description="Tail that may still be revised")
+    new_text: str = Field(default="", description="Target text committed by this update")
+    source_text: str = Field(description="Source text that was translated")
+    source_lang: str = Field(description="Source language code")
+    target_lang: str = Field(description="Target language code")
+    committed_tokens: int = Field(description="Number of committed target tokens")
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Additional metadata",
+    )
+    processing_time_ms: float = Field(description="Time spent on this update (ms)")
+
+
+class StreamingTranslator:
+    """
+    Per-session streaming translator.
+
+    Each update retranslates the current source hypothesis with the committed
+    target prefix forced into the decoder, so only the continuation is
+    searched. A target token is committed once two consecutive hypotheses
+    agree on it (local agreement), and commits always end on a word boundary
+    so captions change at word granularity.
+    """
+
+    def __init__(
+        self,
+        engine: NLLBEngine,
+        source_lang: str,
+        target_lang: str,
+        decoding: DecodingProfile | str = DecodingProfile.GREEDY,
+    ):
+        """
+        Initialize streaming translator.
+
+        Args:
+            engine: NLLB engine used for decoding
+            source_lang: Source language code (NLLB format)
+            target_lang: Target language code (NLLB format)
+            decoding: Decoding profile for continuations
+        """
+        self.engine = engine
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.decoding = DecodingProfile(decoding)
+
+        self.committed_ids: list[int] = []
+        self.previous_ids: list[int] = []
+        self.source_text = ""
+
+    def update(self, source_text: str, final: bool = False) -> StreamingTranslationResult:
+        """
+        Translate the latest source hypothesis.
+
+        Args:
+            source_text: Current full source text of the segment
+            final: Commit the whole translation (end of segment)
+
+        Returns:
+            StreamingTranslationResult with stable and unstable spans
+        """
+        start_time = time.time()
+        self.source_text = source_text
+        previously_committed = len(self.committed_ids)
+
+        decoding_config = resolve_decoding(
+            self.decoding,
+            queue_depth=self.engine.pending_requests,
+        )
+
+        if source_text.strip():
+            hypothesis = self.engine.continue_translation(
+                source_text,
+                self.source_lang,
+                self.target_lang,
+                prefix_ids=self.committed_ids,
+                num_beams=decoding_config.beam_size,
+            )
+        else:
+            hypothesis = list(self.committed_ids)
+
+        if final:
+            self.committed_ids = hypothesis
+        else:
+            self.committed_ids = self._agreed_prefix(hypothesis)
+        self.previous_ids = hypothesis
+
+        stable_text = self._decode(self.committed_ids)
+        text = self._decode(hypothesis)
+        if text.startswith(stable_text):
+            unstable_text = text[len(stable_text):].strip()
+        else:
+            unstable_text = self._decode(hypothesis[len(self.committed_ids):])
+
+        result = StreamingTranslationResult(
+            text=text,
+            stable_text=stable_text,
+            unstable_text=unstable_text,
+            new_text=self._decode(self.committed_ids[previously_committed:]),
+            source_text=source_text,
+            source_lang=self.source_lang,
+            target_lang=self.target_lang,
+            committed_tokens=len(self.committed_ids),
+            metadata=decoding_config.as_metadata(),
+            processing_time_ms=(time.time() - start_time) * 1000,
+        )
+
+        logger.debug(
+            "Streaming translation update",
+            committed_tokens=result.committed_tokens,
+            unstable_length=len(unstable_text),
+            latency_ms=result.processing_time_ms,
+        )
+
+        return result
+
+    async def update_async(
+        self,
+        source_text: str,
+        final: bool = False,
+    ) -> StreamingTranslationResult:
+        """
+        Async update wrapper.
+
+        Args:
+            source_text: Current full source text of the segment
+            final: Commit the whole translation
+
+        Returns:
+            StreamingTranslationResult
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.update, source_text, final)
+
+    def reset(self) -> None:
+        """Start a new segment, discarding committed state."""
+        self.committed_ids = []
+        self.previous_ids = []
+        self.source_text = ""
+
+    def _agreed_prefix(self, hypothesis: list[int]) -> list[int]:
+        """
+        Extend the committed prefix with tokens both hypotheses agree on.
+
+        Args:
+            hypothesis: Current target token IDs
+
+        Returns:
+            New committed prefix, cut back to the last word boundary
+        """
+        committed = len(self.committed_ids)
+        agreed = committed
+        limit = min(len(hypothesis), len(self.previous_ids))
+        while agreed < limit and hypothesis[agreed] == self.previous_ids[agreed]:
+            agreed += 1
+
+        # Never commit half a word: the next uncommitted token must start one.
+        # The last word stays open since a longer source may still extend it.
+        tokens = self.engine.tokenizer.convert_ids_to_tokens(hypothesis)
+        while agreed > committed:
+            if agreed < len(hypothesis) and tokens[agreed].startswith(WORD_BOUNDARY):
+                break
+            agreed -= 1
+
+        return hypothesis[:agreed]
+
+    def _decode(self, token_ids: list[int]) -> str:
+        """Decode target token IDs to text."""
+        return self.engine.tokenizer.decode(token_ids, skip_special_tokens=True).strip()
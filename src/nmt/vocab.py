@@ -0,0 +1,261 @@
+"""Vocabulary pruning for NLLB restricted to a deployed language subset."""
+
+import json
+import unicodedata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from ..utils.logging import get_logger
+
+if TYPE_CHECKING:
+    import torch
+
+logger = get_logger(__name__)
+
+VOCAB_MAP_FILE = "vocab_map.json"
+
+# Unicode ranges for letters and marks of each NLLB script suffix.
+# Punctuation, symbols, digits and separators are script-neutral and always kept.
+SCRIPT_RANGES: dict[str, list[tuple[int, int]]] = {
+    "Latn": [(0x0041, 0x024F), (0x1E00, 0x1EFF), (0x2C60, 0x2C7F), (0xA720, 0xA7FF)],
+    "Cyrl": [(0x0400, 0x052F), (0x1C80, 0x1C8F), (0x2DE0, 0x2DFF), (0xA640, 0xA69F)],
+    "Arab": [(0x0600, 0x06FF), (0x0750, 0x077F), (0x08A0, 0x08FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)],
+    "Deva": [(0x0900, 0x097F), (0xA8E0, 0xA8FF)],
+    "Hans": [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)],
+    "Hant": [(0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)],
+    "Jpan": [(0x3040, 0x30FF), (0x31F0, 0x31FF), (0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xFF66, 0xFF9F)],
+    "Hang": [(0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF), (0x4E00, 0x9FFF)],
+}
+
+# Combining marks shared across scripts (accents written as separate code points)
+_COMMON_MARKS = [(0x0300, 0x036F)]
+
+
+class PrunedVocabulary:
+    """
+    Mapping between the full NLLB vocabulary and a pruned subset.
+
+    Kept IDs are sorted, so the special tokens at the start of the vocabulary
+    (<s>, <pad>, </s>, <unk>) keep their IDs in the pruned model.
+    """
+
+    def __init__(
+        self,
+        kept_ids: Iterable[int],
+        full_vocab_size: int,
+        unk_token_id: int,
+        languages: list[str] | None = None,
+    ):
+        """
+        Initialize vocabulary mapping.
+
+        Args:
+            kept_ids: Original token IDs kept in the pruned vocabulary
+            full_vocab_size: Size of the original vocabulary
+            unk_token_id: Original ID of the unknown token
+            languages: NLLB language codes the vocabulary was built for
+        """
+        import torch
+
+        self.kept_ids = torch.tensor(sorted(set(kept_ids)), dtype=torch.long)
+        self.full_vocab_size = full_vocab_size
+        self.unk_token_id = unk_token_id
+        self.languages = languages or []
+
+        # Original ID -> pruned ID, with dropped tokens falling back to <unk>
+        self._to_pruned = torch.full((full_vocab_size,), -1, dtype=torch.long)
+        self._to_pruned[self.kept_ids] = torch.arange(len(self.kept_ids))
+        self._to_pruned[self._to_pruned < 0] = self._to_pruned[unk_token_id]
+
+    def __len__(self) -> int:
+        return len(self.kept_ids)
+
+    def to_pruned(self, token_ids: "torch.Tensor") -> "torch.Tensor":
+        """Map original token IDs to pruned IDs."""
+        return self._to_pruned.to(token_ids.device)[token_ids]
+
+    def to_original(self, token_ids: "torch.Tensor") -> "torch.Tensor":
+        """Map pruned token IDs back to original IDs."""
+        return self.kept_ids.to(token_ids.device)[token_ids]
+
+    def to_pruned_id(self, token_id: int) -> int:
+        """Map a single original token ID to its pruned ID."""
+        return int(self._to_pruned[token_id])
+
+    def save(self, directory: str | Path) -> Path:
+        """
+        Save the mapping next to a pruned model.
+
+        Args:
+            directory: Model directory
+
+        Returns:
+            Path to the written mapping file
+        """
+        path = Path(directory) / VOCAB_MAP_FILE
+        path.write_text(
+            json.dumps(
+                {
+                    "full_vocab_size": self.full_vocab_size,
+                    "unk_token_id": self.unk_token_id,
+                    "languages": self.languages,
+                    "kept_ids": self.kept_ids.tolist(),
+                }
+            )
+        )
+        return path
+
+    @classmethod
+    def load(cls, directory: str | Path) -> "PrunedVocabulary":
+        """
+        Load the mapping saved with a pruned model.
+
+        Args:
+            directory: Model directory
+
+        Returns:
+            PrunedVocabulary
+        """
+        data = json.loads((Path(directory) / VOCAB_MAP_FILE).read_text())
+        return cls(
+            kept_ids=data["kept_ids"],
+            full_vocab_size=data["full_vocab_size"],
+            unk_token_id=data["unk_token_id"],
+            languages=data.get("languages"),
+        )
+
+    @staticmethod
+    def exists(directory: str | Path) -> bool:
+        """Whether a directory holds a pruned model mapping."""
+        return (Path(directory) / VOCAB_MAP_FILE).is_file()
+
+
+def _allowed_ranges(languages: list[str]) -> list[tuple[int, int]]:
+    """Collect letter ranges for the scripts used by the given languages."""
+    ranges = list(_COMMON_MARKS)
+    for lang in languages:
+        script = lang.split("_")[-1]
+        if script not in SCRIPT_RANGES:
+            raise ValueError(f"No script ranges known for language '{lang}'")
+        ranges.extend(SCRIPT_RANGES[script])
+    return ranges
+
+
+def _token_in_scripts(token: str, ranges: list[tuple[int, int]]) -> bool:
+    """Check that every letter/mark in a token belongs to an allowed script."""
+    for char in token.replace("▁", ""):
+        category = unicodedata.category(char)
+        if category[0] not in ("L", "M"):
+            continue
+        code = ord(char)
+        if not any(start <= code <= end for start, end in ranges):
+            return False
+    return True
+
+
+def select_tokens(
+    tokenizer: Any,
+    languages: list[str],
+    corpus: Iterable[str] | None = None,
+) -> list[int]:
+    """
+    Select the token IDs needed for a language subset.
+
+    A token is kept if all of its letters belong to a script used by one of
+    the languages. Tokens produced by tokenizing the optional corpus are
+    always kept, so rare mixed-script pieces seen in real traffic survive.
+
+    Args:
+        tokenizer: NLLB tokenizer for the full model
+        languages: NLLB language codes to keep (e.g., ['eng_Latn', 'spa_Latn'])
+        corpus: Optional sample texts in the deployed languages
+
+    Returns:
+        Sorted list of original token IDs
+    """
+    ranges = _allowed_ranges(languages)
+    language_ids = set(tokenizer.convert_tokens_to_ids(languages))
+    all_language_ids = set(tokenizer.lang_code_to_id.values())
+
+    kept = {
+        tokenizer.bos_token_id,
+        tokenizer.pad_token_id,
+        tokenizer.eos_token_id,
+        tokenizer.unk_token_id,
+    }
+    kept |= language_ids
+    if tokenizer.mask_token_id is not None:
+        kept.add(tokenizer.mask_token_id)
+
+    tokens = tokenizer.convert_ids_to_tokens(list(range(len(tokenizer))))
+    for token_id, token in enumerate(tokens):
+        if token_id in all_language_ids or token_id in kept:
+            continue
+        if _token_in_scripts(token, ranges):
+            kept.add(token_id)
+
+    if corpus is not None:
+        for text in corpus:
+            kept.update(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+    logger.info(
+        "Selected pruned vocabulary",
+        languages=languages,
+        kept=len(kept),
+        full=len(tokenizer),
+    )
+    return sorted(kept)
+
+
+def prune_model(model: "torch.nn.Module", vocab: PrunedVocabulary) -> "torch.nn.Module":
+    """
+    Shrink the shared embedding and LM head to the pruned vocabulary in place.
+
+    Args:
+        model: NLLB (M2M100) seq2seq model
+        vocab: Pruned vocabulary mapping
+
+    Returns:
+        The pruned model
+    """
+    import torch
+
+    kept = vocab.kept_ids
+    embeddings = model.get_input_embeddings()
+    lm_head = model.get_output_embeddings()
+    padding_idx = embeddings.padding_idx
+    if padding_idx is not None:
+        padding_idx = vocab.to_pruned_id(padding_idx)
+
+    # set_input_embeddings points model.shared and the encoder's and decoder's
+    # embed_tokens at the new module; resizing the shared module alone would leave
+    # them holding the full table. Newer transformers scale inside the embedding.
+    if hasattr(embeddings, "embed_scale"):
+        pruned = type(embeddings)(
+            len(kept), embeddings.embedding_dim, padding_idx, embed_scale=embeddings.embed_scale
+        )
+    else:
+        pruned = torch.nn.Embedding(len(kept), embeddings.embedding_dim, padding_idx)
+    pruned.weight = torch.nn.Parameter(embeddings.weight.data[kept].clone())
+    model.set_input_embeddings(pruned)
+
+    if lm_head is not None:
+        head = torch.nn.Linear(lm_head.in_features, len(kept), bias=lm_head.bias is not None)
+        head.weight = torch.nn.Parameter(lm_head.weight.data[kept].clone())
+        if lm_head.bias is not None:
+            head.bias = torch.nn.Parameter(lm_head.bias.data[kept].clone())
+        model.set_output_embeddings(head)
+
+    if hasattr(model, "final_logits_bias"):
+        model.final_logits_bias = model.final_logits_bias[:, kept].clone()
+
+    model.config.vocab_size = len(kept)
+    # Re-ties the LM head to the pruned embedding when the config shares them
+    model.tie_weights()
+    for config in (model.config, model.generation_config):
+        for attr in ("bos_token_id", "pad_token_id", "eos_token_id", "decoder_start_token_id"):
+            token_id = getattr(config, attr, None)
+            if isinstance(token_id, int):
+                setattr(config, attr, vocab.to_pruned_id(token_id))
+
+    return model
@@ -1,5 +1,6 @@
 """Orchestration module for pipeline management."""
 
+from .models import ModelManager
 from .pipeline import TranslationPipeline, create_pipeline
 
-__all__ = ["TranslationPipeline", "create_pipeline"]
+__all__ = ["TranslationPipeline", "create_pipeline", "ModelManager"]
@@ -0,0 +1,545 @@
+"""Model residency: engines loaded on demand and evicted within a memory budget."""
+
+import asyncio
+import gc
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal
+
+from pydantic import BaseModel, Field
+
+from ..utils.artifacts import MANIFEST_FILE, bundle_path, load_manifest
+from ..utils.config import settings
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ModelKind = Literal["asr", "nmt", "tts"]
+
+# Bundle kind of each pipeline stage's models
+BUNDLE_KINDS = {"asr": "whisper", "nmt": "nllb", "tts": "xtts"}
+
+
+class ModelInfo(BaseModel):
+    """Residency state of a registered model."""
+
+    kind: str = Field(description="Pipeline stage (asr, nmt, tts)")
+    name: str = Field(description="Model name")
+    default: bool = Field(description="Used when a request names no model")
+    loaded: bool = Field(description="Currently resident")
+    pinned: bool = Field(description="Never evicted")
+    in_use: int = Field(description="Leases held by running requests and sessions")
+    footprint_bytes: int = Field(description="Measured (or estimated) resident memory")
+    idle_s: float | None = Field(description="Seconds since last use (None if never used)")
+    loads: int = Field(description="Times the model was loaded")
+    retired: bool = Field(
+        default=False,
+        description="Replaced by a swap; released when its last lease ends",
+    )
+
+
+class SwapStatus(BaseModel):
+    """Progress of a model swap."""
+
+    kind: str = Field(description="Pipeline stage (asr, nmt, tts)")
+    model: str = Field(description="Model being swapped in")
+    state: Literal["loading", "warming", "serving", "failed"]
+    error: str | None = Field(default=None, description="Why the swap failed")
+    started_at: float = Field(description="Unix time the swap started")
+    finished_at: float | None = Field(default=None, description="Unix time it finished")
+
+
+class _Slot:
+    """A registered model: how to load it and its current residency."""
+
+    def __init__(self, kind: str, name: str, factory: Callable[[], Any] | None, pinned: bool):
+        self.kind = kind
+        self.name = name
+        self.factory = factory
+        self.pinned = pinned
+
+        self.engine: Any = None
+        self.footprint = 0
+        self.leases = 0
+        self.last_used: float | None = None
+        self.loads = 0
+        self.loading: asyncio.Task | None = None
+        self.retired = False
+
+    @property
+    def evictable(self) -> bool:
+        """Loaded, not pinned, not in use and not being loaded."""
+        return (
+            self.engine is not None
+            and not self.pinned
+            and self.leases == 0
+            and self.loading is None
+        )
+
+
+class ModelManager:
+    """
+    Keeps pipeline engines resident within a memory budget.
+
+    Each model variant is registered with a factory and loaded on first use.
+    Callers hold a lease while they use an engine (``async with
+    manager.use("asr", "small") as engine``), so models serving a request
+    or streaming session are never evicted under it. Concurrent requests for
+    a model that is not loaded share one load. Loads run one at a time:
+    before each, least-recently-used idle models are unloaded until the
+    expected footprint fits in the budget, and the footprint is then
+    measured as the growth of the process's resident memory. Models idle
+    longer than ``idle_timeout_s`` are unloaded by a background task.
+
+    ``swap`` replaces a model blue/green: the new engine loads and warms up
+    beside the old one, new leases switch to it at once, and the old engine
+    is released when the last lease on it ends.
+    """
+
+    def __init__(
+        self,
+        budget_gb: float = settings.MODEL_MEMORY_BUDGET_GB,
+        idle_timeout_s: float = settings.MODEL_IDLE_TIMEOUT_S,
+    ):
+        """
+        Initialize manager.
+
+        Args:
+            budget_gb: Memory the loaded models may take together (0 = unlimited)
+            idle_timeout_s: Unload models unused this long (0 = never)
+        """
+        self.budget_bytes = int(budget_gb * 1024**3)
+        self.idle_timeout_s = idle_timeout_s
+
+        self._slots: dict[tuple[str, str], _Slot] = {}
+        self._defaults: dict[str, str] = {}
+        self._load_lock: asyncio.Lock | None = None
+        self._unload_hooks: list[Callable[[str, Any], Awaitable[None]]] = []
+        self._reaper: asyncio.Task | None = None
+
+        # Slots holding memory outside the registry: models being swapped in, and
+        # replaced ones still serving leases
+        self._detached: list[_Slot] = []
+        self._swaps: dict[str, SwapStatus] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def register(
+        self,
+        kind: ModelKind,
+        name: str,
+        factory: Callable[[], Any],
+        default: bool = False,
+        pinned: bool = False,
+    ) -> None:
+        """
+        Register a model variant to load on demand.
+
+        Args:
+            kind: Pipeline stage the model serves
+            name: Model name requests select it by
+            factory: Loads and returns the engine (runs in a worker thread)
+            default: Serve requests that name no model (the first registered one otherwise)
+            pinned: Never evict once loaded
+        """
+        self._slots[(kind, name)] = _Slot(kind, name, factory, pinned)
+        if default or kind not in self._defaults:
+            self._defaults[kind] = name
+
+    def add(self, kind: ModelKind, name: str, engine: Any, default: bool = False) -> None:
+        """
+        Register an engine that is already loaded; it stays resident.
+
+        Args:
+            kind: Pipeline stage the engine serves
+            name: Model name requests select it by
+            engine: Loaded engine
+            default: Serve requests that name no model
+        """
+        slot = _Slot(kind, name, None, pinned=True)
+        slot.engine = engine
+        self._slots[(kind, name)] = slot
+        if default or kind not in self._defaults:
+            self._defaults[kind] = name
+
+    def on_unload(self, hook: Callable[[str, Any], Awaitable[None]]) -> None:
+        """
+        Call ``await hook(kind, engine)`` whenever a model is unloaded.
+
+        Lets owners of per-engine helpers (batchers, caches) drop their
+        references, so the engine's memory can actually be freed.
+
+        Args:
+            hook: Async callable taking the model's kind and the unloaded engine
+        """
+        self._unload_hooks.append(hook)
+
+    def default(self, kind: ModelKind) -> str:
+        """Name of the model serving requests that name none."""
+        return self._defaults[kind]
+
+    def names(self, kind: ModelKind) -> list[str]:
+        """Registered model names for a stage."""
+        return [name for slot_kind, name in self._slots if slot_kind == kind]
+
+    @property
+    def resident_bytes(self) -> int:
+        """Footprint of all loaded models, including ones being swapped in or out."""
+        slots = [*self._slots.values(), *self._detached]
+        return sum(slot.footprint for slot in slots if slot.engine is not None)
+
+    @asynccontextmanager
+    async def use(self, kind: ModelKind, name: str | None = None) -> AsyncIterator[Any]:
+        """
+        Lease an engine, loading it first if needed.
+
+        Args:
+            kind: Pipeline stage
+            name: Registered model name (default model if None)
+
+        Yields:
+            The loaded engine, protected from eviction until the block exits
+        """
+        slot = self._slot(kind, name)
+        if self.idle_timeout_s > 0 and self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap())
+
+        slot.leases += 1
+        try:
+            while slot.engine is None:
+                if slot.loading is None:
+                    slot.loading = asyncio.create_task(self._load(slot))
+                # Shielded so a cancelled caller doesn't abort a load others wait on
+                await asyncio.shield(slot.loading)
+            slot.last_used = time.monotonic()
+            yield slot.engine
+        finally:
+            slot.leases -= 1
+            slot.last_used = time.monotonic()
+            if slot.retired and slot.leases == 0:
+                self._spawn(self._release(slot))
+
+    async def unload(self, kind: ModelKind, name: str) -> bool:
+        """
+        Unload a model now if nothing is using it and it isn't pinned.
+
+        Args:
+            kind: Pipeline stage
+            name: Registered model name
+
+        Returns:
+            Whether the model was unloaded
+        """
+        slot = self._slot(kind, name)
+        async with self._lock():
+            if not slot.evictable:
+                return False
+            await self._evict(slot, reason="requested")
+        return True
+
+    async def evict_idle(self) -> list[str]:
+        """
+        Unload models idle longer than the idle timeout.
+
+        Returns:
+            '<kind>/<name>' of the unloaded models
+        """
+        if self.idle_timeout_s <= 0:
+            return []
+
+        now = time.monotonic()
+        evicted = []
+        async with self._lock():
+            # A snapshot, re-checked per slot: each eviction awaits unload hooks, during
+            # which requests can lease models and swaps can change the registry
+            for slot in list(self._slots.values()):
+                if slot.evictable and now - (slot.last_used or 0) >= self.idle_timeout_s:
+                    await self._evict(slot, reason="idle")
+                    evicted.append(f"{slot.kind}/{slot.name}")
+        return evicted
+
+    async def close(self) -> None:
+        """Stop the idle reaper and unload every model that isn't in use."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        async with self._lock():
+            for slot in [*self._slots.values(), *self._detached]:  # Snapshot (see evict_idle)
+                if slot.engine is not None and slot.leases == 0 and slot.loading is None:
+                    await self._evict(slot, reason="shutdown")
+
+    async def swap(
+        self,
+        kind: ModelKind,
+        name: str,
+        factory: Callable[[], Any],
+        warmup: Callable[[Any], Awaitable[None]] | None = None,
+        keep_previous: bool = False,
+    ) -> SwapStatus:
+        """
+        Make ``name`` the default model of a stage without downtime.
+
+        The new engine is loaded and warmed up while the current one keeps
+        serving. Then, in one step, it replaces the current default (and an
+        older version of ``name``, when reloading it): new leases get the new
+        engine, leases already held finish on the old one, and the old engine
+        is released after the last of them ends. If loading or warm-up fails,
+        nothing changes.
+
+        Args:
+            kind: Pipeline stage
+            name: Model to serve by default (the current default's name reloads it)
+            factory: Loads and returns the new engine (runs in a worker thread)
+            warmup: Runs a first request on the new engine before it takes traffic
+            keep_previous: Keep the replaced default registered as a selectable variant
+
+        Returns:
+            SwapStatus of the finished swap
+
+        Raises:
+            RuntimeError: If a swap for this stage is already running
+        """
+        running = self._swaps.get(kind)
+        if running is not None and running.state in ("loading", "warming"):
+            raise RuntimeError(f"A {kind} swap to {running.model!r} is already running")
+
+        status = SwapStatus(kind=kind, model=name, state="loading", started_at=time.time())
+        self._swaps[kind] = status
+        logger.info("Swapping model", kind=kind, model=name)
+
+        current = self._slots.get((kind, self._defaults.get(kind)))
+        previous = self._slots.get((kind, name))
+
+        # Staged outside the registry and leased, so nothing can select or evict it yet
+        green = _Slot(kind, name, factory, pinned=previous.pinned if previous else False)
+        green.footprint = previous.footprint if previous else 0
+        green.leases = 1
+        self._detached.append(green)
+        try:
+            # The models being replaced keep serving, so they must not be evicted for room
+            await self._load(green, keep=(current, previous))
+            status.state = "warming"
+            if warmup is not None:
+                await warmup(green.engine)
+        except Exception as e:
+            status.state, status.error, status.finished_at = "failed", str(e), time.time()
+            logger.error("Model swap failed", kind=kind, model=name, error=str(e))
+            self._detached.remove(green)
+            green.leases = 0
+            if green.engine is not None:
+                await self._evict(green, reason="swap failed")
+            return status
+
+        # Switch; nothing awaits in between, so every new lease sees the new engine
+        self._detached.remove(green)
+        green.leases = 0
+        replaced = [] if previous is None else [previous]
+        if current is not None and current is not previous and not keep_previous:
+            del self._slots[(kind, current.name)]
+            replaced.append(current)
+        self._slots[(kind, name)] = green
+        self._defaults[kind] = name
+        for slot in replaced:
+            self._retire(slot)
+
+        status.state, status.finished_at = "serving", time.time()
+        logger.info(
+            "Model swapped",
+            kind=kind,
+            model=name,
+            replaced=[slot.name for slot in replaced],
+            draining=sum(slot.leases for slot in replaced),
+            swap_s=round(status.finished_at - status.started_at, 1),
+        )
+        return status
+
+    def swaps(self) -> list[SwapStatus]:
+        """Latest swap of each stage."""
+        return list(self._swaps.values())
+
+    def status(self) -> list[ModelInfo]:
+        """Residency of every registered model, and of replaced ones still draining."""
+        now = time.monotonic()
+        retired = [slot for slot in self._detached if slot.retired]
+        return [
+            ModelInfo(
+                kind=slot.kind,
+                name=slot.name,
+                default=self._defaults.get(slot.kind) == slot.name and not slot.retired,
+                loaded=slot.engine is not None,
+                pinned=slot.pinned,
+                in_use=slot.leases,
+                footprint_bytes=slot.footprint,
+                idle_s=None if slot.last_used is None else now - slot.last_used,
+                loads=slot.loads,
+                retired=slot.retired,
+            )
+            for slot in [*self._slots.values(), *retired]
+        ]
+
+    def _slot(self, kind: str, name: str | None) -> _Slot:
+        """Look up a registered model."""
+        name = name or self._defaults.get(kind)
+        slot = self._slots.get((kind, name))
+        if slot is None:
+            raise ValueError(
+                f"Unknown {kind} model {name!r} (available: {', '.join(self.names(kind))})"
+            )
+        return slot
+
+    def _lock(self) -> asyncio.Lock:
+        """Lock serializing loads and evictions (created in the running loop)."""
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        return self._load_lock
+
+    async def _reap(self) -> None:
+        """Unload idle models periodically."""
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout_s / 4))
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.error("Idle model eviction failed", error=str(e), exc_info=True)
+
+    async def _load(self, slot: _Slot, keep: tuple[_Slot | None, ...] = ()) -> None:
+        """Load a model, making room for it first (never by evicting ``keep``)."""
+        try:
+            async with self._lock():
+                # Another caller may have loaded it while this one waited for the lock
+                if slot.engine is not None:
+                    return
+
+                expected = slot.footprint or _estimate_footprint(slot.kind, slot.name)
+                await self._make_room(expected, keep=(slot, *keep))
+
+                logger.info(
+                    "Loading model",
+                    kind=slot.kind,
+                    model=slot.name,
+                    expected_gb=round(expected / 1024**3, 2),
+                )
+                start = time.time()
+                before = _resident_memory()
+                engine = await asyncio.get_running_loop().run_in_executor(None, slot.factory)
+                grown = _resident_memory() - before
+
+                slot.engine = engine
+                slot.footprint = grown if grown > 0 else expected
+                slot.loads += 1
+                slot.last_used = time.monotonic()
+
+                logger.info(
+                    "Model loaded",
+                    kind=slot.kind,
+                    model=slot.name,
+                    footprint_gb=round(slot.footprint / 1024**3, 2),
+                    resident_gb=round(self.resident_bytes / 1024**3, 2),
+                    load_s=round(time.time() - start, 1),
+                )
+
+                # The estimate may have been low; bring the total back within budget
+                await self._make_room(0, keep=(slot, *keep))
+        finally:
+            slot.loading = None
+
+    async def _make_room(self, needed: int, keep: tuple[_Slot | None, ...]) -> None:
+        """Evict idle models, least recently used first, until ``needed`` more bytes fit."""
+        if self.budget_bytes <= 0:
+            return
+
+        while self.resident_bytes + needed > self.budget_bytes:
+            # Chosen afresh each time: while the previous eviction awaited its unload
+            # hooks, a request may have leased what would have been the next candidate
+            candidates = [
+                slot for slot in self._slots.values() if slot.evictable and slot not in keep
+            ]
+            if not candidates:
+                logger.warning(
+                    "Model memory budget exceeded; remaining models are in use or pinned",
+                    resident_gb=round(self.resident_bytes / 1024**3, 2),
+                    needed_gb=round(needed / 1024**3, 2),
+                    budget_gb=round(self.budget_bytes / 1024**3, 2),
+                )
+                return
+            lru = min(candidates, key=lambda slot: slot.last_used or 0)
+            await self._evict(lru, reason="budget")
+
+    async def _evict(self, slot: _Slot, reason: str) -> None:
+        """Drop a model's engine and give its memory back."""
+        logger.info(
+            "Unloading model",
+            kind=slot.kind,
+            model=slot.name,
+            reason=reason,
+            footprint_gb=round(slot.footprint / 1024**3, 2),
+        )
+        engine, slot.engine = slot.engine, None
+        for hook in self._unload_hooks:
+            await hook(slot.kind, engine)
+        del engine
+        _release_memory()
+
+    def _retire(self, slot: _Slot) -> None:
+        """Take a replaced model out of service; it is released once nothing uses it."""
+        slot.retired = True
+        if slot.engine is None and slot.loading is None:
+            return
+        self._detached.append(slot)
+        if slot.leases == 0:
+            self._spawn(self._release(slot))
+
+    async def _release(self, slot: _Slot) -> None:
+        """Unload a replaced model after its last lease."""
+        if slot.loading is not None:
+            await asyncio.wait([slot.loading])
+        if slot in self._detached:
+            self._detached.remove(slot)
+        if slot.engine is not None:
+            await self._evict(slot, reason="replaced")
+
+    def _spawn(self, coroutine: Awaitable[None]) -> None:
+        """Run a coroutine in the background, keeping a reference until it ends."""
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _estimate_footprint(kind: str, name: str) -> int:
+    """Expected footprint of a model never loaded here: its bundle size, or 0 if unknown."""
+    for directory in (Path(name), bundle_path(BUNDLE_KINDS[kind], name)):
+        if (directory / MANIFEST_FILE).is_file():
+            try:
+                return load_manifest(directory).size_bytes
+            except (OSError, ValueError):
+                return 0
+    return 0
+
+
+def _resident_memory() -> int:
+    """Resident set size of this process in bytes (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _release_memory() -> None:
+    """Collect dropped engines and hand freed memory back to the OS and the GPU."""
+    gc.collect()
+
+    # Only if an engine already imported torch; importing it here would cost seconds
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+    # glibc keeps freed heap pages; trim them so the resident size actually drops
+    try:
+        import ctypes
+
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
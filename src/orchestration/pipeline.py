@@ -2,19 +2,48 @@
 
 import asyncio
 import time
+from contextlib import AsyncExitStack
 from enum import Enum
-from typing import AsyncGenerator
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterable, Callable
 
 import numpy as np
 from pydantic import BaseModel, Field
 
-from ..asr.whisper_engine import WhisperEngine, create_asr_engine
-from ..nmt.nllb_engine import NLLBEngine, create_nmt_engine
+from ..asr.language_id import SessionLanguageDetector
+from ..asr.longform import LongFormTranscriber
+from ..asr.pool import WhisperEnginePool
+from ..asr.whisper_engine import (
+    StreamingASR,
+    StreamingTranscriptionResult,
+    TranscriptionResult,
+    WhisperEngine,
+    create_asr_engine,
+)
+from ..nmt.nllb_engine import LANGUAGE_CODES, NLLBEngine, create_nmt_engine
+from ..nmt.streaming import StreamingTranslationResult, StreamingTranslator
+from ..tts.parallel import ParallelSynthesizer
 from ..tts.xtts_engine import XTTSEngine, create_tts_engine
+from ..utils.audio import (
+    AudioArray,
+    AudioFile,
+    StreamingFrontEnd,
+    resample_audio,
+)
+from ..utils.config import settings
+from ..utils.decoding import DecodingProfile
 from ..utils.logging import get_logger
+from .models import ModelKind, ModelManager, SwapStatus
 
 logger = get_logger(__name__)
 
+# Source language value that asks ASR to detect the language
+AUTO_LANGUAGE = "auto"
+
+# Committed source text ending in one of these closes a streaming translation segment
+SENTENCE_ENDINGS = (".", "?", "!", "。", "？", "！", "؟", "।")
+
 
 class PipelineStage(str, Enum):
     """Pipeline processing stages."""
@@ -24,35 +53,79 @@ class PipelineStage(str, Enum):
     TTS = "tts"
 
 
+class RoutePlan(BaseModel):
+    """Cheapest valid sequence of stages for a request."""
+
+    stages: list[str] = Field(description="Stages to run, e.g. ['asr', 'nmt', 'tts']")
+    asr_task: str = Field(default="transcribe", description="Whisper task")
+
+    @property
+    def name(self) -> str:
+        """Route identifier, e.g. 'asr+nmt+tts'."""
+        return "+".join(self.stages)
+
+    @property
+    def run_nmt(self) -> bool:
+        """Whether the NMT stage runs."""
+        return PipelineStage.NMT.value in self.stages
+
+    @property
+    def run_tts(self) -> bool:
+        """Whether the TTS stage runs."""
+        return PipelineStage.TTS.value in self.stages
+
+
 class TranslationRequest(BaseModel):
     """Request for translation pipeline."""
 
-    audio: list[float] = Field(description="Input audio waveform")
+    audio: AudioArray = Field(description="Input audio waveform (float32)")
     sample_rate: int = Field(default=16000, description="Sample rate (Hz)")
-    source_lang: str = Field(description="Source language code")
+    source_lang: str = Field(description="Source language code ('auto' to detect)")
     target_lang: str = Field(description="Target language code")
     speaker_wav: str | None = Field(
         default=None,
         description="Reference audio for voice cloning",
     )
+    decoding_profile: DecodingProfile | None = Field(
+        default=None,
+        description="ASR/NMT decoding profile (server default if None)",
+    )
+    output_audio: bool = Field(
+        default=True,
+        description="Synthesize translated speech (False = text only)",
+    )
+    output_sample_rate: int | None = Field(
+        default=None,
+        description="Resample translated speech to this rate (TTS native rate if None)",
+    )
+    asr_model: str | None = Field(default=None, description="Whisper model (default if None)")
+    nmt_model: str | None = Field(default=None, description="NMT model (default if None)")
+    tts_model: str | None = Field(default=None, description="TTS model (default if None)")
 
 
 class TranslationResponse(BaseModel):
     """Response from translation pipeline."""
 
-    audio: list[float] = Field(description="Translated audio waveform")
-    sample_rate: int = Field(description="Output sample rate (Hz)")
-    transcription: str = Field(description="Source language transcription")
+    audio: AudioArray = Field(description="Translated audio waveform (float32)")
+    sample_rate: int = Field(description="Output sample rate (Hz, 0 without audio)")
+    transcription: str = Field(
+        description="Source language transcription (empty when ASR translates directly)"
+    )
     translation: str = Field(description="Target language translation")
     source_lang: str = Field(description="Source language")
     target_lang: str = Field(description="Target language")
     latency_ms: float = Field(description="Total latency (ms)")
+    route: str = Field(description="Stages that ran, e.g. 'asr_translate+tts'")
     stage_latencies: dict[str, float] = Field(
         description="Per-stage latencies (ms)"
     )
     confidences: dict[str, float] = Field(
         description="Confidence scores per stage"
     )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Per-stage metadata (decoding profile, ...)",
+    )
 
 
 class TranslationPipeline:
@@ -64,27 +137,121 @@ class TranslationPipeline:
 
     def __init__(
         self,
-        asr_engine: WhisperEngine | None = None,
+        asr_engine: WhisperEngine | WhisperEnginePool | None = None,
         nmt_engine: NLLBEngine | None = None,
         tts_engine: XTTSEngine | None = None,
+        models: ModelManager | None = None,
     ):
         """
         Initialize translation pipeline.
         
+        Engines passed in stay resident. Otherwise the configured models and
+        their variants are registered with the model manager, which loads them
+        on first use and may unload them to stay within the memory budget.
+        
         Args:
-            asr_engine: Speech recognition engine
+            asr_engine: Speech recognition engine or replica pool
             nmt_engine: Translation engine
             tts_engine: Speech synthesis engine
+            models: Model manager (a new one with settings' budget if None)
         """
         logger.info("Initializing translation pipeline")
 
-        # Initialize engines
-        self.asr_engine = asr_engine or create_asr_engine()
-        self.nmt_engine = nmt_engine or create_nmt_engine()
-        self.tts_engine = tts_engine or create_tts_engine()
+        self.models = models or ModelManager()
+        self._register_models(asr_engine, nmt_engine, tts_engine)
+
+        # Long outputs are rendered sentence-parallel in worker processes
+        self.tts_parallel = ParallelSynthesizer() if settings.TTS_WORKERS > 0 else None
 
         logger.info("Translation pipeline ready")
 
+    def _register_models(
+        self,
+        asr_engine: WhisperEngine | WhisperEnginePool | None,
+        nmt_engine: NLLBEngine | None,
+        tts_engine: XTTSEngine | None,
+    ) -> None:
+        """Register given engines as resident and configured models as loadable."""
+        asr_models = [settings.WHISPER_MODEL, *settings.WHISPER_MODEL_VARIANTS]
+        nmt_models = [settings.NMT_MODEL, *settings.NMT_MODEL_VARIANTS]
+        tts_models = [settings.TTS_MODEL, *settings.TTS_MODEL_VARIANTS]
+
+        for kind, engine, names in [
+            ("asr", asr_engine, asr_models),
+            ("nmt", nmt_engine, nmt_models),
+            ("tts", tts_engine, tts_models),
+        ]:
+            if engine is not None:
+                self.models.add(kind, engine.model_name, engine, default=True)
+            elif not self.models.names(kind):
+                # The first name is the default
+                for name in dict.fromkeys(names):
+                    self.models.register(kind, name, self._model_factory(kind, name))
+
+    def _model_factory(self, kind: ModelKind, name: str) -> Callable[[], Any]:
+        """Loader of a stage's engine for a model name."""
+        factory = {
+            "asr": create_asr_engine,
+            "nmt": create_nmt_engine,
+            "tts": create_tts_engine,
+        }[kind]
+        return partial(factory, model_name=name)
+
+    async def swap_model(
+        self,
+        kind: ModelKind,
+        name: str,
+        keep_previous: bool = False,
+    ) -> SwapStatus:
+        """
+        Switch a stage to another model (or a new version of the same one) without downtime.
+        
+        The new engine loads and answers a warm-up request while the current
+        one keeps serving; requests and sessions already running finish on the
+        old engine, which is released when they are done.
+        
+        Args:
+            kind: Pipeline stage ('asr', 'nmt' or 'tts')
+            name: Model to serve by default from now on
+            keep_previous: Keep the replaced model selectable as a variant
+            
+        Returns:
+            SwapStatus of the finished swap
+        """
+        return await self.models.swap(
+            kind,
+            name,
+            self._model_factory(kind, name),
+            warmup=partial(self._warm_up, kind),
+            keep_previous=keep_previous,
+        )
+
+    async def close(self) -> None:
+        """Unload idle models and stop the TTS worker processes."""
+        await self.models.close()
+        if self.tts_parallel is not None:
+            # Waits for the workers to exit, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.tts_parallel.shutdown)
+
+    async def _warm_up(self, kind: ModelKind, engine: Any) -> None:
+        """Run a short request through a new engine (first calls allocate buffers and caches)."""
+        if kind == "asr":
+            # Language detection runs the encoder and decoder even on silence, which
+            # transcription would skip at the VAD gate. A pool warms every replica, since
+            # its own calls would reach only the next one in rotation.
+            silence = np.zeros(16000, dtype=np.float32)
+            replicas = getattr(engine, "engines", [engine])
+            await asyncio.gather(*(replica.detect_language_async(silence) for replica in replicas))
+        elif kind == "nmt":
+            await engine.translate_async(
+                "Hello, how are you?",
+                source_lang=LANGUAGE_CODES["en"],
+                target_lang=LANGUAGE_CODES["es"],
+            )
+        else:
+            await engine.synthesize_async("Hello, how are you?", language="en")
+
     async def translate(
         self,
         request: TranslationRequest,
@@ -99,110 +266,390 @@ class TranslationPipeline:
             TranslationResponse with translated audio and metadata
         """
         start_time = time.time()
-        stage_latencies = {}
-        confidences = {}
 
-        # Convert audio to numpy array
-        audio_array = np.array(request.audio, dtype=np.float32)
+        # Validated into a float32 array already; no copy here
+        audio_array = request.audio
+        if request.sample_rate != 16000:
+            audio_array = resample_audio(audio_array, request.sample_rate, 16000)
+        plan = self.plan_route(request.source_lang, request.target_lang, request.output_audio)
 
         logger.info(
             "Starting translation",
             source_lang=request.source_lang,
             target_lang=request.target_lang,
-            audio_duration=len(audio_array) / request.sample_rate,
+            audio_duration=len(audio_array) / 16000,
+            route=plan.name,
         )
 
-        # Stage 1: ASR (Speech to Text)
-        asr_start = time.time()
-        asr_result = await self.asr_engine.transcribe_async(
-            audio_array,
-            language=request.source_lang,
-        )
-        stage_latencies["asr"] = (time.time() - asr_start) * 1000
-        confidences["asr"] = asr_result.confidence
+        # Stage 1: ASR (Speech to Text, or straight to English text); long
+        # recordings are split at silences and the chunks decoded in parallel
+        async with self.models.use("asr", request.asr_model) as asr_engine:
+            if len(audio_array) / 16000 >= settings.ASR_LONGFORM_MIN_S:
+                asr = LongFormTranscriber(asr_engine).transcribe
+            else:
+                asr = asr_engine.transcribe
+            asr_result = await asr(
+                audio_array,
+                source_language=self._to_whisper_language(request.source_lang),
+                task=plan.asr_task,
+                decoding=request.decoding_profile,
+            )
 
-        logger.info(
-            "ASR complete",
-            text=asr_result.text,
-            latency_ms=stage_latencies["asr"],
+        return await self._translate_transcript(
+            asr_result,
+            plan,
+            source_lang=request.source_lang,
+            target_lang=request.target_lang,
+            decoding_profile=request.decoding_profile,
+            speaker_wav=request.speaker_wav,
+            output_sample_rate=request.output_sample_rate,
+            nmt_model=request.nmt_model,
+            tts_model=request.tts_model,
+            start_time=start_time,
         )
 
-        # Stage 2: NMT (Text Translation)
-        nmt_start = time.time()
+    async def translate_file(
+        self,
+        path: str | Path,
+        source_lang: str,
+        target_lang: str,
+        speaker_wav: str | None = None,
+        decoding_profile: DecodingProfile | None = None,
+        output_audio: bool = True,
+        output_sample_rate: int | None = None,
+        asr_model: str | None = None,
+        nmt_model: str | None = None,
+        tts_model: str | None = None,
+    ) -> TranslationResponse:
+        """
+        Translate an audio file without loading it whole.
         
-        # Convert language codes to NLLB format if needed
-        nllb_source = self._to_nllb_code(request.source_lang)
-        nllb_target = self._to_nllb_code(request.target_lang)
+        WAV files are memory-mapped and other formats decoded by range, so
+        long recordings start decoding right away and memory stays bounded
+        by the chunks in flight.
         
-        nmt_result = await self.nmt_engine.translate_async(
-            asr_result.text,
-            source_lang=nllb_source,
-            target_lang=nllb_target,
-        )
-        stage_latencies["nmt"] = (time.time() - nmt_start) * 1000
-        confidences["nmt"] = nmt_result.confidence
+        Args:
+            path: Audio file path
+            source_lang: Source language code ('auto' to detect)
+            target_lang: Target language code
+            speaker_wav: Reference audio for voice cloning
+            decoding_profile: ASR/NMT decoding profile (server default if None)
+            output_audio: Synthesize translated speech (False = text only)
+            output_sample_rate: Rate for the synthesized audio (TTS native rate if None)
+            asr_model: Whisper model (default if None)
+            nmt_model: NMT model (default if None)
+            tts_model: TTS model (default if None)
+            
+        Returns:
+            TranslationResponse with translated audio and metadata
+        """
+        start_time = time.time()
+        audio_file = AudioFile(path, sample_rate=16000)
+        plan = self.plan_route(source_lang, target_lang, output_audio)
 
         logger.info(
-            "NMT complete",
-            translation=nmt_result.text,
-            latency_ms=stage_latencies["nmt"],
+            "Starting file translation",
+            path=str(path),
+            source_lang=source_lang,
+            target_lang=target_lang,
+            audio_duration=audio_file.duration,
+            memory_mapped=audio_file.memory_mapped,
+            route=plan.name,
         )
 
-        # Stage 3: TTS (Text to Speech)
-        tts_start = time.time()
+        try:
+            async with self.models.use("asr", asr_model) as asr_engine:
+                if audio_file.duration >= settings.ASR_LONGFORM_MIN_S:
+                    asr_result = await LongFormTranscriber(asr_engine).transcribe(
+                        audio_file,
+                        source_language=self._to_whisper_language(source_lang),
+                        task=plan.asr_task,
+                        decoding=decoding_profile,
+                    )
+                else:
+                    asr_result = await asr_engine.transcribe(
+                        audio_file[:],
+                        source_language=self._to_whisper_language(source_lang),
+                        task=plan.asr_task,
+                        decoding=decoding_profile,
+                    )
+        finally:
+            audio_file.close()
+
+        return await self._translate_transcript(
+            asr_result,
+            plan,
+            source_lang=source_lang,
+            target_lang=target_lang,
+            decoding_profile=decoding_profile,
+            speaker_wav=speaker_wav,
+            output_sample_rate=output_sample_rate,
+            nmt_model=nmt_model,
+            tts_model=tts_model,
+            start_time=start_time,
+        )
+
+    async def _translate_transcript(
+        self,
+        asr_result: TranscriptionResult,
+        plan: RoutePlan,
+        source_lang: str,
+        target_lang: str,
+        decoding_profile: DecodingProfile | None = None,
+        speaker_wav: str | None = None,
+        output_sample_rate: int | None = None,
+        nmt_model: str | None = None,
+        tts_model: str | None = None,
+        start_time: float | None = None,
+        translator: StreamingTranslator | None = None,
+        end_segment: bool = False,
+    ) -> TranslationResponse:
+        """
+        Run the NMT and TTS stages of a route on an ASR result.
         
-        # Convert NLLB code to TTS language
-        tts_lang = self._to_tts_code(request.target_lang)
+        With a streaming ``translator``, the ASR text extends the session's
+        open segment and the response carries only newly committed translation.
         
-        tts_result = await self.tts_engine.synthesize_async(
-            nmt_result.text,
-            language=tts_lang,
-            speaker_wav=request.speaker_wav,
-        )
-        stage_latencies["tts"] = (time.time() - tts_start) * 1000
+        Args:
+            asr_result: Output of the ASR stage
+            plan: Route chosen for the request
+            source_lang: Source language code
+            target_lang: Target language code
+            decoding_profile: NMT decoding profile
+            speaker_wav: Reference audio for voice cloning
+            output_sample_rate: Rate for the synthesized audio (TTS native rate if None)
+            nmt_model: NMT model (default if None)
+            tts_model: TTS model (default if None)
+            start_time: time.time() when the request started (for total latency)
+            translator: Streaming session translator (None translates the text on its own)
+            end_segment: Commit the open segment's whole translation (end of stream)
+            
+        Returns:
+            TranslationResponse
+        """
+        asr_stage = plan.stages[0]
+        if start_time is None:
+            start_time = time.time() - asr_result.processing_time_ms / 1000
+        stage_latencies = {asr_stage: asr_result.processing_time_ms}
+        confidences = {"asr": asr_result.confidence}
+        metadata = {"asr": asr_result.metadata}
 
         logger.info(
-            "TTS complete",
-            audio_duration=len(tts_result.audio) / tts_result.sample_rate,
-            latency_ms=stage_latencies["tts"],
+            "ASR complete",
+            text=asr_result.text,
+            task=plan.asr_task,
+            latency_ms=stage_latencies[asr_stage],
         )
 
+        transcription = asr_result.text if plan.asr_task == "transcribe" else ""
+        translation = asr_result.text
+
+        # Stage 2: NMT (Text Translation); nothing to do if ASR found no speech,
+        # unless a streaming segment still has translation to commit
+        segment_open = translator is not None and end_segment and bool(translator.source_text)
+        if plan.run_nmt and (asr_result.text.strip() or segment_open):
+            nmt_start = time.time()
+
+            # Convert language codes to NLLB format if needed
+            if source_lang == AUTO_LANGUAGE:
+                nllb_source = self._to_nllb_code(asr_result.language)
+            else:
+                nllb_source = self._to_nllb_code(source_lang)
+            nllb_target = self._to_nllb_code(target_lang)
+
+            if translator is not None:
+                nmt_result = await self._translate_segment(
+                    translator, asr_result.text, nllb_source, end_segment
+                )
+                translation = nmt_result.new_text
+            else:
+                async with self.models.use("nmt", nmt_model) as nmt_engine:
+                    nmt_result = await nmt_engine.translate_async(
+                        asr_result.text,
+                        source_lang=nllb_source,
+                        target_lang=nllb_target,
+                        decoding=decoding_profile,
+                    )
+                confidences["nmt"] = nmt_result.confidence
+                translation = nmt_result.text
+            stage_latencies["nmt"] = (time.time() - nmt_start) * 1000
+            metadata["nmt"] = nmt_result.metadata
+
+            logger.info(
+                "NMT complete",
+                translation=translation,
+                latency_ms=stage_latencies["nmt"],
+            )
+
+        # Stage 3: TTS (Text to Speech)
+        audio = np.zeros(0, dtype=np.float32)
+        audio_sample_rate = 0
+        if plan.run_tts and translation.strip():
+            tts_start = time.time()
+
+            # Convert NLLB code to TTS language
+            tts_lang = self._to_tts_code(target_lang)
+            tts_model = tts_model or self.models.default("tts")
+
+            async with AsyncExitStack() as stack:
+                if (
+                    self.tts_parallel is not None
+                    and tts_model == self.tts_parallel.model_name
+                    and len(translation) >= settings.TTS_PARALLEL_MIN_CHARS
+                ):
+                    # Worker processes hold their own models
+                    synthesize = self.tts_parallel.synthesize
+                else:
+                    tts_engine = await stack.enter_async_context(
+                        self.models.use("tts", tts_model)
+                    )
+                    synthesize = tts_engine.synthesize_async
+                tts_result = await synthesize(
+                    translation,
+                    language=tts_lang,
+                    speaker_wav=speaker_wav,
+                )
+            audio = tts_result.audio
+            audio_sample_rate = output_sample_rate or tts_result.sample_rate
+            if audio_sample_rate != tts_result.sample_rate:
+                audio = resample_audio(audio, tts_result.sample_rate, audio_sample_rate)
+            stage_latencies["tts"] = (time.time() - tts_start) * 1000
+
+            logger.info(
+                "TTS complete",
+                audio_duration=len(tts_result.audio) / tts_result.sample_rate,
+                latency_ms=stage_latencies["tts"],
+            )
+
         # Calculate total latency
         total_latency = (time.time() - start_time) * 1000
 
         logger.info(
             "Translation complete",
             total_latency_ms=total_latency,
+            route=plan.name,
             stages=stage_latencies,
         )
 
         return TranslationResponse(
-            audio=tts_result.audio,
-            sample_rate=tts_result.sample_rate,
-            transcription=asr_result.text,
-            translation=nmt_result.text,
-            source_lang=request.source_lang,
-            target_lang=request.target_lang,
+            audio=audio,
+            sample_rate=audio_sample_rate,
+            transcription=transcription,
+            translation=translation,
+            source_lang=source_lang,
+            target_lang=target_lang,
             latency_ms=total_latency,
+            route=plan.name,
             stage_latencies=stage_latencies,
             confidences=confidences,
+            metadata=metadata,
+        )
+
+    async def _translate_segment(
+        self,
+        translator: StreamingTranslator,
+        text: str,
+        source_lang: str,
+        end_segment: bool,
+    ) -> StreamingTranslationResult:
+        """
+        Extend a streaming session's open segment with newly committed source text.
+        
+        The segment's whole source is retranslated with the committed target
+        forced as a prefix. A segment closes, committing its translation, at the
+        end of a sentence, at STREAMING_NMT_MAX_SOURCE_CHARS or at end of stream.
+        
+        Args:
+            translator: The session's streaming translator
+            text: Newly committed source text
+            source_lang: Source language (NLLB code)
+            end_segment: Close the segment regardless of its text
+            
+        Returns:
+            StreamingTranslationResult; ``new_text`` is the translation to emit
+        """
+        if source_lang != translator.source_lang:
+            # Detected language changed: the open segment can't be continued
+            translator.reset()
+            translator.source_lang = source_lang
+
+        source_text = f"{translator.source_text} {text}".strip()
+        end_segment = (
+            end_segment
+            or source_text.endswith(SENTENCE_ENDINGS)
+            or len(source_text) >= settings.STREAMING_NMT_MAX_SOURCE_CHARS
         )
+        result = await translator.update_async(source_text, final=end_segment)
+        if end_segment:
+            translator.reset()
+        return result
+
+    def plan_route(
+        self,
+        source_lang: str,
+        target_lang: str,
+        output_audio: bool = True,
+    ) -> RoutePlan:
+        """
+        Pick the cheapest valid path for a request or streaming session.
+        
+        - Same source and target language: NMT is skipped (passthrough).
+        - Target is English: Whisper's translate task replaces ASR + NMT.
+        - Text-only requests skip TTS.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            output_audio: Whether translated speech is wanted
+            
+        Returns:
+            RoutePlan with the stages to run
+        """
+        source = self._to_nllb_code(source_lang)
+        target = self._to_nllb_code(target_lang)
+
+        if source == target:
+            stages, asr_task = [PipelineStage.ASR.value], "transcribe"
+        elif target == LANGUAGE_CODES["en"] and settings.PIPELINE_WHISPER_TRANSLATE:
+            stages, asr_task = ["asr_translate"], "translate"
+        else:
+            stages, asr_task = [PipelineStage.ASR.value, PipelineStage.NMT.value], "transcribe"
+
+        if output_audio:
+            stages.append(PipelineStage.TTS.value)
+
+        return RoutePlan(stages=stages, asr_task=asr_task)
 
     async def translate_streaming(
         self,
-        audio_chunks: AsyncGenerator[bytes, None],
+        audio_chunks: AsyncIterable[bytes | np.ndarray],
         source_lang: str,
         target_lang: str,
         sample_rate: int = 16000,
+        decoding_profile: DecodingProfile | None = None,
+        output_audio: bool = True,
+        output_sample_rate: int | None = None,
+        sample_format: str = "f32le",
+        asr_model: str | None = None,
+        nmt_model: str | None = None,
+        tts_model: str | None = None,
     ) -> AsyncGenerator[TranslationResponse, None]:
         """
         Streaming translation for real-time audio.
         
         Args:
-            audio_chunks: Async generator of audio chunks
+            audio_chunks: Raw PCM chunks (bytes) or decoded blocks (arrays)
             source_lang: Source language code
             target_lang: Target language code
             sample_rate: Audio sample rate
+            decoding_profile: Decoding profile for this session
+                (uses settings.STREAMING_DECODING_PROFILE if None)
+            output_audio: Synthesize translated speech (False = captions only)
+            output_sample_rate: Rate for the synthesized audio (TTS native rate if None)
+            sample_format: Encoding of raw PCM chunks ('f32le' or 's16le')
+            asr_model: Whisper model, kept loaded for the session (default if None)
+            nmt_model: NMT model (default if None)
+            tts_model: TTS model (default if None)
             
         Yields:
             TranslationResponse for each processed segment
@@ -213,41 +660,96 @@ class TranslationPipeline:
             target_lang=target_lang,
         )
 
-        # This is a simplified streaming implementation
-        # In production, implement proper VAD and chunking
-        buffer = []
-
-        async for chunk in audio_chunks:
-            # Convert bytes to audio
-            audio_array = np.frombuffer(chunk, dtype=np.float32)
-            buffer.extend(audio_array.tolist())
+        decoding_profile = decoding_profile or DecodingProfile(
+            settings.STREAMING_DECODING_PROFILE
+        )
+        plan = self.plan_route(source_lang, target_lang, output_audio)
+        source_language = self._to_whisper_language(source_lang)
+
+        # Per-session preprocessing (format, resampling, high-pass, gain control),
+        # stateful so chunk boundaries leave no trace
+        front_end = StreamingFrontEnd(
+            input_rate=sample_rate,
+            input_format=sample_format,
+            highpass_hz=settings.STREAM_HIGHPASS_HZ,
+            agc_target_db=settings.STREAM_AGC_TARGET_DB if settings.STREAM_AGC else None,
+            agc_max_gain_db=settings.STREAM_AGC_MAX_GAIN_DB,
+            agc_gate_snr_db=settings.STREAM_AGC_GATE_SNR_DB,
+        )
 
-            # Process when buffer reaches threshold (e.g., 2 seconds)
-            if len(buffer) >= sample_rate * 2:
-                request = TranslationRequest(
-                    audio=buffer,
-                    sample_rate=sample_rate,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
+        async def session_audio() -> AsyncGenerator[np.ndarray, None]:
+            async for chunk in audio_chunks:
+                yield front_end.process(chunk)
+            yield front_end.flush()
+
+        # The session keeps its Whisper (and NMT) model resident until it ends
+        async with AsyncExitStack() as stack:
+            asr_engine = await stack.enter_async_context(self.models.use("asr", asr_model))
+
+            # One translator per session: each committed ASR fragment extends the
+            # open segment, whose committed translation prefix is reused
+            translator = None
+            if plan.run_nmt:
+                nmt_engine = await stack.enter_async_context(self.models.use("nmt", nmt_model))
+                translator = StreamingTranslator(
+                    nmt_engine,
+                    source_lang=self._to_nllb_code(source_lang),
+                    target_lang=self._to_nllb_code(target_lang),
+                    decoding=decoding_profile,
                 )
 
-                response = await self.translate(request)
-                yield response
+            # Without a source language, detect it once per session and re-detect only on drift
+            language_detector = None
+            if source_language is None:
+                language_detector = SessionLanguageDetector(asr_engine)
+
+            # Words are committed once consecutive decodes agree, so each
+            # response carries only new, stable text
+            streaming_asr = StreamingASR(
+                asr_engine,
+                decoding=decoding_profile,
+                task=plan.asr_task,
+                language_detector=language_detector,
+            )
 
-                # Clear buffer
-                buffer = []
+            async for audio_array in session_audio():
+                asr_result = await streaming_asr.process_chunk(audio_array, source_language)
+                if asr_result is None or not asr_result.text:
+                    continue
 
-        # Process remaining buffer
-        if buffer:
-            request = TranslationRequest(
-                audio=buffer,
-                sample_rate=sample_rate,
-                source_lang=source_lang,
-                target_lang=target_lang,
-            )
+                yield await self._translate_transcript(
+                    asr_result,
+                    plan,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    output_sample_rate=output_sample_rate,
+                    nmt_model=nmt_model,
+                    tts_model=tts_model,
+                    translator=translator,
+                )
 
-            response = await self.translate(request)
-            yield response
+            # Commit and translate whatever is left in the buffer and the open segment
+            asr_result = await streaming_asr.flush(source_language)
+            segment_open = translator is not None and bool(translator.source_text)
+            if asr_result is None and segment_open:
+                asr_result = StreamingTranscriptionResult(
+                    text="",
+                    language=translator.source_lang,
+                    confidence=0.0,
+                    processing_time_ms=0.0,
+                )
+            if asr_result is not None and (asr_result.text or segment_open):
+                yield await self._translate_transcript(
+                    asr_result,
+                    plan,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    output_sample_rate=output_sample_rate,
+                    nmt_model=nmt_model,
+                    tts_model=tts_model,
+                    translator=translator,
+                    end_segment=True,
+                )
 
     def _to_nllb_code(self, lang_code: str) -> str:
         """
@@ -259,24 +761,37 @@ class TranslationPipeline:
         Returns:
             NLLB language code (e.g., 'eng_Latn', 'spa_Latn')
         """
-        # Map common codes to NLLB format
-        nllb_map = {
-            "en": "eng_Latn",
-            "es": "spa_Latn",
-            "fr": "fra_Latn",
-            "de": "deu_Latn",
-            "zh": "zho_Hans",
-            "ja": "jpn_Jpan",
-            "ko": "kor_Hang",
-            "ar": "arb_Arab",
-            "hi": "hin_Deva",
-            "pt": "por_Latn",
-            "ru": "rus_Cyrl",
-            "it": "ita_Latn",
-        }
-
         # Return mapped or original if already in NLLB format
-        return nllb_map.get(lang_code, lang_code)
+        return LANGUAGE_CODES.get(lang_code, lang_code)
+
+    def _to_iso_code(self, lang_code: str) -> str:
+        """
+        Convert language code to the ISO 639-1 code Whisper expects.
+        
+        Args:
+            lang_code: Input language code (ISO 639-1 or NLLB)
+            
+        Returns:
+            ISO 639-1 language code (e.g., 'en', 'es')
+        """
+        for iso_code, nllb_code in LANGUAGE_CODES.items():
+            if lang_code == nllb_code:
+                return iso_code
+        return lang_code
+
+    def _to_whisper_language(self, lang_code: str) -> str | None:
+        """
+        Convert a request source language to Whisper's argument.
+        
+        Args:
+            lang_code: Source language code, or 'auto'
+            
+        Returns:
+            ISO 639-1 code, or None to let Whisper detect the language
+        """
+        if lang_code == AUTO_LANGUAGE:
+            return None
+        return self._to_iso_code(lang_code)
 
     def _to_tts_code(self, lang_code: str) -> str:
         """
@@ -317,9 +832,10 @@ class TranslationPipeline:
 
 
 def create_pipeline(
-    asr_engine: WhisperEngine | None = None,
+    asr_engine: WhisperEngine | WhisperEnginePool | None = None,
     nmt_engine: NLLBEngine | None = None,
     tts_engine: XTTSEngine | None = None,
+    models: ModelManager | None = None,
 ) -> TranslationPipeline:
     """
     Factory function to create translation pipeline.
@@ -328,6 +844,7 @@ def create_pipeline(
         asr_engine: Custom ASR engine (optional)
         nmt_engine: Custom NMT engine (optional)
         tts_engine: Custom TTS engine (optional)
+        models: Model manager (optional)
         
     Returns:
         Initialized TranslationPipeline
@@ -336,4 +853,5 @@ def create_pipeline(
         asr_engine=asr_engine,
         nmt_engine=nmt_engine,
         tts_engine=tts_engine,
+        models=models,
     )
@@ -1,5 +1,6 @@
 """TTS (Text-to-Speech) module."""
 
+from .parallel import ParallelSynthesizer
 from .xtts_engine import XTTSEngine, create_tts_engine
 
-__all__ = ["XTTSEngine", "create_tts_engine"]
+__all__ = ["XTTSEngine", "ParallelSynthesizer", "create_tts_engine"]
@@ -0,0 +1,220 @@
+"""Sentence-parallel synthesis of long texts across TTS worker processes."""
+
+import asyncio
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..utils.audio import crossfade_concat
+from ..utils.config import settings
+from ..utils.logging import get_logger
+from .xtts_engine import SynthesisResult, XTTSEngine
+
+logger = get_logger(__name__)
+
+# Sentence ends: Latin punctuation followed by whitespace, or CJK full stops
+SENTENCE_END = re.compile(r"(?<=[.!?;])\s+|(?<=[。！？；])")
+
+# Engine loaded once in each worker process
+_worker_engine: XTTSEngine | None = None
+
+
+def split_sentences(text: str, min_chars: int = 20) -> list[str]:
+    """
+    Split text into sentences for independent synthesis.
+
+    Args:
+        text: Text to split
+        min_chars: Fragments shorter than this are merged into the next sentence
+
+    Returns:
+        Sentences, in order
+    """
+    sentences: list[str] = []
+    pending = ""
+    for part in SENTENCE_END.split(text):
+        part = part.strip()
+        if not part:
+            continue
+        pending = _join(pending, part)
+        if len(pending) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+
+    if pending:
+        if sentences:
+            sentences[-1] = _join(sentences[-1], pending)
+        else:
+            sentences.append(pending)
+    return sentences
+
+
+def _join(first: str, second: str) -> str:
+    """Join sentence fragments; CJK text takes no space."""
+    if not first:
+        return second
+    separator = "" if first[-1] in "。！？；" else " "
+    return f"{first}{separator}{second}"
+
+
+def _init_worker(model_name: str, device: str, num_threads: int) -> None:
+    """Load the TTS model in a worker process."""
+    global _worker_engine
+    import torch
+
+    torch.set_num_threads(num_threads)
+    _worker_engine = XTTSEngine(model_name=model_name, device=device)
+
+
+def _worker_conditioning(
+    speaker: str | None,
+    speaker_wav: str | None,
+) -> tuple[Any, Any] | None:
+    """Compute voice conditioning in a worker, on CPU so it can be sent to the others."""
+    conditioning = _worker_engine.voice_conditioning(speaker, speaker_wav)
+    if conditioning is None:
+        return None
+    return tuple(tensor.cpu() for tensor in conditioning)
+
+
+def _worker_render(
+    text: str,
+    language: str,
+    speaker: str | None,
+    speaker_wav: str | None,
+    conditioning: tuple[Any, Any] | None,
+) -> tuple[np.ndarray, int]:
+    """Render one sentence in a worker."""
+    result = _worker_engine.synthesize(
+        text,
+        language,
+        speaker,
+        speaker_wav,
+        conditioning=conditioning,
+    )
+    return result.audio, result.sample_rate
+
+
+class ParallelSynthesizer:
+    """
+    Renders long texts sentence by sentence across TTS worker processes.
+
+    Each worker process loads its own model, so sentences synthesize truly
+    in parallel (no GIL, no shared model state). Voice conditioning is
+    computed once per request and sent to every worker so all sentences
+    share the same voice. The rendered sentences are joined with short
+    equal-power crossfades.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = settings.TTS_WORKERS,
+        model_name: str = settings.TTS_MODEL,
+        device: str = settings.TTS_DEVICE,
+        crossfade_ms: float = settings.TTS_CROSSFADE_MS,
+    ):
+        """
+        Initialize synthesizer; worker processes start on first use.
+
+        Args:
+            num_workers: Worker processes (each holds one model)
+            model_name: TTS model identifier
+            device: Device for inference ('cuda' or 'cpu')
+            crossfade_ms: Crossfade between sentences (ms)
+        """
+        self.num_workers = num_workers
+        self.model_name = model_name
+        self.device = device
+        self.crossfade_ms = crossfade_ms
+
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Worker pool, started lazily (loading models takes a while)."""
+        if self._executor is None:
+            logger.info("Starting TTS worker processes", workers=self.num_workers)
+            # Split the cores between workers so they don't oversubscribe
+            num_threads = max(1, (os.cpu_count() or 1) // self.num_workers)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                # CUDA cannot be re-initialized in forked processes
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.device, num_threads),
+            )
+        return self._executor
+
+    async def synthesize(
+        self,
+        text: str,
+        language: str = "en",
+        speaker: str | None = None,
+        speaker_wav: str | Path | None = None,
+    ) -> SynthesisResult:
+        """
+        Synthesize long text with sentences rendered in parallel.
+
+        Args:
+            text: Text to synthesize
+            language: Target language code
+            speaker: Speaker ID
+            speaker_wav: Reference audio for voice cloning
+
+        Returns:
+            SynthesisResult with the joined audio
+        """
+        loop = asyncio.get_running_loop()
+        speaker_wav = str(speaker_wav) if speaker_wav is not None else None
+        sentences = split_sentences(text)
+
+        conditioning = await loop.run_in_executor(
+            self.executor, _worker_conditioning, speaker, speaker_wav
+        )
+        rendered = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor,
+                    _worker_render,
+                    sentence,
+                    language,
+                    speaker,
+                    speaker_wav,
+                    conditioning,
+                )
+                for sentence in sentences
+            )
+        )
+
+        sample_rate = rendered[0][1]
+        audio = crossfade_concat(
+            [sentence_audio for sentence_audio, _ in rendered],
+            sample_rate,
+            fade_ms=self.crossfade_ms,
+        )
+
+        logger.debug(
+            "Parallel synthesis complete",
+            sentences=len(sentences),
+            duration_sec=len(audio) / sample_rate,
+        )
+
+        return SynthesisResult(
+            audio=audio,
+            sample_rate=sample_rate,
+            text=text,
+            language=language,
+            speaker=speaker,
+            model_name=self.model_name,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -1,13 +1,15 @@
 """Text-to-Speech engine using Coqui XTTS v2."""
 
 import asyncio
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Any
 
-import numpy as np
-import torch
 from pydantic import BaseModel, Field
-from TTS.api import TTS
 
+from ..utils.artifacts import resolve_bundle
+from ..utils.audio import AudioArray, as_float32_audio, crossfade_concat
 from ..utils.config import settings
 from ..utils.logging import get_logger
 
@@ -17,16 +19,13 @@ logger = get_logger(__name__)
 class SynthesisResult(BaseModel):
     """TTS synthesis result with metadata."""
 
-    audio: list[float] = Field(description="Audio waveform as list")
+    audio: AudioArray = Field(description="Audio waveform (float32 array)")
     sample_rate: int = Field(description="Audio sample rate (Hz)")
     text: str = Field(description="Input text")
     language: str = Field(description="Target language")
     speaker: str | None = Field(default=None, description="Speaker ID/name")
     model_name: str = Field(description="TTS model used")
 
-    class Config:
-        arbitrary_types_allowed = True
-
 
 class XTTSEngine:
     """
@@ -50,11 +49,22 @@ class XTTSEngine:
         self.model_name = model_name
         self.device = device
 
+        import torch
+        from TTS.api import TTS
+
         logger.info("Loading TTS model", model=model_name, device=device)
 
         # Initialize TTS
         gpu = device == "cuda" and torch.cuda.is_available()
-        self.tts = TTS(model_name=model_name, gpu=gpu)
+        bundle = resolve_bundle("xtts", model_name)
+        if bundle is not None:
+            self.tts = TTS(
+                model_path=str(bundle),
+                config_path=str(bundle / "config.json"),
+                gpu=gpu,
+            )
+        else:
+            self.tts = TTS(model_name=model_name, gpu=gpu)
 
         if gpu:
             logger.info(
@@ -71,6 +81,17 @@ class XTTSEngine:
             22050,
         )
 
+        # XTTS exposes conditioning and inference separately, so voice
+        # latents can be computed once and reused across texts
+        tts_model = self.tts.synthesizer.tts_model
+        self.xtts_model = (
+            tts_model
+            if hasattr(tts_model, "get_conditioning_latents") and hasattr(tts_model, "inference")
+            else None
+        )
+        self._voice_cache: OrderedDict[tuple, tuple[Any, Any]] = OrderedDict()
+        self._voice_cache_lock = threading.Lock()
+
         logger.info(
             "XTTS engine ready",
             sample_rate=self.sample_rate,
@@ -83,15 +104,24 @@ class XTTSEngine:
         language: str = "en",
         speaker: str | None = None,
         speaker_wav: str | Path | None = None,
+        conditioning: tuple[Any, Any] | None = None,
     ) -> SynthesisResult:
         """
         Synthesize speech from text.
         
+        For XTTS the voice conditioning (GPT latents and speaker embedding)
+        is computed once per voice and cached, so repeated requests in a voice
+        go straight to inference. Texts over XTTS's per-call limit are
+        rendered sentence by sentence and crossfaded. Other models go through
+        ``TTS.tts``.
+        
         Args:
             text: Text to synthesize
             language: Target language code (e.g., 'en', 'es')
             speaker: Speaker ID (if multi-speaker model)
             speaker_wav: Path to reference audio for voice cloning
+            conditioning: Precomputed XTTS voice conditioning to use instead
+                (e.g. shared by several worker processes)
             
         Returns:
             SynthesisResult with audio and metadata
@@ -103,6 +133,63 @@ class XTTSEngine:
             speaker=speaker,
         )
 
+        if conditioning is None:
+            conditioning = self.voice_conditioning(speaker, speaker_wav)
+        elif self.xtts_model is not None:
+            device = next(self.xtts_model.parameters()).device
+            conditioning = tuple(tensor.to(device) for tensor in conditioning)
+        if conditioning is None:
+            return self._synthesize_with_api(text, language, speaker, speaker_wav)
+
+        import torch
+
+        gpt_cond_latent, speaker_embedding = conditioning
+        with torch.inference_mode():
+            # One inference call per sentence: XTTS truncates or fails past its
+            # per-call text limit
+            wavs = [
+                self.xtts_model.inference(
+                    sentence,
+                    language,
+                    gpt_cond_latent,
+                    speaker_embedding,
+                )["wav"]
+                for sentence in self._split_text(text, language)
+            ]
+        audio = (
+            wavs[0]
+            if len(wavs) == 1
+            else crossfade_concat(wavs, self.sample_rate, settings.TTS_CROSSFADE_MS)
+        )
+        return self._build_result(audio, text, language, speaker)
+
+    def _split_text(self, text: str, language: str) -> list[str]:
+        """
+        Split text into pieces XTTS can render in one call.
+        
+        Args:
+            text: Text to synthesize
+            language: Target language code
+            
+        Returns:
+            Sentences (the text itself if it is within the limit)
+        """
+        limit = self.xtts_model.tokenizer.char_limits.get(language, 250)
+        if len(text) <= limit:
+            return [text]
+
+        from TTS.tts.layers.xtts.tokenizer import split_sentence
+
+        return [sentence for sentence in split_sentence(text, language, limit) if sentence.strip()]
+
+    def _synthesize_with_api(
+        self,
+        text: str,
+        language: str,
+        speaker: str | None,
+        speaker_wav: str | Path | None,
+    ) -> SynthesisResult:
+        """Synthesize one text through the generic ``TTS.tts`` API."""
         # Prepare kwargs
         kwargs = {
             "text": text,
@@ -117,12 +204,18 @@ class XTTSEngine:
 
         # Synthesize
         audio = self.tts.tts(**kwargs)
+        return self._build_result(audio, text, language, speaker)
 
-        # Convert to numpy array if needed
-        if isinstance(audio, list):
-            audio_array = np.array(audio, dtype=np.float32)
-        else:
-            audio_array = audio
+    def _build_result(
+        self,
+        audio: Any,
+        text: str,
+        language: str,
+        speaker: str | None,
+    ) -> SynthesisResult:
+        """Wrap model output in a SynthesisResult."""
+        # Coqui returns a list of floats; convert once, arrays pass through
+        audio_array = as_float32_audio(audio)
 
         logger.debug(
             "Synthesis complete",
@@ -131,7 +224,7 @@ class XTTSEngine:
         )
 
         return SynthesisResult(
-            audio=audio_array.tolist(),
+            audio=audio_array,
             sample_rate=self.sample_rate,
             text=text,
             language=language,
@@ -139,6 +232,47 @@ class XTTSEngine:
             model_name=self.model_name,
         )
 
+    def voice_conditioning(
+        self,
+        speaker: str | None,
+        speaker_wav: str | Path | None,
+    ) -> tuple[Any, Any] | None:
+        """
+        Get XTTS conditioning for a voice, computing it at most once per voice.
+        
+        Args:
+            speaker: Built-in speaker name
+            speaker_wav: Path to reference audio for voice cloning
+            
+        Returns:
+            (gpt_cond_latent, speaker_embedding), or None if not available
+        """
+        if self.xtts_model is None:
+            return None
+
+        if speaker_wav is not None:
+            path = Path(speaker_wav)
+            key = (str(path), path.stat().st_mtime)
+            with self._voice_cache_lock:
+                if key in self._voice_cache:
+                    self._voice_cache.move_to_end(key)
+                    return self._voice_cache[key]
+
+            conditioning = self.xtts_model.get_conditioning_latents(audio_path=[str(path)])
+            with self._voice_cache_lock:
+                self._voice_cache[key] = conditioning
+                while len(self._voice_cache) > settings.TTS_VOICE_CACHE_SIZE:
+                    self._voice_cache.popitem(last=False)
+            return conditioning
+
+        speaker_manager = getattr(self.xtts_model, "speaker_manager", None)
+        speakers = getattr(speaker_manager, "speakers", None) or {}
+        if speaker is not None and speaker in speakers:
+            latents = speakers[speaker]
+            return latents["gpt_cond_latent"], latents["speaker_embedding"]
+
+        return None
+
     async def synthesize_async(
         self,
         text: str,
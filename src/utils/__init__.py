@@ -1,6 +1,15 @@
 """Utility modules."""
 
-from .audio import bytes_to_audio, load_audio, save_audio
+from .audio import (
+    AudioFile,
+    StreamingAudioDecoder,
+    StreamingFrontEnd,
+    StreamResampler,
+    bytes_to_audio,
+    load_audio,
+    resample_audio,
+    save_audio,
+)
 from .config import settings
 from .logging import get_logger
 
@@ -8,6 +17,11 @@ __all__ = [
     "settings",
     "get_logger",
     "load_audio",
+    "AudioFile",
     "save_audio",
     "bytes_to_audio",
+    "StreamingAudioDecoder",
+    "resample_audio",
+    "StreamResampler",
+    "StreamingFrontEnd",
 ]
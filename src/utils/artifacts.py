@@ -0,0 +1,169 @@
+"""Pre-built model bundles: ready-to-serve weights with a checksummed manifest."""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .config import settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = "bundle.json"
+
+BundleKind = Literal["whisper", "nllb", "xtts"]
+
+
+class BundleManifest(BaseModel):
+    """Description of a model bundle and checksums of its files."""
+
+    kind: str = Field(description="Engine the bundle is for (whisper, nllb, xtts)")
+    model_name: str = Field(description="Model name the bundle serves, as in settings")
+    source: str = Field(description="Where the weights were converted from")
+    format: str = Field(description="Weight format (ctranslate2, safetensors, checkpoint)")
+    quantization: str | None = Field(default=None, description="Stored precision")
+    files: dict[str, str] = Field(description="Relative path -> sha256")
+    size_bytes: int = Field(description="Total size of the bundle files")
+    created_at: str
+
+
+def bundle_path(kind: BundleKind, model_name: str) -> Path:
+    """
+    Directory of the bundle for a model.
+
+    Args:
+        kind: Engine the bundle is for
+        model_name: Model name as configured (e.g. 'large-v3', 'facebook/nllb-200-distilled-600M')
+
+    Returns:
+        settings.MODELS_DIR / 'bundles' / kind / <model name with '/' replaced>
+    """
+    return settings.MODELS_DIR / "bundles" / kind / model_name.replace("/", "--")
+
+
+def write_manifest(
+    directory: Path,
+    kind: BundleKind,
+    model_name: str,
+    source: str,
+    format: str,
+    quantization: str | None = None,
+) -> BundleManifest:
+    """
+    Checksum a finished bundle directory and write its manifest.
+
+    Args:
+        directory: Bundle directory
+        kind: Engine the bundle is for
+        model_name: Model name the bundle serves
+        source: Where the weights came from
+        format: Weight format
+        quantization: Stored precision
+
+    Returns:
+        The written BundleManifest
+    """
+    files = {
+        str(path.relative_to(directory)): _sha256(path)
+        for path in sorted(directory.rglob("*"))
+        if path.is_file() and path.name != MANIFEST_FILE
+    }
+    manifest = BundleManifest(
+        kind=kind,
+        model_name=model_name,
+        source=source,
+        format=format,
+        quantization=quantization,
+        files=files,
+        size_bytes=sum((directory / name).stat().st_size for name in files),
+        created_at=datetime.now(timezone.utc).isoformat(),
+    )
+    (directory / MANIFEST_FILE).write_text(manifest.model_dump_json(indent=2))
+    return manifest
+
+
+def load_manifest(directory: Path) -> BundleManifest:
+    """
+    Read a bundle's manifest.
+
+    Args:
+        directory: Bundle directory
+
+    Returns:
+        BundleManifest
+    """
+    return BundleManifest(**json.loads((directory / MANIFEST_FILE).read_text()))
+
+
+def verify_bundle(directory: Path) -> BundleManifest:
+    """
+    Check every file of a bundle against its manifest.
+
+    Args:
+        directory: Bundle directory
+
+    Returns:
+        The verified BundleManifest
+
+    Raises:
+        ValueError: If a file is missing or its checksum differs
+    """
+    manifest = load_manifest(directory)
+    for name, checksum in manifest.files.items():
+        path = directory / name
+        if not path.is_file():
+            raise ValueError(f"Bundle file missing: {path}")
+        if _sha256(path) != checksum:
+            raise ValueError(f"Bundle file corrupted: {path}")
+    return manifest
+
+
+def resolve_bundle(kind: BundleKind, model_name: str) -> Path | None:
+    """
+    Find the bundle to load a model from, if one was built.
+
+    Args:
+        kind: Engine asking
+        model_name: Configured model name, or a bundle directory
+
+    Returns:
+        Bundle directory, or None to load the model the usual way
+    """
+    if not settings.MODEL_BUNDLES:
+        return None
+
+    directory = Path(model_name)
+    if not (directory / MANIFEST_FILE).is_file():
+        directory = bundle_path(kind, model_name)
+        if not (directory / MANIFEST_FILE).is_file():
+            return None
+
+    if settings.MODEL_BUNDLE_VERIFY:
+        manifest = verify_bundle(directory)
+    else:
+        manifest = load_manifest(directory)
+    if manifest.kind != kind:
+        raise ValueError(f"{directory} is a {manifest.kind} bundle, not {kind}")
+
+    logger.info(
+        "Loading model from bundle",
+        kind=kind,
+        model=model_name,
+        path=str(directory),
+        format=manifest.format,
+        quantization=manifest.quantization,
+    )
+    return directory
+
+
+def _sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 8 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(8 * 1024 * 1024):
+            digest.update(block)
+    return digest.hexdigest()
@@ -1,12 +1,43 @@
 """Audio processing utilities."""
 
+import asyncio
 import io
+import struct
+import threading
+from functools import lru_cache
+from itertools import pairwise
+from math import gcd
 from pathlib import Path
+from typing import Annotated, Any, AsyncIterable, AsyncIterator, Iterator
 
-import librosa
 import numpy as np
-import soundfile as sf
-from pydub import AudioSegment
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
+
+
+def as_float32_audio(value: Any) -> np.ndarray:
+    """
+    View audio as a float32 array, copying only when a conversion is needed.
+    
+    Args:
+        value: float32 array (returned as is), raw float32 bytes (viewed
+            in place), or any array-like such as a JSON list
+        
+    Returns:
+        Audio waveform as float32 numpy array
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype=np.float32)
+    return np.asarray(value, dtype=np.float32)
+
+
+# Waveform field for pydantic models: carried as a NumPy array internally and
+# converted to a list of floats only when serialized to JSON at the API edge
+AudioArray = Annotated[
+    np.ndarray,
+    PlainValidator(as_float32_audio),
+    PlainSerializer(lambda audio: audio.tolist(), return_type=list[float], when_used="json"),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
 
 
 def load_audio(
@@ -25,6 +56,8 @@ def load_audio(
     Returns:
         Audio waveform as numpy array
     """
+    import librosa
+
     audio, sr = librosa.load(
         audio_path,
         sr=sample_rate,
@@ -48,6 +81,8 @@ def save_audio(
         sample_rate: Sample rate (Hz)
         format: Audio format (wav, mp3, ogg, etc.)
     """
+    import soundfile as sf
+
     sf.write(
         str(output_path),
         audio,
@@ -70,14 +105,18 @@ def bytes_to_audio(
     Returns:
         Audio waveform as numpy array
     """
+    import soundfile as sf
+
     # Try to load with soundfile first (most formats)
     try:
-        audio, sr = sf.read(io.BytesIO(audio_bytes))
-        if sr != sample_rate:
-            audio = librosa.resample(audio, orig_sr=sr, target_sr=sample_rate)
-        return audio
+        audio, sr = sf.read(io.BytesIO(audio_bytes), dtype="float32")
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        return resample_audio(audio, sr, sample_rate)
     except Exception:
         # Fall back to pydub for other formats (mp3, etc.)
+        from pydub import AudioSegment
+
         audio_segment = AudioSegment.from_file(io.BytesIO(audio_bytes))
         audio_segment = audio_segment.set_frame_rate(sample_rate).set_channels(1)
         audio = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
@@ -85,6 +124,103 @@ def bytes_to_audio(
         return audio
 
 
+class StreamingAudioDecoder:
+    """
+    Decodes compressed audio incrementally through a persistent ffmpeg pipe.
+
+    Encoded bytes are written to ffmpeg's stdin as they arrive and decoded
+    PCM is read from its stdout in fixed-size blocks, already mono float32
+    at the target rate. Memory use stays at a few blocks regardless of the
+    upload size, and the first block is available as soon as ffmpeg has
+    decoded it rather than after the whole payload.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        block_ms: int = 500,
+        input_format: str | None = None,
+    ):
+        """
+        Initialize decoder.
+
+        Args:
+            sample_rate: Output sample rate (Hz)
+            block_ms: Length of each yielded block (ms)
+            input_format: ffmpeg demuxer name (e.g. 'webm', 'ogg', 'mp3'), or None to probe
+        """
+        self.sample_rate = sample_rate
+        self.block_size = int(sample_rate * block_ms / 1000)
+        self.input_format = input_format
+
+    def command(self) -> list[str]:
+        """ffmpeg invocation reading from stdin and writing raw float32 to stdout."""
+        command = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin"]
+        if self.input_format:
+            command += ["-f", self.input_format]
+        command += ["-i", "pipe:0", "-f", "f32le", "-ac", "1", "-ar", str(self.sample_rate)]
+        return command + ["pipe:1"]
+
+    async def decode(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[np.ndarray]:
+        """
+        Decode an encoded byte stream.
+
+        Args:
+            chunks: Encoded audio, in any chunking
+
+        Yields:
+            float32 blocks of ``block_size`` samples (the last one may be shorter)
+
+        Raises:
+            RuntimeError: If ffmpeg cannot decode the input
+        """
+        process = await asyncio.create_subprocess_exec(
+            *self.command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Feed and read concurrently so neither pipe fills up and stalls ffmpeg
+        feeder = asyncio.create_task(self._feed(process, chunks))
+        block_bytes = self.block_size * 4
+
+        try:
+            while True:
+                try:
+                    data = await process.stdout.readexactly(block_bytes)
+                except asyncio.IncompleteReadError as e:
+                    data = e.partial[: len(e.partial) // 4 * 4]
+                    if data:
+                        yield np.frombuffer(data, dtype=np.float32)
+                    break
+                yield np.frombuffer(data, dtype=np.float32)
+
+            await feeder
+            stderr = await process.stderr.read()
+            if await process.wait() != 0:
+                raise RuntimeError(f"Audio decoding failed: {stderr.decode(errors='replace')}")
+        finally:
+            feeder.cancel()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    async def _feed(
+        self,
+        process: asyncio.subprocess.Process,
+        chunks: AsyncIterable[bytes],
+    ) -> None:
+        """Write encoded chunks to ffmpeg, then close its input."""
+        try:
+            async for chunk in chunks:
+                process.stdin.write(chunk)
+                await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # ffmpeg exited early; its exit status reports why
+            return
+        process.stdin.close()
+
+
 def audio_to_bytes(
     audio: np.ndarray,
     sample_rate: int = 16000,
@@ -101,12 +237,169 @@ def audio_to_bytes(
     Returns:
         Audio as bytes
     """
+    import soundfile as sf
+
     buffer = io.BytesIO()
     sf.write(buffer, audio, sample_rate, format=format)
     buffer.seek(0)
     return buffer.read()
 
 
+@lru_cache(maxsize=32)
+def polyphase_filter(
+    orig_sr: int,
+    target_sr: int,
+    zero_crossings: int = 16,
+) -> tuple[int, int, int, np.ndarray]:
+    """
+    Design (once per rate pair) the anti-aliasing filter for resampling.
+
+    A Kaiser-windowed sinc low-pass at the lower of the two Nyquist rates,
+    split into its ``up`` polyphase branches.
+
+    Args:
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+        zero_crossings: Sinc zero crossings on each side (filter quality)
+
+    Returns:
+        (up, down, delay, phases): reduced rate ratio, filter group delay in
+        upsampled samples, and branches of shape (up, taps), each reversed so
+        it can be dotted directly with a window of input samples
+    """
+    divisor = gcd(orig_sr, target_sr)
+    up, down = target_sr // divisor, orig_sr // divisor
+
+    half_length = zero_crossings * max(up, down)
+    cutoff = 0.95 / max(up, down)  # Normalized to the upsampled Nyquist rate
+    n = np.arange(-half_length, half_length + 1)
+    taps = up * cutoff * np.sinc(cutoff * n) * np.kaiser(len(n), 8.6)
+
+    # Pad to whole branches: branch p holds taps p, p + up, p + 2 * up, ...
+    n_taps = -(-len(taps) // up)
+    padded = np.zeros(n_taps * up)
+    padded[: len(taps)] = taps
+    phases = padded.reshape(n_taps, up).T[:, ::-1]
+
+    return up, down, half_length, np.ascontiguousarray(phases, dtype=np.float32)
+
+
+# Output samples computed per step of StreamResampler (bounds its working memory)
+RESAMPLE_BLOCK = 4096
+
+
+class StreamResampler:
+    """
+    Polyphase resampler that keeps its filter state across chunks.
+
+    Each output sample is one dot product between a window of input samples
+    and a precomputed filter branch, so only the outputs actually needed are
+    computed. The input tail a filter length long is kept between calls, so
+    chunking the input does not change the output (no clicks at chunk
+    boundaries). Output lags input by half a filter length; ``flush()``
+    returns the remainder at the end of the stream.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        """
+        Initialize resampler.
+
+        Args:
+            orig_sr: Input sample rate
+            target_sr: Output sample rate
+        """
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+        self.up, self.down, self.delay, self.phases = polyphase_filter(orig_sr, target_sr)
+        self.reset()
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of a stream.
+
+        Args:
+            audio: float32 samples in [-1, 1], or int16 PCM (scaled on the way in)
+
+        Returns:
+            Every output sample that the input so far determines (float32)
+        """
+        if self.up == self.down:
+            return _to_float32(audio)
+
+        self._consumed += len(audio)
+        self._buffer = np.concatenate([self._buffer, _to_float32(audio)])
+        return self._emit(self._consumed)
+
+    def flush(self) -> np.ndarray:
+        """
+        End the stream and return the remaining output.
+
+        Returns:
+            Last output samples; the total matches ``ceil(len(input) * target_sr / orig_sr)``
+        """
+        if self.up == self.down:
+            return np.zeros(0, dtype=np.float32)
+
+        total = -(-self._consumed * self.up // self.down)
+        # Zero-pad past the end so the last outputs' windows are complete
+        last_input = ((total - 1) * self.down + self.delay) // self.up
+        padding = max(0, last_input + 1 - self._consumed)
+        self._buffer = np.concatenate([self._buffer, np.zeros(padding, dtype=np.float32)])
+
+        output = self._emit(self._consumed + padding, limit=total)
+        self.reset()
+        return output
+
+    def reset(self) -> None:
+        """Start a new stream (input before it counts as silence)."""
+        n_taps = self.phases.shape[1]
+        self._buffer = np.zeros(n_taps - 1, dtype=np.float32)
+        self._offset = -(n_taps - 1)  # Stream index of _buffer[0]
+        self._consumed = 0  # Input samples received
+        self._next = 0  # Index of the next output sample
+
+    def _emit(self, available: int, limit: int | None = None) -> np.ndarray:
+        """Compute the outputs whose input windows end before ``available``."""
+        n_taps = self.phases.shape[1]
+
+        # Output n sits at upsampled position n * down + delay: its last input
+        # sample is that position // up and its filter branch the remainder
+        end = (available * self.up - self.delay + self.down - 1) // self.down
+        if limit is not None:
+            end = min(end, limit)
+        if end <= self._next or len(self._buffer) < n_taps:
+            return np.zeros(0, dtype=np.float32)
+
+        # Gathered in blocks, so the (outputs, taps) window matrix stays small
+        output = np.empty(end - self._next, dtype=np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(self._buffer, n_taps)
+        for start in range(0, len(output), RESAMPLE_BLOCK):
+            first = self._next + start
+            positions = np.arange(first, min(first + RESAMPLE_BLOCK, end)) * self.down
+            last_inputs, branches = np.divmod(positions + self.delay, self.up)
+            rows = last_inputs - n_taps + 1 - self._offset
+            output[start : start + len(positions)] = np.einsum(
+                "ij,ij->i", windows[rows], self.phases[branches]
+            )
+
+        self._next = end
+
+        # Keep only what the next output's window still needs
+        keep_from = (self._next * self.down + self.delay) // self.up - n_taps + 1
+        drop = max(0, keep_from - self._offset)
+        self._buffer = self._buffer[drop:]
+        self._offset += drop
+
+        return output
+
+
+def _to_float32(audio: np.ndarray) -> np.ndarray:
+    """float32 view of float32 input; int16 PCM scaled to [-1, 1]."""
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) / 32768.0
+    return audio.astype(np.float32, copy=False)
+
+
 def resample_audio(
     audio: np.ndarray,
     orig_sr: int,
@@ -116,14 +409,407 @@ def resample_audio(
     Resample audio to target sample rate.
     
     Args:
-        audio: Audio waveform
+        audio: Audio waveform (float32, or int16 PCM)
         orig_sr: Original sample rate
         target_sr: Target sample rate
         
     Returns:
-        Resampled audio
+        Resampled audio (float32)
+    """
+    if orig_sr == target_sr:
+        return _to_float32(audio)
+
+    resampler = StreamResampler(orig_sr, target_sr)
+    return np.concatenate([resampler.process(audio), resampler.flush()])
+
+
+# WAV sample encodings that can be used in place: (format tag, bits) -> dtype
+WAV_DTYPES = {
+    (1, 8): np.dtype("u1"),
+    (1, 16): np.dtype("<i2"),
+    (1, 32): np.dtype("<i4"),
+    (3, 32): np.dtype("<f4"),
+    (3, 64): np.dtype("<f8"),
+}
+
+
+class AudioFile:
+    """
+    Lazy, sliceable access to an audio file at a target sample rate.
+
+    Uncompressed WAV files are memory-mapped, so only the pages actually
+    read are loaded; other formats are decoded through libsndfile by
+    seeking to the requested range. Nothing is decoded up front: slices
+    (in target-rate samples, like an array) and ``blocks()`` read and
+    resample just the range they cover, and a slice is identical to the
+    same range of the fully resampled file.
+    """
+
+    def __init__(self, path: str | Path, sample_rate: int = 16000):
+        """
+        Open an audio file.
+
+        Args:
+            path: Audio file path
+            sample_rate: Rate at which audio is returned (Hz)
+        """
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+
+        self._data: np.ndarray | None = self._map_wav()
+        self._file: Any = None
+        self._lock = threading.Lock()  # SoundFile seek + read is not thread-safe
+        if self._data is None:
+            import soundfile as sf
+
+            self._file = sf.SoundFile(str(self.path))
+            self.native_rate = self._file.samplerate
+            self.num_frames = self._file.frames
+
+    @property
+    def memory_mapped(self) -> bool:
+        """Whether samples are read straight from a memory map."""
+        return self._data is not None
+
+    @property
+    def duration(self) -> float:
+        """Length in seconds."""
+        return self.num_frames / self.native_rate
+
+    def __len__(self) -> int:
+        """Length in samples at the target rate."""
+        return -(-self.num_frames * self.sample_rate // self.native_rate)
+
+    def __getitem__(self, index: slice) -> np.ndarray:
+        """Samples ``[start:stop]`` at the target rate (mono float32)."""
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            raise ValueError("AudioFile slices must be contiguous")
+        if start >= stop:
+            return np.zeros(0, dtype=np.float32)
+        if self.native_rate == self.sample_rate:
+            return self._read_native(start, stop)
+
+        resampler = StreamResampler(self.native_rate, self.sample_rate)
+        up, down = resampler.up, resampler.down
+
+        # Read from a multiple of `down` (so output samples line up with the
+        # whole file's) far enough back, and far enough ahead, for the filter
+        margin = resampler.phases.shape[1] + 1
+        first = max(0, (start * down // up - margin) // down * down)
+        last = min(self.num_frames, -(-stop * down // up) + margin)
+
+        audio = resampler.process(self._read_native(first, last))
+        if last == self.num_frames:
+            audio = np.concatenate([audio, resampler.flush()])
+        skip = start - first // down * up
+        return audio[skip : skip + stop - start]
+
+    def read(self, start_s: float = 0.0, end_s: float | None = None) -> np.ndarray:
+        """
+        Read a time range.
+
+        Args:
+            start_s: Range start (seconds)
+            end_s: Range end (seconds), or None for the end of the file
+
+        Returns:
+            Audio waveform at the target rate (mono float32)
+        """
+        stop = None if end_s is None else round(end_s * self.sample_rate)
+        return self[round(start_s * self.sample_rate) : stop]
+
+    def blocks(self, block_s: float = 30.0) -> Iterator[np.ndarray]:
+        """
+        Iterate over the file in consecutive blocks.
+
+        Args:
+            block_s: Block length at the target rate (seconds)
+
+        Yields:
+            Blocks of ``block_s`` (the last one may be shorter), mono float32
+        """
+        resampler = StreamResampler(self.native_rate, self.sample_rate)
+        read_frames = max(1, int(block_s * self.native_rate))
+        block_size = int(block_s * self.sample_rate)
+
+        pending = np.zeros(0, dtype=np.float32)
+        for first in range(0, self.num_frames + read_frames, read_frames):
+            if first < self.num_frames:
+                audio = resampler.process(
+                    self._read_native(first, min(first + read_frames, self.num_frames))
+                )
+            else:
+                audio = resampler.flush()
+            pending = np.concatenate([pending, audio])
+            while len(pending) >= block_size:
+                yield pending[:block_size]
+                pending = pending[block_size:]
+        if len(pending):
+            yield pending
+
+    def close(self) -> None:
+        """Release the file."""
+        if self._file is not None:
+            self._file.close()
+        self._data = None
+
+    def _read_native(self, first: int, last: int) -> np.ndarray:
+        """Frames [first, last) at the native rate, mono float32."""
+        if self._data is not None:
+            frames = self._data[first:last]
+            if frames.dtype == np.uint8:
+                frames = frames.astype(np.float32) / 128.0 - 1.0
+            elif frames.dtype.kind == "i":
+                frames = frames.astype(np.float32) / float(2 ** (frames.dtype.itemsize * 8 - 1))
+        else:
+            with self._lock:
+                self._file.seek(first)
+                frames = self._file.read(last - first, dtype="float32", always_2d=True)
+
+        audio = frames.mean(axis=1) if frames.shape[1] > 1 else frames[:, 0]
+        return audio.astype(np.float32, copy=False)
+
+    def _map_wav(self) -> np.ndarray | None:
+        """Memory-map the samples of a PCM/float WAV file (frames x channels), if possible."""
+        with open(self.path, "rb") as f:
+            if f.read(4) != b"RIFF" or f.read(8)[4:] != b"WAVE":
+                return None
+
+            fmt = None
+            while header := f.read(8):
+                if len(header) < 8:
+                    return None
+                chunk_id, size = struct.unpack("<4sI", header)
+                if chunk_id == b"fmt ":
+                    fmt = f.read(size)
+                    f.seek(size % 2, 1)
+                elif chunk_id == b"data":
+                    offset = f.tell()
+                    break
+                else:
+                    f.seek(size + size % 2, 1)
+            else:
+                return None
+
+        if fmt is None:
+            return None
+        tag, channels, native_rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[:16])
+        if tag == 0xFFFE and len(fmt) >= 26:
+            tag = struct.unpack("<H", fmt[24:26])[0]  # WAVE_FORMAT_EXTENSIBLE subformat
+        dtype = WAV_DTYPES.get((tag, bits))
+        if dtype is None or block_align != channels * dtype.itemsize:
+            return None
+
+        # Streamed WAVs may leave the data size unset; use what the file holds
+        size = min(size, self.path.stat().st_size - offset)
+        self.native_rate = native_rate
+        self.num_frames = size // block_align
+        return np.memmap(
+            self.path,
+            dtype=dtype,
+            mode="r",
+            offset=offset,
+            shape=(self.num_frames, channels),
+        )
+
+
+# Raw PCM encodings accepted from streaming clients
+PCM_FORMATS = {"f32le": np.dtype("<f4"), "s16le": np.dtype("<i2")}
+
+
+class StreamingFrontEnd:
+    """
+    Per-session preprocessing of streamed audio before ASR.
+
+    One pass per chunk: raw bytes are viewed as samples (float32 or int16;
+    a sample split across chunks is completed by the next one), resampled
+    with a persistent polyphase filter, high-passed (which also removes DC),
+    levelled by a gated running-RMS gain control and cut to whole frames.
+    Every stage keeps its state between chunks, so the output does not
+    depend on how the stream was chunked; each chunk produces one output
+    array that the filter and gain stages work on in place.
+
+    The gain control only learns from frames well above a tracked noise
+    floor, so steady background noise is never boosted, and its largest
+    boost ramps in over the first ``agc_time_s`` of speech.
     """
-    return librosa.resample(audio, orig_sr=orig_sr, target_sr=target_sr)
+
+    def __init__(
+        self,
+        input_rate: int = 16000,
+        input_format: str = "f32le",
+        sample_rate: int = 16000,
+        highpass_hz: float = 80.0,
+        agc_target_db: float | None = -20.0,
+        agc_max_gain_db: float = 20.0,
+        agc_gate_db: float = -50.0,
+        agc_gate_snr_db: float = 10.0,
+        agc_noise_rise_db: float = 2.0,
+        agc_time_s: float = 1.0,
+        frame_ms: int = 10,
+    ):
+        """
+        Initialize front-end.
+
+        Args:
+            input_rate: Sample rate of the incoming stream (Hz)
+            input_format: Raw PCM encoding of byte chunks ('f32le' or 's16le')
+            sample_rate: Output sample rate (Hz)
+            highpass_hz: High-pass cutoff (Hz); 0 disables the filter
+            agc_target_db: Speech level the gain control aims for (dBFS); None disables it
+            agc_max_gain_db: Largest boost applied (dB); cuts are unlimited
+            agc_gate_db: Frames below this level (dBFS) don't update the running level
+            agc_gate_snr_db: Nor do frames less than this far above the noise floor (dB)
+            agc_noise_rise_db: Fastest rise of the tracked noise floor (dB per second)
+            agc_time_s: Time constant of the running level, and the speech heard
+                before the full boost is allowed (seconds)
+            frame_ms: Output is emitted in whole frames of this length (ms)
+        """
+        if input_format not in PCM_FORMATS:
+            raise ValueError(f"Unsupported PCM format: {input_format}")
+
+        self.input_dtype = PCM_FORMATS[input_format]
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.resampler = (
+            StreamResampler(input_rate, sample_rate) if input_rate != sample_rate else None
+        )
+
+        # 2nd-order Butterworth high-pass (bilinear transform)
+        self.highpass: tuple[np.ndarray, np.ndarray] | None = None
+        if highpass_hz > 0:
+            w = np.tan(np.pi * highpass_hz / sample_rate)
+            norm = 1 + np.sqrt(2) * w + w * w
+            self.highpass = (
+                np.array([1.0, -2.0, 1.0]) / norm,
+                np.array([1.0, 2 * (w * w - 1) / norm, (1 - np.sqrt(2) * w + w * w) / norm]),
+            )
+
+        self.agc_target_power = None if agc_target_db is None else 10 ** (agc_target_db / 10)
+        self.agc_max_gain = 10 ** (agc_max_gain_db / 20)
+        self.agc_gate_db = agc_gate_db
+        self.agc_gate_power = 10 ** (agc_gate_db / 10)
+        self.agc_gate_snr_db = agc_gate_snr_db
+        self.agc_noise_rise = agc_noise_rise_db * frame_ms / 1000  # dB per frame
+        self.agc_decay = np.exp(-frame_ms / 1000 / agc_time_s)
+        self.agc_settle_frames = agc_time_s * 1000 / frame_ms
+
+        self.reset()
+
+    def process(self, chunk: bytes | np.ndarray) -> np.ndarray:
+        """
+        Preprocess the next chunk of the stream.
+
+        Args:
+            chunk: Raw PCM bytes in ``input_format``, or a sample array
+
+        Returns:
+            Processed audio at ``sample_rate`` (float32), a whole number of frames long
+        """
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            # Network frames need not end on a sample boundary: the split sample's
+            # bytes wait for the next chunk
+            if self._partial:
+                chunk = self._partial + bytes(chunk)
+            usable = len(chunk) - len(chunk) % self.input_dtype.itemsize
+            self._partial = bytes(chunk[usable:])
+            chunk = np.frombuffer(chunk[:usable], dtype=self.input_dtype)
+        audio = _to_float32(chunk)
+        if self.resampler is not None:
+            audio = self.resampler.process(audio)
+        return self._frames(audio)
+
+    def flush(self) -> np.ndarray:
+        """
+        End the stream and return what is still buffered.
+
+        Returns:
+            Remaining processed audio (the last frame may be partial)
+        """
+        audio = self.resampler.flush() if self.resampler is not None else self._tail[:0]
+        output = self._frames(audio, final=True)
+        self.reset()
+        return output
+
+    def reset(self) -> None:
+        """Start a new stream."""
+        if self.resampler is not None:
+            self.resampler.reset()
+        self._highpass_state = np.zeros(2)
+        self._level = self.agc_target_power or 1.0  # Running speech power; starts at unity gain
+        self._gain = 1.0
+        self._noise_db = self.agc_gate_db  # Tracked noise floor
+        self._voiced_frames = 0  # Frames that have updated the running level
+        self._tail = np.zeros(0, dtype=np.float32)  # Samples short of a whole frame
+        self._partial = b""  # Bytes short of a whole input sample
+
+    def _frames(self, audio: np.ndarray, final: bool = False) -> np.ndarray:
+        """Filter and level ``audio`` after the buffered tail; keep the new partial frame."""
+        if self.highpass is not None and len(audio):
+            from scipy.signal import lfilter
+
+            audio, self._highpass_state = lfilter(
+                *self.highpass, audio, zi=self._highpass_state
+            )
+
+        # The one copy per chunk: tail and new samples into the output array
+        output = np.empty(len(self._tail) + len(audio), dtype=np.float32)
+        output[: len(self._tail)] = self._tail
+        output[len(self._tail) :] = audio
+
+        n_frames = len(output) // self.frame_length
+        end = len(output) if final else n_frames * self.frame_length
+        self._tail = output[end:].copy()
+        output = output[:end]
+
+        if self.agc_target_power is not None and n_frames:
+            gains = self._frame_gains(output[: n_frames * self.frame_length])
+            framed = output[: n_frames * self.frame_length].reshape(n_frames, self.frame_length)
+            framed *= gains[:, None]
+            output[n_frames * self.frame_length :] *= self._gain
+        elif self.agc_target_power is not None:
+            output *= self._gain
+
+        return output
+
+    def _frame_gains(self, audio: np.ndarray) -> np.ndarray:
+        """Gain per frame from the gated running speech level."""
+        frames = audio.reshape(-1, self.frame_length)
+        power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / self.frame_length
+        power_db = 10.0 * np.log10(power + 1e-12)
+
+        # Noise floor: noise[t] = min(power[t], noise[t-1] + rise), i.e. it follows quiet
+        # frames down at once and rises slowly; unrolled, a running minimum
+        steps = np.arange(len(power_db)) * self.agc_noise_rise
+        noise_db = steps + np.minimum(
+            self._noise_db + self.agc_noise_rise,
+            np.minimum.accumulate(power_db - steps),
+        )
+        self._noise_db = float(noise_db[-1])
+        voiced = (power > self.agc_gate_power) & (power_db > noise_db + self.agc_gate_snr_db)
+
+        # level[t] = decay * level[t-1] + (1 - decay) * power[t] on voiced frames, held
+        # otherwise: a linear recurrence with per-frame coefficients, solved with
+        # cumulative products (evaluated in blocks so the products stay representable)
+        coeffs = np.where(voiced, self.agc_decay, 1.0)
+        inputs = np.where(voiced, (1 - self.agc_decay) * power, 0.0)
+        levels = np.empty(len(power))
+        for block in range(0, len(power), 512):
+            products = np.cumprod(coeffs[block : block + 512])
+            levels[block : block + 512] = products * (
+                self._level + np.cumsum(inputs[block : block + 512] / products)
+            )
+            self._level = levels[block : block + 512][-1]
+
+        # Boosts are capped harder until the running level has heard enough speech
+        voiced_frames = self._voiced_frames + np.cumsum(voiced)
+        self._voiced_frames = int(voiced_frames[-1])
+        max_gains = self.agc_max_gain ** np.minimum(voiced_frames / self.agc_settle_frames, 1.0)
+
+        gains = np.minimum(np.sqrt(self.agc_target_power / levels), max_gains)
+        self._gain = gains[-1]
+        return gains.astype(np.float32)
 
 
 def normalize_audio(audio: np.ndarray) -> np.ndarray:
@@ -142,6 +828,148 @@ def normalize_audio(audio: np.ndarray) -> np.ndarray:
     return audio
 
 
+def crossfade_concat(
+    segments: list[np.ndarray],
+    sample_rate: int,
+    fade_ms: float = 20.0,
+) -> np.ndarray:
+    """
+    Join segments with short equal-power crossfades.
+
+    Args:
+        segments: Audio waveforms, in order
+        sample_rate: Sample rate (Hz)
+        fade_ms: Crossfade length (ms); shortened for very short segments
+
+    Returns:
+        Joined audio (float32), written once into a preallocated buffer
+    """
+    segments = [as_float32_audio(segment) for segment in segments if len(segment)]
+    if not segments:
+        return np.zeros(0, dtype=np.float32)
+
+    fades = [
+        min(int(sample_rate * fade_ms / 1000), len(previous), len(current))
+        for previous, current in pairwise(segments)
+    ]
+    output = np.zeros(sum(len(segment) for segment in segments) - sum(fades), dtype=np.float32)
+
+    position = 0
+    for i, segment in enumerate(segments):
+        fade_in = fades[i - 1] if i > 0 else 0
+        if fade_in:
+            # Previous segment's tail is already in place; fade it out as this one fades in
+            ramp = np.linspace(0.0, 1.0, fade_in, dtype=np.float32)
+            region = output[position - fade_in : position]
+            region *= np.cos(ramp * np.pi / 2)
+            region += segment[:fade_in] * np.sin(ramp * np.pi / 2)
+        output[position : position + len(segment) - fade_in] = segment[fade_in:]
+        position += len(segment) - fade_in
+
+    return output
+
+
+def frame_levels_db(audio: np.ndarray, frame_length: int) -> np.ndarray:
+    """
+    RMS level of each complete non-overlapping frame, in dBFS.
+
+    Args:
+        audio: Audio waveform (float, [-1, 1])
+        frame_length: Samples per frame
+
+    Returns:
+        One level per complete frame (a trailing partial frame is ignored)
+    """
+    n_frames = len(audio) // frame_length
+    frames = audio[: n_frames * frame_length].reshape(n_frames, frame_length)
+    power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_length
+    return 10.0 * np.log10(power + 1e-12)
+
+
+def silence_ranges(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    min_silence_len: int = 500,
+    silence_thresh: float = -40.0,
+    frame_ms: int = 10,
+) -> np.ndarray:
+    """
+    Find silent stretches in one vectorized pass.
+
+    Audio is viewed as non-overlapping frames (no copy); a frame is silent
+    if its RMS level is below ``silence_thresh`` dBFS.
+
+    Args:
+        audio: Audio waveform (float, [-1, 1])
+        sample_rate: Sample rate (Hz)
+        min_silence_len: Minimum silence length (ms)
+        silence_thresh: Silence threshold (dB)
+        frame_ms: Analysis frame length (ms)
+
+    Returns:
+        Array of shape (n, 2) with [start, end) sample indices of each silence
+    """
+    frame_length = int(sample_rate * frame_ms / 1000)
+    silent = frame_levels_db(audio, frame_length) < silence_thresh
+
+    # Run boundaries: +1 where silence starts, -1 where it ends
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    keep = (ends - starts) * frame_ms >= min_silence_len
+    ranges = np.stack([starts[keep], ends[keep]], axis=1) * frame_length
+
+    # A silence reaching the last complete frame also covers the partial one after it
+    if len(ranges) and ranges[-1, 1] == len(silent) * frame_length:
+        ranges[-1, 1] = len(audio)
+    return ranges
+
+
+def speech_ranges(
+    audio: np.ndarray,
+    sample_rate: int = 16000,
+    min_silence_len: int = 500,
+    silence_thresh: float = -40.0,
+    keep_silence: int = 200,
+    frame_ms: int = 10,
+) -> np.ndarray:
+    """
+    Find the segments between silences, padded with some of the silence.
+
+    Args:
+        audio: Audio waveform (float, [-1, 1])
+        sample_rate: Sample rate (Hz)
+        min_silence_len: Minimum silence length (ms)
+        silence_thresh: Silence threshold (dB)
+        keep_silence: Silence kept on each side of a segment (ms); where two
+            segments' padding would overlap they meet in the middle
+        frame_ms: Analysis frame length (ms)
+
+    Returns:
+        Array of shape (n, 2) with [start, end) sample indices of each segment
+    """
+    silences = silence_ranges(audio, sample_rate, min_silence_len, silence_thresh, frame_ms)
+
+    # Segments are the gaps between silences, including before the first and after the last
+    bounds = np.concatenate(([0], silences.ravel(), [len(audio)])).reshape(-1, 2)
+    bounds = bounds[bounds[:, 1] > bounds[:, 0]]
+    if len(bounds) == 0:
+        return bounds
+
+    keep = int(sample_rate * keep_silence / 1000)
+    starts = np.maximum(bounds[:, 0] - keep, 0)
+    ends = np.minimum(bounds[:, 1] + keep, len(audio))
+
+    # Padding overlapping the neighbour's: split the silence between them
+    midpoints = (bounds[1:, 0] + bounds[:-1, 1]) // 2
+    overlap = ends[:-1] > starts[1:]
+    ends[:-1][overlap] = midpoints[overlap]
+    starts[1:][overlap] = midpoints[overlap]
+
+    return np.stack([starts, ends], axis=1)
+
+
 def split_on_silence(
     audio: np.ndarray,
     sample_rate: int = 16000,
@@ -160,32 +988,144 @@ def split_on_silence(
         keep_silence: Amount of silence to keep (ms)
         
     Returns:
-        List of audio segments
-    """
-    # Convert to AudioSegment
-    audio_int16 = (audio * 32767).astype(np.int16)
-    audio_segment = AudioSegment(
-        audio_int16.tobytes(),
-        frame_rate=sample_rate,
-        sample_width=2,
-        channels=1,
-    )
-    
-    # Split on silence
-    from pydub.silence import split_on_silence as pydub_split
-    
-    chunks = pydub_split(
-        audio_segment,
-        min_silence_len=min_silence_len,
-        silence_thresh=silence_thresh,
-        keep_silence=keep_silence,
-    )
-    
-    # Convert back to numpy arrays
-    result = []
-    for chunk in chunks:
-        samples = np.array(chunk.get_array_of_samples(), dtype=np.float32)
-        samples = samples / 32767.0
-        result.append(samples)
-    
-    return result
+        List of audio segments (views into ``audio``, not copies)
+    """
+    ranges = speech_ranges(audio, sample_rate, min_silence_len, silence_thresh, keep_silence)
+    return [audio[start:end] for start, end in ranges]
+
+
+class StreamingSilenceSplitter:
+    """
+    Splits a live stream on silence as the audio arrives.
+
+    Frame levels are computed once per frame as chunks come in, and a
+    segment is returned as soon as ``min_silence_len`` of silence follows
+    it, so memory holds only the current segment. Segments match
+    ``split_on_silence`` on the same audio as long as ``keep_silence`` is at
+    most half of ``min_silence_len``; beyond that the end padding is capped
+    there, since a returned segment cannot be shortened afterwards.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        min_silence_len: int = 500,
+        silence_thresh: float = -40.0,
+        keep_silence: int = 200,
+        frame_ms: int = 10,
+    ):
+        """
+        Initialize splitter.
+
+        Args:
+            sample_rate: Sample rate (Hz)
+            min_silence_len: Minimum silence length (ms)
+            silence_thresh: Silence threshold (dB)
+            keep_silence: Amount of silence to keep (ms)
+            frame_ms: Analysis frame length (ms)
+        """
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.min_silence_frames = max(1, -(-min_silence_len // frame_ms))
+        self.silence_thresh = silence_thresh
+        self.keep_start = int(sample_rate * keep_silence / 1000)
+        self.keep_end = min(self.keep_start, int(sample_rate * min_silence_len / 2000))
+        self.reset()
+
+    def process(self, audio: np.ndarray) -> list[np.ndarray]:
+        """
+        Add audio and return the segments it completes.
+
+        Args:
+            audio: Next chunk of the stream
+
+        Returns:
+            Segments now followed by enough silence, in order
+        """
+        self._buffer = np.concatenate([self._buffer, audio])
+
+        # Analyse only the complete frames not seen yet
+        first = self._frames_done * self.frame_length - self._offset
+        levels = frame_levels_db(self._buffer[first:], self.frame_length)
+        speech = np.flatnonzero(levels >= self.silence_thresh) + self._frames_done
+        self._frames_done += len(levels)
+
+        ranges = []
+        if len(speech):
+            # Segment breaks: speech resuming after at least min_silence_frames of silence
+            previous = np.concatenate(([self._speech_end - 1], speech[:-1]))
+            breaks = speech - previous - 1 >= self.min_silence_frames
+            if self._speech_start is None:
+                breaks[0] = True
+            for index in np.flatnonzero(breaks):
+                if self._speech_start is not None:
+                    ranges.append(self._close(previous[index] + 1))
+                self._speech_start = speech[index]
+            self._speech_end = speech[-1] + 1
+
+        if (
+            self._speech_start is not None
+            and self._frames_done - self._speech_end >= self.min_silence_frames
+        ):
+            ranges.append(self._close(self._speech_end))
+
+        segments = [
+            self._buffer[start - self._offset : end - self._offset] for start, end in ranges
+        ]
+        self._trim()
+        return segments
+
+    def flush(self) -> list[np.ndarray]:
+        """
+        End the stream and return the segment still open, if any.
+
+        Returns:
+            The last segment, or an empty list
+        """
+        segments = []
+        if self._speech_start is not None:
+            start, _ = self._close(self._speech_end)
+            segments.append(self._buffer[start - self._offset :])
+        elif self._previous_end == 0 and self._frames_done < self.min_silence_frames:
+            # Stream too short to hold a silence: all of it is one segment
+            if len(self._buffer):
+                segments.append(self._buffer)
+        self.reset()
+        return segments
+
+    def reset(self) -> None:
+        """Start a new stream."""
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._offset = 0  # Stream index of _buffer[0]
+        self._frames_done = 0  # Frames analysed
+        self._speech_start: int | None = None  # First speech frame of the open segment
+        self._speech_end = 0  # Frame after the last speech frame seen
+        self._previous_end = 0  # Stream index where the last returned segment ended
+
+    def _close(self, speech_end: int) -> tuple[int, int]:
+        """Close the open segment; returns its padded [start, end) stream indices."""
+        if self._previous_end == 0 and self._speech_start < self.min_silence_frames:
+            # Leading silence too short to split on belongs to the first segment
+            start = 0
+        else:
+            start = max(
+                self._speech_start * self.frame_length - self.keep_start, self._previous_end
+            )
+        end = min(
+            speech_end * self.frame_length + self.keep_end,
+            self._offset + len(self._buffer),
+        )
+        self._speech_start = None
+        self._previous_end = end
+        return start, end
+
+    def _trim(self) -> None:
+        """Drop samples no future segment can include."""
+        first_speech = self._frames_done if self._speech_start is None else self._speech_start
+        if self._previous_end == 0 and first_speech < self.min_silence_frames:
+            # The first segment may still start at 0
+            keep_from = 0
+        else:
+            keep_from = first_speech * self.frame_length - self.keep_start
+        drop = max(0, min(max(keep_from, self._previous_end) - self._offset, len(self._buffer)))
+        self._buffer = self._buffer[drop:]
+        self._offset += drop
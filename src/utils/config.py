@@ -25,24 +25,97 @@ class Settings(BaseSettings):
     CORS_ORIGINS: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
 
     # Model Configuration - Whisper (ASR)
+    # "auto" in any of these runs startup calibration (src/asr/calibration.py)
     WHISPER_MODEL: str = "large-v3"
     WHISPER_DEVICE: str = "cuda"
-    WHISPER_COMPUTE_TYPE: Literal["float16", "int8", "int8_float16"] = "float16"
+    WHISPER_COMPUTE_TYPE: Literal[
+        "float16", "int8", "int8_float16", "int8_float32", "float32", "auto"
+    ] = "float16"
+    ASR_CALIBRATION_MODELS: list[str] = Field(
+        default_factory=lambda: ["large-v3", "medium", "small", "base"]
+    )  # Largest first; the largest meeting the target wins
+    ASR_CALIBRATION_RTF: float = 0.5  # Required processing time / audio duration
+    ASR_CALIBRATION_CLIP: Path | None = None  # Reference speech; synthetic workload if unset
+
+    # ASR replicas (least-loaded dispatch across model instances)
+    ASR_POOL_SIZE: int = 1
+    ASR_CPU_THREADS: int = 0  # Threads per CTranslate2 worker (0 = library default)
+    ASR_NUM_WORKERS: int = 1  # Concurrent transcriptions per replica
+
+    # Long-form audio (silence-aligned chunks decoded in parallel)
+    ASR_LONGFORM_MIN_S: float = 60.0  # Inputs at least this long are chunked
+    ASR_LONGFORM_CHUNK_S: float = 30.0  # One Whisper window
+    ASR_LONGFORM_OVERLAP_S: float = 1.0  # Overlap where no silence allows a clean cut
+
+    # Voice activity pre-gate (drops non-speech before any ASR dispatch)
+    ASR_VAD_GATE: bool = True
+    ASR_VAD_THRESHOLD: float = 0.5  # Frame speech probability counted as speech
+    ASR_VAD_ENERGY_DB: float = -45.0  # Frame level (dBFS) at probability 0.5
+    ASR_VAD_MIN_SPEECH_MS: int = 250  # Speech needed before a clip reaches the model
+
+    # Streaming front-end (per-session preprocessing before ASR)
+    STREAM_HIGHPASS_HZ: float = 80.0  # Removes DC and rumble; 0 disables
+    STREAM_AGC: bool = True  # Running-RMS gain control on speech frames
+    STREAM_AGC_TARGET_DB: float = -20.0  # Speech level aimed for (dBFS)
+    STREAM_AGC_MAX_GAIN_DB: float = 20.0  # Largest boost for quiet talkers
+    STREAM_AGC_GATE_SNR_DB: float = 10.0  # Frames this far above the noise floor set the gain
+
+    # Language identification
+    LANGUAGE_ID_EXCERPT_S: float = 10.0  # Audio used per detection
+    LANGUAGE_ID_THRESHOLD: float = 0.8  # Probability at which a session's language is locked
+    LANGUAGE_ID_DRIFT_CONFIDENCE: float = 0.4  # ASR confidence that counts as drift
+    LANGUAGE_ID_DRIFT_PATIENCE: int = 3  # Consecutive low-confidence decodes before re-detecting
 
     # Model Configuration - Translation (NMT)
     NMT_MODEL: str = "facebook/nllb-200-distilled-600M"
     NMT_DEVICE: str = "cuda"
     NMT_MAX_LENGTH: int = 512
+    NMT_OPTIMIZE: bool = False  # Dynamic INT8 quantization + benchmark (CPU only)
+    NMT_NUM_THREADS: int = 0  # 0 keeps the torch default
+    NMT_COMPILE: bool = False  # Wrap forward in torch.compile when optimizing
+    NMT_ATTN_IMPLEMENTATION: str | None = None  # e.g. "sdpa", "eager"
+    NMT_MIN_SPEEDUP: float = 1.1  # Keep optimized model only if this much faster
 
     # Model Configuration - TTS
     TTS_MODEL: str = "tts_models/multilingual/multi-dataset/xtts_v2"
     TTS_DEVICE: str = "cuda"
+    TTS_VOICE_CACHE_SIZE: int = 32  # Cloned voices whose conditioning is kept
+    TTS_WORKERS: int = 0  # Processes for sentence-parallel long texts (each loads a model)
+    TTS_PARALLEL_MIN_CHARS: int = 400  # Texts at least this long are split into sentences
+    TTS_CROSSFADE_MS: float = 20.0  # Crossfade between sentences rendered separately
+
+    # Decoding profiles (greedy, small_beam, full_beam, adaptive)
+    DECODING_PROFILE: Literal["greedy", "small_beam", "full_beam", "adaptive"] = "full_beam"
+    STREAMING_DECODING_PROFILE: Literal["greedy", "small_beam", "full_beam", "adaptive"] = (
+        "small_beam"
+    )
+    STREAMING_NMT_MAX_SOURCE_CHARS: int = 300  # Close an unpunctuated streaming segment here
+    DECODING_SMALL_BEAM_SIZE: int = 3
+    DECODING_FULL_BEAM_SIZE: int = 5
+    ADAPTIVE_QUEUE_LOW: int = 2  # Pending requests before dropping to the small beam
+    ADAPTIVE_QUEUE_HIGH: int = 8  # Pending requests before dropping to greedy
+    ADAPTIVE_LONG_AUDIO_S: float = 20.0
+    ADAPTIVE_LONG_TEXT_TOKENS: int = 128
+
+    # Pipeline routing
+    PIPELINE_WHISPER_TRANSLATE: bool = True  # Use Whisper's translate task for X→English
 
     # Paths
     MODELS_DIR: Path = Field(default_factory=lambda: Path("./models"))
     CACHE_DIR: Path = Field(default_factory=lambda: Path("./cache"))
     DATA_DIR: Path = Field(default_factory=lambda: Path("./data"))
 
+    # Model bundles (scripts/build_model_bundles.py), used when present
+    MODEL_BUNDLES: bool = True  # Load from MODELS_DIR/bundles instead of hub caches
+    MODEL_BUNDLE_VERIFY: bool = False  # Checksum every bundle file at load (reads them fully)
+
+    # Model residency (src/orchestration/models.py)
+    MODEL_MEMORY_BUDGET_GB: float = 0.0  # Memory all loaded models may take (0 = unlimited)
+    MODEL_IDLE_TIMEOUT_S: float = 0.0  # Unload models unused this long (0 = never)
+    WHISPER_MODEL_VARIANTS: list[str] = Field(default_factory=list)  # Extra selectable models
+    NMT_MODEL_VARIANTS: list[str] = Field(default_factory=list)
+    TTS_MODEL_VARIANTS: list[str] = Field(default_factory=list)
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -68,11 +141,13 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_SESSIONS: int = 100
     AUDIO_CHUNK_SIZE: int = 1024
     STREAM_BUFFER_SIZE: int = 4096
+    AUDIO_DECODE_BLOCK_MS: int = 500  # PCM block size when decoding compressed streams
 
     # Security
     SECRET_KEY: str = "change-me-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ADMIN_TOKEN: str = ""  # X-Admin-Token required by /admin endpoints (empty = disabled)
 
     # Feature Flags
     ENABLE_GPU: bool = True
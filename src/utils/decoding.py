@@ -0,0 +1,93 @@
+"""Decoding profiles shared by the ASR and NMT engines."""
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from .config import settings
+
+
+class DecodingProfile(str, Enum):
+    """Beam search presets selectable per request or per session."""
+
+    GREEDY = "greedy"
+    SMALL_BEAM = "small_beam"
+    FULL_BEAM = "full_beam"
+    ADAPTIVE = "adaptive"
+
+
+class DecodingConfig(BaseModel):
+    """Concrete decoding parameters resolved from a profile."""
+
+    profile: DecodingProfile = Field(description="Requested profile")
+    resolved: DecodingProfile = Field(description="Profile actually used")
+    beam_size: int = Field(ge=1, description="Beam width (1 = greedy)")
+
+    @property
+    def best_of(self) -> int:
+        """Candidates when sampling at temperature > 0."""
+        return self.beam_size
+
+    def as_metadata(self) -> dict[str, Any]:
+        """Decoding info for result metadata."""
+        return {
+            "decoding_profile": self.profile.value,
+            "decoding": self.resolved.value,
+            "beam_size": self.beam_size,
+        }
+
+
+def beam_size_for(profile: DecodingProfile) -> int:
+    """
+    Beam width of a fixed profile.
+
+    Args:
+        profile: Greedy, small beam or full beam
+
+    Returns:
+        Beam width
+    """
+    return {
+        DecodingProfile.GREEDY: 1,
+        DecodingProfile.SMALL_BEAM: settings.DECODING_SMALL_BEAM_SIZE,
+        DecodingProfile.FULL_BEAM: settings.DECODING_FULL_BEAM_SIZE,
+    }[profile]
+
+
+def resolve_decoding(
+    profile: DecodingProfile | str | None = None,
+    queue_depth: int = 0,
+    long_input: bool = False,
+) -> DecodingConfig:
+    """
+    Resolve a decoding profile to concrete parameters.
+
+    The adaptive profile trades quality for throughput under load: greedy
+    when the engine queue is deep, a small beam when it is moderately busy or
+    the input is long, and the full beam otherwise.
+
+    Args:
+        profile: Requested profile (uses settings.DECODING_PROFILE if None)
+        queue_depth: Requests currently waiting on or running in the engine
+        long_input: Whether the input exceeds the engine's long-input threshold
+
+    Returns:
+        DecodingConfig
+    """
+    profile = DecodingProfile(profile or settings.DECODING_PROFILE)
+    resolved = profile
+
+    if profile == DecodingProfile.ADAPTIVE:
+        if queue_depth >= settings.ADAPTIVE_QUEUE_HIGH:
+            resolved = DecodingProfile.GREEDY
+        elif queue_depth >= settings.ADAPTIVE_QUEUE_LOW or long_input:
+            resolved = DecodingProfile.SMALL_BEAM
+        else:
+            resolved = DecodingProfile.FULL_BEAM
+
+    return DecodingConfig(
+        profile=profile,
+        resolved=resolved,
+        beam_size=beam_size_for(resolved),
+    )
@@ -0,0 +1,21 @@
+"""Tests for audio utilities."""
+
+import numpy as np
+import pytest
+
+from src.utils.audio import StreamResampler, resample_audio
+
+
+@pytest.mark.parametrize(
+    "orig_sr, target_sr",
+    [(48000, 16000), (44100, 16000), (16000, 24000), (22050, 16000)],
+)
+def test_stream_resampler_single_sample_chunks(orig_sr: int, target_sr: int) -> None:
+    audio = np.random.default_rng(0).uniform(-0.5, 0.5, orig_sr // 10).astype(np.float32)
+
+    resampler = StreamResampler(orig_sr, target_sr)
+    chunks = [resampler.process(audio[i : i + 1]) for i in range(len(audio))]
+    streamed = np.concatenate([*chunks, resampler.flush()])
+
+    np.testing.assert_allclose(streamed, resample_audio(audio, orig_sr, target_sr), atol=1e-6)
+    assert all(chunk.dtype == np.float32 for chunk in chunks)